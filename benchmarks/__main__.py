@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from launcher.paths import LauncherPaths
+from launcher.profiles import DEFAULT_PROFILE_ID, ProfileStore
+
+from .fixtures import FixtureSize, build_fixture
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline.json"
+DEFAULT_OUTPUT = PROJECT_ROOT / "build" / "benchmarks.json"
+RESULTS_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+NOISE_FLOOR_MS = 0.5
+VIRTUAL_DISPLAY = ":97"
+SKIN_YAWS = tuple(range(0, 360, 15))
+
+
+@dataclass
+class CaseResult:
+    name: str
+    runs_ms: list[float] = field(default_factory=list)
+    skipped: str = ""
+    details: dict = field(default_factory=dict)
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.runs_ms) if self.runs_ms else 0.0
+
+    def to_dict(self) -> dict:
+        if self.skipped:
+            return {"skipped": self.skipped}
+        return {
+            "median_ms": round(self.median_ms, 4),
+            "min_ms": round(min(self.runs_ms), 4),
+            "max_ms": round(max(self.runs_ms), 4),
+            "runs": len(self.runs_ms),
+            **self.details,
+        }
+
+
+def measure(
+    name: str,
+    action: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], object] | None = None,
+    teardown: Callable[[], object] | None = None,
+) -> CaseResult:
+    result = CaseResult(name)
+    for _run in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        action()
+        result.runs_ms.append((time.perf_counter() - started) * 1000)
+        if teardown is not None:
+            teardown()
+    return result
+
+
+@contextlib.contextmanager
+def virtual_display() -> Iterator[str]:
+    if not sys.platform.startswith("linux") or os.environ.get("DISPLAY"):
+        yield ""
+        return
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        yield "no DISPLAY and Xvfb is not installed"
+        return
+    process = subprocess.Popen([xvfb, VIRTUAL_DISPLAY, "-screen", "0", "1280x800x24", "-nolisten", "tcp"])
+    os.environ["DISPLAY"] = VIRTUAL_DISPLAY
+    time.sleep(0.5)
+    try:
+        yield ""
+    finally:
+        os.environ.pop("DISPLAY", None)
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def store_cases(paths: LauncherPaths, size: FixtureSize, repeat: int) -> list[CaseResult]:
+    store = ProfileStore(paths.profiles, paths.temp_mods, paths.root, paths.staging_journal)
+    profile_id = next(profile.id for profile in store.list_profiles() if profile.id != DEFAULT_PROFILE_ID)
+    label = size.label
+    results = [
+        measure(f"profiles.list_profiles[{label}]", store.list_profiles, repeat),
+        measure(f"profiles.list_mods.cold[{label}]", lambda: store.list_mods(profile_id), repeat, store.invalidate),
+        measure(f"profiles.list_mods.warm[{label}]", lambda: store.list_mods(profile_id), repeat),
+    ]
+
+    prepare = CaseResult(f"staging.prepare_mods[{label}]")
+    restore = CaseResult(f"staging.restore_mods[{label}]")
+    for _run in range(repeat):
+        started = time.perf_counter()
+        store.prepare_mods(profile_id, paths.minecraft)
+        prepare.runs_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        store.restore_mods(paths.minecraft)
+        restore.runs_ms.append((time.perf_counter() - started) * 1000)
+    results.extend([prepare, restore])
+
+    try:
+        from launcher.minecraft_service import installed_fabric_id
+
+        import minecraft_launcher_lib  # noqa: F401
+    except ImportError as error:
+        results.append(CaseResult(f"versions.installed_fabric_id[{label}]", skipped=str(error)))
+    else:
+        version = store.load_profile(profile_id).version
+        results.append(
+            measure(
+                f"versions.installed_fabric_id[{label}]",
+                lambda: installed_fabric_id(paths.minecraft, version),
+                repeat,
+            )
+        )
+    return results
+
+
+def ui_cases(paths: LauncherPaths, size: FixtureSize, repeat: int) -> list[CaseResult]:
+    names = [
+        f"ui.skin_draw.raster[{size.label}]",
+        f"ui.skin_draw.polygons[{size.label}]",
+        f"ui.refresh_mods[{size.label}]",
+    ]
+    with virtual_display() as problem:
+        if problem:
+            return [CaseResult(name, skipped=problem) for name in names]
+        try:
+            from launcher.skin_viewer import SteveSkinViewer
+            from launcher.ui import LauncherApp
+        except ImportError as error:
+            return [CaseResult(name, skipped=str(error)) for name in names]
+
+        app = LauncherApp(paths)
+        try:
+            app.update_idletasks()
+            results = []
+            for renderer, name in zip(("raster", "polygons"), names):
+                viewer = SteveSkinViewer(app, paths.steve_skin, renderer=renderer)
+                viewer.grid(row=0, column=0)
+                app.update_idletasks()
+                yaws = iter(SKIN_YAWS * repeat)
+
+                def turn(viewer: SteveSkinViewer = viewer) -> None:
+                    viewer.yaw = float(next(yaws))
+                    viewer.frame_cache.clear()
+                    viewer.shown_frame = None
+
+                result = measure(name, viewer.draw_frame, repeat * len(SKIN_YAWS), setup=turn)
+                stats = viewer.frame_stats
+                result.details["frame_stats"] = {
+                    "frames": stats.frames,
+                    "average_ms": round(stats.average_ms, 4),
+                    "worst_ms": round(stats.worst_ms, 4),
+                    "coalesced": stats.coalesced,
+                }
+                print(f"[BENCH] {name} viewer stats: {stats.summary}")
+                results.append(result)
+                viewer.destroy()
+
+            app.ensure_tab("Mody")
+            app.select_profile(next(p.id for p in app.profile_store.list_profiles() if p.id != DEFAULT_PROFILE_ID))
+
+            def refresh() -> None:
+                app.refresh_mods()
+                app.update_idletasks()
+
+            results.append(measure(names[2], refresh, repeat))
+            return results
+        finally:
+            app.shutdown_tasks()
+            app.destroy()
+
+
+def run(sizes: list[FixtureSize], repeat: int, include_ui: bool, workdir: Path | None) -> dict:
+    results: dict[str, dict] = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="enchanted-bench-", dir=workdir) as folder:
+            started = time.perf_counter()
+            paths = build_fixture(Path(folder), size)
+            print(f"[BENCH] Fixture {size.label} built in {time.perf_counter() - started:.1f}s")
+            cases = store_cases(paths, size, repeat)
+            if include_ui:
+                cases.extend(ui_cases(paths, size, repeat))
+        for case in cases:
+            results[case.name] = case.to_dict()
+            detail = case.skipped or f"{case.median_ms:.2f} ms"
+            print(f"  {case.name:<48} {detail}")
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": [size.label for size in sizes],
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, entry in sorted(current["results"].items()):
+        reference = baseline.get("results", {}).get(name)
+        if "median_ms" not in entry or not reference or "median_ms" not in reference:
+            continue
+        now = entry["median_ms"]
+        before = reference["median_ms"]
+        ratio = now / before if before else float("inf")
+        marker = ""
+        if ratio > 1 + tolerance and now - before > NOISE_FLOOR_MS:
+            marker = "  REGRESSION"
+            regressions.append(name)
+        print(f"  {name:<48} {before:9.2f} -> {now:9.2f} ms ({ratio:5.2f}x){marker}")
+    return regressions
+
+
+def parse_size(value: str) -> FixtureSize:
+    profiles, _separator, mods = value.partition("x")
+    try:
+        return FixtureSize(int(profiles), int(mods))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected PROFILESxMODS, got {value}") from None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark launcher hot paths.")
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=parse_size,
+        help="Fixture size as PROFILESxMODS; repeat for a scaling series (default: 5x40 and 20x160).",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-ui", action="store_true", help="Skip the Tk benchmarks.")
+    parser.add_argument("--workdir", type=Path, help="Where to build fixtures (defaults to the system temp folder).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown (0.25 = 25%%).")
+    parser.add_argument(
+        "--ci",
+        action="store_true",
+        default=bool(os.environ.get("CI")),
+        help="Fail when there is no baseline to compare with (default when the CI variable is set).",
+    )
+    args = parser.parse_args()
+
+    sizes = args.size or [FixtureSize(5, 40), FixtureSize(20, 160)]
+    current = run(sizes, max(args.repeat, 1), not args.no_ui, args.workdir)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(current, indent=4), encoding="utf-8")
+    print(f"[BENCH] Results saved to {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, indent=4), encoding="utf-8")
+        print(f"[BENCH] Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"[BENCH] No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 2 if args.ci else 0
+
+    print(f"[BENCH] Compared with {args.baseline}:")
+    regressions = compare(current, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print(f"[BENCH] {len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from launcher.constants import SUPPORTED_VERSIONS
+from launcher.mods import DISABLED_SUFFIX
+from launcher.paths import LauncherPaths
+from launcher.profiles import DEFAULT_PROFILE_ID, ProfileStore
+
+
+MEDIAN_JAR_KB = 180
+MIN_JAR_KB = 8
+MAX_JAR_KB = 4096
+DISABLED_EVERY = 5
+USER_MODS = 5
+LOADER_VERSIONS = ("0.14.25", "0.15.11", "0.16.5")
+
+
+@dataclass(frozen=True)
+class FixtureSize:
+    profiles: int
+    mods: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.profiles}x{self.mods}"
+
+
+def jar_size(rng: random.Random) -> int:
+    kilobytes = math.exp(rng.gauss(math.log(MEDIAN_JAR_KB), 1.0))
+    return int(min(max(kilobytes, MIN_JAR_KB), MAX_JAR_KB) * 1024)
+
+
+def write_dummy_jar(path: Path, mod_id: str, size: int, rng: random.Random) -> None:
+    metadata = {
+        "schemaVersion": 1,
+        "id": mod_id,
+        "name": mod_id.replace("-", " ").title(),
+        "version": f"1.{rng.randrange(20)}.{rng.randrange(10)}",
+        "depends": {"fabricloader": ">=0.14", "minecraft": "*"},
+        "mixins": [f"{mod_id}.mixins.json"],
+    }
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("fabric.mod.json", json.dumps(metadata))
+        archive.writestr(f"{mod_id}.mixins.json", json.dumps({"package": f"com.example.{mod_id}.mixin"}))
+        archive.writestr(f"com/example/{mod_id.replace('-', '_')}/payload.bin", rng.randbytes(size))
+
+
+def write_versions(minecraft_dir: Path) -> int:
+    count = 0
+    for version in SUPPORTED_VERSIONS:
+        ids = [version, *(f"fabric-loader-{loader}-{version}" for loader in LOADER_VERSIONS)]
+        for version_id in ids:
+            folder = minecraft_dir / "versions" / version_id
+            folder.mkdir(parents=True, exist_ok=True)
+            data = {"id": version_id, "type": "release", "releaseTime": "2024-01-01T00:00:00+00:00"}
+            if version_id != version:
+                data["inheritsFrom"] = version
+            (folder / f"{version_id}.json").write_text(json.dumps(data), encoding="utf-8")
+            count += 1
+    return count
+
+
+def build_fixture(root: Path, size: FixtureSize, seed: int = 1) -> LauncherPaths:
+    rng = random.Random(seed)
+    paths = LauncherPaths.create(root)
+    paths.ensure_runtime_dirs(SUPPORTED_VERSIONS)
+    store = ProfileStore(paths.profiles, paths.temp_mods, paths.root, paths.staging_journal)
+
+    profile_ids = [DEFAULT_PROFILE_ID]
+    for index in range(size.profiles - 1):
+        profile = store.create_profile(f"Bench {index + 1}", SUPPORTED_VERSIONS[index % len(SUPPORTED_VERSIONS)])
+        profile_ids.append(profile.id)
+
+    for profile_id in profile_ids:
+        profile = store.load_profile(profile_id)
+        count = max(size.mods // 4, 1) if profile_id == DEFAULT_PROFILE_ID else size.mods
+        for index in range(count):
+            mod_id = f"{profile_id}-mod-{index}"
+            name = f"{mod_id}.jar"
+            suffix = DISABLED_SUFFIX if index % DISABLED_EVERY == DISABLED_EVERY - 1 else ""
+            write_dummy_jar(store.mods_dir(profile_id) / f"{name}{suffix}", mod_id, jar_size(rng), rng)
+            profile.mods[name] = {"title": mod_id.replace("-", " ").title(), "source": "custom", "icon": ""}
+        store.save_profile(profile)
+
+    user_mods = paths.minecraft / "mods"
+    user_mods.mkdir(parents=True, exist_ok=True)
+    for index in range(USER_MODS):
+        write_dummy_jar(user_mods / f"user-mod-{index}.jar", f"user-mod-{index}", jar_size(rng), rng)
+    write_versions(paths.minecraft)
+    return paths
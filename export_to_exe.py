@@ -1,27 +1,57 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import shutil
+import statistics
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 
 APP_NAME = "EnchantedLauncher"
+BUILD_MODES = ("onefile", "onedir")
+EXCLUDED_MODULES = (
+    "numpy",
+    "scipy",
+    "pandas",
+    "matplotlib",
+    "IPython",
+    "PyQt5",
+    "PySide6",
+    "PIL.ImageQt",
+    "unittest",
+    "pydoc",
+    "doctest",
+    "lib2to3",
+    "xmlrpc",
+)
+STARTUP_PROBE_ENV = "ENCHANTED_STARTUP_PROBE"
+BENCHMARK_TIMEOUT = 120.0
 
 
-def build_command(project_root: Path, app_name: str) -> list[str]:
+def build_command(
+    project_root: Path,
+    app_name: str,
+    mode: str = "onefile",
+    splash: Path | None = None,
+    excludes: tuple[str, ...] = EXCLUDED_MODULES,
+    dist_dir: Path | None = None,
+    clean: bool = True,
+) -> list[str]:
     assets_dir = project_root / "assets"
     icon = assets_dir / "icon.ico"
     data_separator = ";" if sys.platform.startswith("win") else ":"
-    return [
+    command = [
         sys.executable,
         "-m",
         "PyInstaller",
         "--noconfirm",
-        "--clean",
         "--windowed",
-        "--onefile",
+        f"--{mode}",
         "--name",
         app_name,
         "--icon",
@@ -31,16 +61,103 @@ def build_command(project_root: Path, app_name: str) -> list[str]:
         "--collect-all",
         "customtkinter",
         "--distpath",
-        str(project_root / "dist"),
+        str(dist_dir or project_root / "dist"),
         "--workpath",
-        str(project_root / "build" / "pyinstaller"),
+        str(project_root / "build" / f"pyinstaller-{mode}"),
         "--specpath",
         str(project_root / "build"),
-        str(project_root / "main.py"),
     ]
+    if clean:
+        command.append("--clean")
+    if splash:
+        command.extend(["--splash", str(splash)])
+    for module in excludes:
+        command.extend(["--exclude-module", module])
+    command.append(str(project_root / "main.py"))
+    return command
 
 
-def ensure_ready(project_root: Path) -> None:
+def executable_path(dist_dir: Path, app_name: str, mode: str) -> Path:
+    exe_suffix = ".exe" if sys.platform.startswith("win") else ""
+    if mode == "onedir":
+        return dist_dir / app_name / f"{app_name}{exe_suffix}"
+    return dist_dir / f"{app_name}{exe_suffix}"
+
+
+def directory_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+def time_to_first_window(executable: Path, timeout: float = BENCHMARK_TIMEOUT) -> float:
+    with tempfile.TemporaryDirectory() as temporary:
+        probe = Path(temporary) / "startup.json"
+        env = dict(os.environ, **{STARTUP_PROBE_ENV: str(probe)})
+        started = time.time()
+        process = subprocess.Popen([str(executable)], cwd=executable.parent, env=env)
+        try:
+            while not probe.exists():
+                if process.poll() is not None:
+                    raise RuntimeError(f"{executable.name} exited with code {process.returncode} before its window.")
+                if time.time() - started > timeout:
+                    raise RuntimeError(f"{executable.name} did not open a window within {timeout:.0f}s.")
+                time.sleep(0.01)
+            time.sleep(0.05)
+            data = json.loads(probe.read_text(encoding="utf-8"))
+        finally:
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return float(data["first_window_at"]) - started
+
+
+def benchmark(project_root: Path, app_name: str, splash: Path | None, runs: int, excludes: tuple[str, ...]) -> None:
+    variants = [(mode, None) for mode in BUILD_MODES]
+    if splash:
+        variants.extend((mode, splash) for mode in BUILD_MODES)
+
+    results = []
+    for mode, variant_splash in variants:
+        label = f"{mode}+splash" if variant_splash else mode
+        dist_dir = project_root / "dist" / "benchmark" / label
+        print(f"Building {label}...")
+        subprocess.check_call(
+            build_command(project_root, app_name, mode, variant_splash, excludes, dist_dir, clean=False),
+            cwd=project_root,
+        )
+        executable = executable_path(dist_dir, app_name, mode)
+        timings = []
+        for run in range(1, runs + 1):
+            seconds = time_to_first_window(executable)
+            timings.append(seconds)
+            print(f"  {label} run {run}: {seconds:.2f}s")
+        results.append(
+            {
+                "variant": label,
+                "median_seconds": round(statistics.median(timings), 3),
+                "best_seconds": round(min(timings), 3),
+                "runs": [round(seconds, 3) for seconds in timings],
+                "size_mb": round(directory_size(executable if mode == "onefile" else executable.parent) / 1048576, 1),
+            }
+        )
+
+    results.sort(key=lambda item: item["median_seconds"])
+    print("")
+    print(f"{'variant':<16}{'median':>10}{'best':>10}{'size':>10}")
+    for result in results:
+        print(
+            f"{result['variant']:<16}{result['median_seconds']:>9.2f}s{result['best_seconds']:>9.2f}s"
+            f"{result['size_mb']:>8.1f}MB"
+        )
+    report = project_root / "build" / "startup-benchmark.json"
+    report.parent.mkdir(parents=True, exist_ok=True)
+    report.write_text(json.dumps(results, indent=4), encoding="utf-8")
+    print(f"Fastest start: {results[0]['variant']} (report: {report})")
+
+
+def ensure_ready(project_root: Path, splash: Path | None = None) -> None:
     assets_dir = project_root / "assets"
     icon = assets_dir / "icon.ico"
     steve_skin = assets_dir / "steve_skin.png"
@@ -48,6 +165,8 @@ def ensure_ready(project_root: Path) -> None:
         raise SystemExit(f"Missing icon: {icon}")
     if not steve_skin.exists():
         raise SystemExit(f"Missing Steve skin: {steve_skin}")
+    if splash and not splash.exists():
+        raise SystemExit(f"Missing splash image: {splash}")
     if shutil.which("pyinstaller") is None:
         try:
             subprocess.run(
@@ -65,17 +184,36 @@ def ensure_ready(project_root: Path) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build Enchanted Launcher as a Windows EXE.")
     parser.add_argument("--name", default=APP_NAME, help="Executable name without extension.")
+    parser.add_argument(
+        "--mode",
+        choices=BUILD_MODES,
+        default="onefile",
+        help="onefile unpacks to a temp folder on every start; onedir starts faster but ships a folder.",
+    )
+    parser.add_argument("--splash", type=Path, help="Image shown by the bootloader until the window opens.")
+    parser.add_argument("--no-excludes", action="store_true", help="Bundle modules that are excluded by default.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Build every mode (and splash variant) and measure time to first window.",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Launches per variant when benchmarking.")
     args = parser.parse_args()
 
     project_root = Path(__file__).resolve().parent
-    ensure_ready(project_root)
+    splash = args.splash.resolve() if args.splash else None
+    ensure_ready(project_root, splash)
+    excludes = () if args.no_excludes else EXCLUDED_MODULES
+
+    if args.benchmark:
+        benchmark(project_root, args.name, splash, max(args.runs, 1), excludes)
+        return
 
-    command = build_command(project_root, args.name)
-    print("Building EXE with PyInstaller...")
+    command = build_command(project_root, args.name, args.mode, splash, excludes)
+    print(f"Building {args.mode} EXE with PyInstaller...")
     subprocess.check_call(command, cwd=project_root)
 
-    exe_suffix = ".exe" if sys.platform.startswith("win") else ""
-    output = project_root / "dist" / f"{args.name}{exe_suffix}"
+    output = executable_path(project_root / "dist", args.name, args.mode)
     print(f"Done: {output}")
 
 
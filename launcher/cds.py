@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+
+MIN_DYNAMIC_ARCHIVE_JAVA = 13
+ARCHIVE_SUFFIX = ".jsa"
+MAX_TIMINGS = 20
+
+
+@dataclass(frozen=True)
+class CdsPlan:
+    mode: str
+    archive: Path | None
+    arguments: list[str]
+
+
+def mod_set_fingerprint(mod_paths: Iterable[Path]) -> list[str]:
+    entries = []
+    for path in mod_paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append(f"{path.name.lower()}:{stat.st_size}:{stat.st_mtime_ns}")
+    return sorted(entries)
+
+
+class CdsArchiveStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def profile_dir(self, profile_id: str) -> Path:
+        return self.root / profile_id
+
+    def archive_key(
+        self,
+        profile_id: str,
+        version_id: str,
+        runtime_id: str,
+        mod_paths: Iterable[Path],
+    ) -> str:
+        digest = hashlib.sha256()
+        for part in (profile_id, version_id, runtime_id, *mod_set_fingerprint(mod_paths)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()[:20]
+
+    def plan(
+        self,
+        profile_id: str,
+        version_id: str,
+        runtime_id: str,
+        java_major: int | None,
+        mod_paths: Iterable[Path],
+        enabled: bool,
+        read_only: bool = False,
+    ) -> CdsPlan:
+        if not enabled:
+            return CdsPlan("off", None, [])
+        if java_major is None or java_major < MIN_DYNAMIC_ARCHIVE_JAVA:
+            return CdsPlan("unsupported", None, [])
+
+        folder = self.profile_dir(profile_id)
+        folder.mkdir(parents=True, exist_ok=True)
+        key = self.archive_key(profile_id, version_id, runtime_id, mod_paths)
+        archive = folder / f"{key}{ARCHIVE_SUFFIX}"
+        if not read_only:
+            self.invalidate(profile_id, keep=archive)
+
+        if archive.exists() and archive.stat().st_size > 0:
+            return CdsPlan("use", archive, [f"-XX:SharedArchiveFile={archive}"])
+        if read_only:
+            return CdsPlan("skipped", None, [])
+        return CdsPlan("dump", archive, [f"-XX:ArchiveClassesAtExit={archive}"])
+
+    def invalidate(self, profile_id: str, keep: Path | None = None) -> None:
+        folder = self.profile_dir(profile_id)
+        if not folder.is_dir():
+            return
+        for path in folder.glob(f"*{ARCHIVE_SUFFIX}"):
+            if path == keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except PermissionError:
+                print(f"[CDS] Keeping {path.name}, it is still in use by a running game")
+
+    def timings_path(self, profile_id: str) -> Path:
+        return self.profile_dir(profile_id) / "timings.json"
+
+    def load_timings(self, profile_id: str) -> list[dict[str, Any]]:
+        try:
+            data = json.loads(self.timings_path(profile_id).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return []
+        return data if isinstance(data, list) else []
+
+    def record_timing(self, profile_id: str, plan: CdsPlan, startup_seconds: float) -> None:
+        timings = self.load_timings(profile_id)
+        timings.append(
+            {
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "mode": plan.mode,
+                "archive": plan.archive.name if plan.archive else "",
+                "startup_seconds": round(startup_seconds, 3),
+            }
+        )
+        path = self.timings_path(profile_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(timings[-MAX_TIMINGS:], indent=4), encoding="utf-8")
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from .cds import CdsArchiveStore
+from .config import LauncherConfig
+from .constants import SUPPORTED_VERSIONS
+from .game_launcher import GameLauncher
+from .java_runtime import JavaRuntimeManager
+from .log_archive import LogArchive
+from .logs import LogRotator
+from .minecraft_service import install_fabric, installed_fabric_id, split_server_address, valid_username
+from .mod_metadata import ModMetadataIndex
+from .paths import LauncherPaths
+from .profiles import DEFAULT_PROFILE_ID, Profile, ProfileStore
+from .timeline import LaunchTimeline
+
+
+class CliError(Exception):
+    pass
+
+
+def exit_status(exit_code: int | None) -> int:
+    if not exit_code:
+        return 0
+    # Popen reports a signal kill as -signum; shells use 128 + signum for that.
+    return 128 - exit_code if exit_code < 0 else exit_code
+
+
+class LauncherCli:
+    def __init__(self, paths: LauncherPaths | None = None) -> None:
+        self.paths = paths or LauncherPaths.create()
+        self.paths.ensure_runtime_dirs(SUPPORTED_VERSIONS)
+        self.config = LauncherConfig(self.paths.config)
+        self.profile_store = ProfileStore(
+            self.paths.profiles,
+            self.paths.temp_mods,
+            self.paths.root,
+            self.paths.staging_journal,
+        )
+
+    def game_launcher(self, log_rotator: LogRotator | None = None) -> GameLauncher:
+        return GameLauncher(
+            self.paths,
+            self.profile_store,
+            JavaRuntimeManager(self.paths.java_runtimes, self.paths.minecraft),
+            CdsArchiveStore(self.paths.cds),
+            ModMetadataIndex(self.paths.mod_metadata),
+            log_rotator,
+        )
+
+    def find_profile(self, query: str) -> Profile:
+        profiles = self.profile_store.list_profiles()
+        for profile in profiles:
+            if profile.id == query:
+                return profile
+        matches = [profile for profile in profiles if profile.name.lower() == query.strip().lower()]
+        if len(matches) == 1:
+            return matches[0]
+        raise CliError(f"Unknown profile: {query}. Run 'list-profiles' to see the available profiles.")
+
+    def requested_profile(self, query: str | None) -> Profile:
+        return self.find_profile(query or str(self.config.get("last_profile_id", DEFAULT_PROFILE_ID)))
+
+    def username(self, override: str | None) -> str:
+        username = (override or str(self.config.get("username", ""))).strip()
+        if not valid_username(username):
+            raise CliError("Username must be 3-16 characters and use only A-Z, 0-9, or underscore (--username).")
+        return username
+
+    def quickplay(self, number: int) -> tuple[str, str, str]:
+        raw = self.config.get("quickplays", [])
+        if not isinstance(raw, list) or not 1 <= number <= len(raw) or not isinstance(raw[number - 1], dict):
+            raise CliError(f"Quickplay {number} is not configured.")
+        slot = raw[number - 1]
+        return str(slot.get("profile_id", "")), str(slot.get("server_host", "")), str(slot.get("server_port", ""))
+
+    def list_profiles(self, _args: argparse.Namespace) -> int:
+        selected = str(self.config.get("last_profile_id", ""))
+        for profile in self.profile_store.list_profiles():
+            enabled = sum(1 for mod in self.profile_store.list_mods(profile.id) if mod.enabled)
+            marker = "*" if profile.id == selected else " "
+            print(f"{marker} {profile.id:<24} {profile.name:<24} {profile.version:<10} {enabled} mods")
+        return 0
+
+    def install(self, args: argparse.Namespace) -> int:
+        version = args.version
+        existing = installed_fabric_id(self.paths.minecraft, version)
+        if existing and not args.force:
+            print(f"Fabric is already installed: {existing}")
+            return 0
+        print(f"Installing Fabric {version}...")
+        install_fabric(self.paths.minecraft, version)
+        version_id = installed_fabric_id(self.paths.minecraft, version)
+        if not version_id:
+            raise CliError(f"Fabric {version} could not be installed.")
+        print(f"Installed {version_id}")
+        return 0
+
+    def prepare(self, args: argparse.Namespace) -> int:
+        profile = self.requested_profile(args.profile)
+        timeline = LaunchTimeline(profile.id, profile.name, profile.version)
+        prepared = self.game_launcher().prepare(
+            profile.id,
+            self.username(args.username),
+            timeline,
+            on_status=print,
+            stage_mods=False,
+        )
+        print(f"{prepared.profile.name}: {prepared.version_id}, {len(prepared.enabled_mods)} mods")
+        print(f"JVM: {prepared.jvm_plan.summary}, CDS {prepared.cds_plan.mode}")
+        if args.print_command:
+            print(" ".join(prepared.command))
+        return 0
+
+    def launch(self, args: argparse.Namespace) -> int:
+        server_host, server_port = split_server_address(args.server or "", "")
+        if args.quickplay:
+            profile_id, server_host, server_port = self.quickplay(args.quickplay)
+            profile = self.find_profile(profile_id)
+        else:
+            profile = self.requested_profile(args.profile)
+        username = self.username(args.username)
+        with self.config.transaction():
+            self.config.set("username", username)
+            self.config.set("last_profile_id", profile.id)
+        self.config.flush()
+
+        log_archive = LogArchive(self.paths.logs)
+        log_rotator = LogRotator(log_archive.add)
+        launcher = self.game_launcher(log_rotator)
+        timeline = LaunchTimeline(profile.id, profile.name, profile.version)
+        try:
+            prepared = launcher.prepare(profile.id, username, timeline, server_host, server_port, on_status=print)
+            session = launcher.start(prepared, timeline)
+        except Exception as error:
+            launcher.abort(timeline, error)
+            raise CliError(f"Launch failed: {error}") from error
+
+        print(prepared.status)
+        try:
+            ready = launcher.wait_until_ready(session)
+            if ready is not None:
+                print(f"Minecraft ready in {ready:.1f}s")
+            crash = launcher.finish(session)
+        except KeyboardInterrupt:
+            print("Stopping Minecraft...")
+            GameLauncher.stop(session)
+            crash = launcher.finish(session)
+        finally:
+            log_rotator.stop()
+
+        print(crash.summary)
+        for suspect in crash.suspects[:3]:
+            print(f"  {suspect.name} ({suspect.jar}): {', '.join(suspect.reasons)}")
+        return exit_status(crash.exit_code)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="launcher", description="Start Enchanted Launcher profiles without the UI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    launch = commands.add_parser("launch", help="Launch a profile and wait until Minecraft closes.")
+    launch.add_argument("--profile", help="Profile id or name (defaults to the last launched profile).")
+    launch.add_argument("--server", help="Server to join, as host or host:port.")
+    launch.add_argument("--quickplay", type=int, help="Launch a saved quickplay slot (1-4).")
+    launch.add_argument("--username", help="Player name (defaults to the saved one).")
+
+    commands.add_parser("list-profiles", help="List profiles with their version and enabled mod count.")
+
+    install = commands.add_parser("install", help="Install Fabric for a Minecraft version.")
+    install.add_argument("--version", required=True, choices=SUPPORTED_VERSIONS)
+    install.add_argument("--force", action="store_true", help="Reinstall even if Fabric is already installed.")
+
+    prepare = commands.add_parser("prepare", help="Install Fabric and resolve Java and JVM settings for a profile.")
+    prepare.add_argument("--profile", help="Profile id or name (defaults to the last launched profile).")
+    prepare.add_argument("--username", help="Player name used for the launch command.")
+    prepare.add_argument("--print-command", action="store_true", help="Print the full launch command.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    cli = LauncherCli()
+    handlers = {
+        "launch": cli.launch,
+        "list-profiles": cli.list_profiles,
+        "install": cli.install,
+        "prepare": cli.prepare,
+    }
+    try:
+        return handlers[args.command](args)
+    except CliError as error:
+        print(f"[CLI] {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
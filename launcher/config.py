@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+
+SAVE_DELAY = 0.5
 
 
 class LauncherConfig:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, save_delay: float = SAVE_DELAY) -> None:
         self.path = path
+        self.save_delay = save_delay
+        self.lock = threading.RLock()
+        self.timer: threading.Timer | None = None
+        self.dirty = False
+        self.batch_depth = 0
         self.data: dict[str, Any] = self._load()
 
     def _load(self) -> dict[str, Any]:
@@ -21,13 +32,65 @@ class LauncherConfig:
         return data if isinstance(data, dict) else {}
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.data.get(key, default)
+        with self.lock:
+            return self.data.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        self.data[key] = value
-        self.save()
+        with self.lock:
+            if key in self.data and self.data[key] == value:
+                return
+            self.data[key] = value
+            self.dirty = True
+            if self.batch_depth == 0:
+                self._schedule()
+
+    def update(self, values: dict[str, Any]) -> None:
+        with self.transaction():
+            for key, value in values.items():
+                self.set(key, value)
+
+    @contextmanager
+    def transaction(self) -> Iterator["LauncherConfig"]:
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                if self.batch_depth == 0 and self.dirty:
+                    self._schedule()
+
+    def _schedule(self) -> None:
+        if self.timer:
+            self.timer.cancel()
+        self.timer = threading.Timer(self.save_delay, self.flush)
+        self.timer.daemon = True
+        self.timer.start()
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as file:
-            json.dump(self.data, file, indent=4)
+        with self.lock:
+            self.dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return
+            payload = json.dumps(self.data, indent=4)
+            self.dirty = False
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f"{self.path.name}.tmp")
+            try:
+                with temporary.open("w", encoding="utf-8") as file:
+                    file.write(payload)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary, self.path)
+            except OSError as error:
+                self.dirty = True
+                print(f"[CONFIG] Failed to save {self.path.name}: {error}")
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from .mod_metadata import PLATFORM_MOD_IDS, ModMetadata
+
+
+# Checked one at a time in this order: explicit attribution first, the generic exception name last.
+CRASH_PATTERNS = {
+    "mixin_apply": r"Mixin apply(?: for mod (?P<mixin_mod>[\w\-]+))? failed (?P<mixin_config>[\w.\-]+\.json)",
+    "injection_from_mod": r"InvalidInjectionException.*?from mod (?P<injection_mod>[\w\-]+)",
+    "requires": r"Mod '[^']+' \((?P<requires_mod>[\w\-]+)\) \S+ requires",
+    "incompatible": r"Mod '[^']+' \((?P<incompatible_mod>[\w\-]+)\) \S+ is incompatible with",
+    "entrypoint": r"Could not execute entrypoint stage '\w+' due to errors, provided by '(?P<entrypoint_mod>[\w\-]+)'",
+    "suspected": r"Suspected Mods?: (?P<suspected>.+)",
+    "crash_report": r"Crash report saved to:(?: #@!@#)? (?P<crash_report>\S.*)",
+    "mixin_config": r"(?P<config>[\w.\-]*mixins?[\w.\-]*\.json)",
+    "frame": r"^\s*at (?:[\w.\-]+(?:@[\w.\-]*)?/)?(?P<frame>[\w$]+(?:\.[\w$]+)+)\.[\w$<>]+\(",
+    "exception": r"(?P<exception>\b[a-z][\w$]*(?:\.[\w$]+)+(?:Exception|Error))\b",
+}
+CRASH_REGEXES = tuple((kind, re.compile(pattern)) for kind, pattern in CRASH_PATTERNS.items())
+ERROR_LINE = re.compile(r"\b(?:ERROR|FATAL)\b|Exception\b|Error\b|\b[Ff]ailed\b|\b[Cc]rash")
+SUSPECTED_MOD = re.compile(r"\(([\w\-]+)\)")
+PLATFORM_PACKAGES = (
+    "java.",
+    "javax.",
+    "jdk.",
+    "sun.",
+    "com.sun.",
+    "net.minecraft.",
+    "com.mojang.",
+    "org.spongepowered.",
+    "net.fabricmc.loader.",
+    "org.lwjgl.",
+    "io.netty.",
+    "com.google.",
+    "org.apache.",
+    "it.unimi.",
+    "cpw.mods.",
+)
+MAX_FRAMES_PER_TRACE = 40
+MIN_PACKAGE_DEPTH = 2
+EXPLICIT_WEIGHT = 10
+CONFIG_WEIGHT = 5
+FRAME_WEIGHT = 1
+
+
+@dataclass(frozen=True)
+class CrashSuspect:
+    mod_id: str
+    name: str
+    jar: str
+    score: int
+    reasons: tuple[str, ...]
+
+
+@dataclass
+class CrashReport:
+    crashed: bool
+    exit_code: int | None
+    exception: str = ""
+    crash_report: str = ""
+    suspects: list[CrashSuspect] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        if not self.crashed:
+            return "Minecraft closed"
+        if self.suspects:
+            top = self.suspects[0]
+            return f"Minecraft crashed - suspected mod: {top.name} ({top.jar})"
+        return f"Minecraft crashed (exit code {self.exit_code})"
+
+
+class CrashAnalyzer:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.mod_ids: Counter[str] = Counter()
+        self.configs: Counter[str] = Counter()
+        self.frames: Counter[str] = Counter()
+        self.reasons: dict[str, set[str]] = {}
+        self.exception = ""
+        self.crash_report = ""
+        self.frames_in_trace = 0
+
+    def feed(self, line: str, crash_report: bool = False) -> None:
+        with self.lock:
+            configs: set[str] = set()
+            frame = False
+            for kind, regex in CRASH_REGEXES:
+                if kind == "exception" and frame:
+                    break
+                for match in regex.finditer(line):
+                    for group, value in match.groupdict().items():
+                        if value is None:
+                            continue
+                        if group in {"mixin_config", "config"}:
+                            configs.add(value)
+                        else:
+                            frame = frame or group == "frame"
+                            self._record(group, value)
+            # Mixin configs show up in harmless warnings (missing refmaps and the like); only count the ones
+            # named by an error, a crash report or a stack trace.
+            if configs and (crash_report or frame or ERROR_LINE.search(line)):
+                for config in configs:
+                    self.configs[config] += 1
+
+    def feed_lines(self, lines: Iterable[str], crash_report: bool = False) -> None:
+        for line in lines:
+            self.feed(line, crash_report)
+
+    def _record(self, kind: str, value: str) -> None:
+        if kind == "frame":
+            if self.frames_in_trace >= MAX_FRAMES_PER_TRACE or value.startswith(PLATFORM_PACKAGES):
+                return
+            self.frames_in_trace += 1
+            self.frames[value] += 1
+        elif kind == "exception":
+            self.frames_in_trace = 0
+            if not self.exception:
+                self.exception = value
+        elif kind == "mixin_mod":
+            self._explicit(value, "mixin apply failed")
+        elif kind == "injection_mod":
+            self._explicit(value, "invalid mixin injection")
+        elif kind == "requires_mod":
+            self._explicit(value, "missing dependency")
+        elif kind == "incompatible_mod":
+            self._explicit(value, "incompatible mod")
+        elif kind == "entrypoint_mod":
+            self._explicit(value, "entrypoint failed")
+        elif kind == "suspected":
+            for mod_id in SUSPECTED_MOD.findall(value):
+                self._explicit(mod_id, "named in crash report")
+        elif kind == "crash_report":
+            self.crash_report = value.strip()
+
+    def _explicit(self, mod_id: str, reason: str) -> None:
+        self.mod_ids[mod_id] += EXPLICIT_WEIGHT
+        self.reasons.setdefault(mod_id, set()).add(reason)
+
+    def feed_crash_report(self, crash_reports_dir: Path, since: float) -> None:
+        candidates = []
+        if self.crash_report:
+            candidates.append(Path(self.crash_report))
+        if crash_reports_dir.is_dir():
+            recent = [path for path in crash_reports_dir.glob("crash-*.txt") if path.stat().st_mtime >= since]
+            candidates.extend(sorted(recent, key=lambda path: path.stat().st_mtime, reverse=True)[:1])
+        for path in candidates:
+            try:
+                with path.open("r", encoding="utf-8", errors="replace") as file:
+                    self.feed_lines(file, crash_report=True)
+            except OSError:
+                continue
+            self.crash_report = str(path)
+            return
+
+    def report(self, exit_code: int | None, mods: list[ModMetadata]) -> CrashReport:
+        with self.lock:
+            crashed = exit_code not in (0, None) or bool(self.crash_report)
+            report = CrashReport(crashed, exit_code, self.exception, self.crash_report)
+            if not crashed:
+                return report
+
+            by_id: dict[str, ModMetadata] = {}
+            by_config: dict[str, ModMetadata] = {}
+            by_package: dict[str, ModMetadata] = {}
+            ancestors: dict[str, ModMetadata | None] = {}
+            for mod in mods:
+                for mod_id in (mod.mod_id, *mod.provides):
+                    by_id.setdefault(mod_id, mod)
+                for config in mod.mixins:
+                    by_config.setdefault(config, mod)
+                for package in mod.packages:
+                    by_package.setdefault(package, mod)
+                    parts = package.split(".")
+                    for depth in range(MIN_PACKAGE_DEPTH, len(parts)):
+                        parent = ".".join(parts[:depth])
+                        owner = ancestors.get(parent, mod)
+                        ancestors[parent] = mod if owner is mod else None
+            for package, owner in ancestors.items():
+                if owner is not None:
+                    by_package.setdefault(package, owner)
+
+            scores: Counter[str] = Counter()
+            reasons: dict[str, set[str]] = {}
+            owners: dict[str, ModMetadata] = {}
+
+            def credit(mod: ModMetadata | None, points: int, *why: str) -> None:
+                if mod is None or mod.mod_id in PLATFORM_MOD_IDS:
+                    return
+                owners[mod.path] = mod
+                scores[mod.path] += points
+                reasons.setdefault(mod.path, set()).update(why)
+
+            for mod_id, points in self.mod_ids.items():
+                credit(by_id.get(mod_id), points, *self.reasons.get(mod_id, ()))
+            for config, count in self.configs.items():
+                credit(by_config.get(config), CONFIG_WEIGHT * count, f"mixin config {config}")
+            for frame, count in self.frames.items():
+                credit(self._frame_owner(frame, by_package), FRAME_WEIGHT * count, "stack trace")
+
+            report.suspects = [
+                CrashSuspect(
+                    mod_id=owners[path].mod_id,
+                    name=owners[path].name,
+                    jar=owners[path].jar_name,
+                    score=score,
+                    reasons=tuple(sorted(reasons[path])),
+                )
+                for path, score in scores.most_common(5)
+            ]
+            return report
+
+    @staticmethod
+    def _frame_owner(frame: str, by_package: dict[str, ModMetadata]) -> ModMetadata | None:
+        package = frame.rsplit(".", 1)[0]
+        while package:
+            owner = by_package.get(package)
+            if owner is not None:
+                return owner
+            if "." not in package:
+                return None
+            package = package.rsplit(".", 1)[0]
+        return None
@@ -7,6 +7,7 @@ from pathlib import Path
 from ctypes import wintypes
 
 
+OFN_ALLOWMULTISELECT = 0x00000200
 OFN_EXPLORER = 0x00080000
 OFN_FILEMUSTEXIST = 0x00001000
 OFN_PATHMUSTEXIST = 0x00000800
@@ -41,6 +42,15 @@ class OpenFileNameW(ctypes.Structure):
 
 
 def pick_mod_file(owner_hwnd: int | None = None) -> Path | None:
+    paths = _open_file_dialog(owner_hwnd, "Select Minecraft mod", 0)
+    return paths[0] if paths else None
+
+
+def pick_mod_files(owner_hwnd: int | None = None) -> list[Path]:
+    return _open_file_dialog(owner_hwnd, "Select Minecraft mods", OFN_ALLOWMULTISELECT)
+
+
+def _open_file_dialog(owner_hwnd: int | None, title: str, flags: int) -> list[Path]:
     if not sys.platform.startswith("win"):
         raise RuntimeError("The bundled file picker currently supports Windows only.")
 
@@ -54,13 +64,17 @@ def pick_mod_file(owner_hwnd: int | None = None) -> Path | None:
     dialog.nFilterIndex = 1
     dialog.lpstrFile = ctypes.cast(buffer, wintypes.LPWSTR)
     dialog.nMaxFile = len(buffer)
-    dialog.lpstrTitle = "Select Minecraft mod"
-    dialog.Flags = OFN_EXPLORER | OFN_FILEMUSTEXIST | OFN_PATHMUSTEXIST
+    dialog.lpstrTitle = title
+    dialog.Flags = OFN_EXPLORER | OFN_FILEMUSTEXIST | OFN_PATHMUSTEXIST | flags
 
     if ctypes.windll.comdlg32.GetOpenFileNameW(ctypes.byref(dialog)):
-        return Path(buffer.value)
+        parts = buffer[:].split("\0\0", 1)[0].split("\0")
+        if len(parts) == 1:
+            return [Path(parts[0])]
+        folder = Path(parts[0])
+        return [folder / name for name in parts[1:]]
 
     error = ctypes.windll.comdlg32.CommDlgExtendedError()
     if error:
         raise RuntimeError(f"Windows file picker failed with error code {error}.")
-    return None
+    return []
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+POLL_INTERVAL = 2.0
+SETTLE_DELAY = 0.2
+READ_TIMEOUT = 1.0
+READ_BUFFER = 64 * 1024
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_ATTRIB
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True)
+class WatchRoot:
+    path: Path
+    depth: int = 0
+
+
+@dataclass(frozen=True)
+class FileEvent:
+    path: Path
+    kind: str
+    root: Path
+    is_dir: bool = False
+
+
+ChangeCallback = Callable[[list[FileEvent]], None]
+DegradedCallback = Callable[[str], None]
+
+
+class InotifyBackend:
+    name = "inotify"
+
+    def __init__(self, roots: list[WatchRoot]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.add_watch = libc.inotify_add_watch
+        self.add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.remove_watch = libc.inotify_rm_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = roots
+        self.watches: dict[int, tuple[Path, WatchRoot]] = {}
+        self.watched: set[Path] = set()
+        self.failures: list[str] = []
+        for root in roots:
+            self._watch_tree(root.path, root, 0)
+
+    @staticmethod
+    def available() -> bool:
+        return sys.platform.startswith("linux")
+
+    def _watch_tree(self, path: Path, root: WatchRoot, level: int) -> None:
+        if path in self.watched or not path.is_dir():
+            return
+        wd = self.add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            reason = f"Cannot watch {path}: {os.strerror(ctypes.get_errno())}"
+            print(f"[WATCH] {reason}")
+            self.failures.append(reason)
+            return
+        self.watches[wd] = (path, root)
+        self.watched.add(path)
+        if level >= root.depth:
+            return
+        try:
+            children = [entry for entry in os.scandir(path) if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for entry in children:
+            self._watch_tree(Path(entry.path), root, level + 1)
+
+    def _level(self, path: Path, root: WatchRoot) -> int:
+        return len(path.relative_to(root.path).parts)
+
+    def events(self, timeout: float) -> list[FileEvent]:
+        for root in self.roots:
+            if root.path not in self.watched:
+                self._watch_tree(root.path, root, 0)
+        readable, _writable, _errors = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, READ_BUFFER)
+        except BlockingIOError:
+            return []
+
+        events: list[FileEvent] = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                events.extend(FileEvent(root.path, "overflow", root.path, True) for root in self.roots)
+                continue
+            watch = self.watches.get(wd)
+            if watch is None:
+                continue
+            directory, root = watch
+            if mask & IN_IGNORED:
+                del self.watches[wd]
+                self.watched.discard(directory)
+                continue
+            if mask & IN_MOVE_SELF and not name:
+                self.remove_watch(self.fd, wd)
+            path = directory / os.fsdecode(name) if name else directory
+            is_dir = bool(mask & IN_ISDIR) or not name
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                kind = "created"
+                if is_dir and self._level(path, root) <= root.depth:
+                    self._watch_tree(path, root, self._level(path, root))
+            elif mask & (IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF | IN_MOVE_SELF):
+                kind = "deleted"
+            else:
+                kind = "modified"
+            events.append(FileEvent(path, kind, root.path, is_dir))
+        return events
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingBackend:
+    name = "polling"
+
+    def __init__(self, roots: list[WatchRoot], interval: float = POLL_INTERVAL) -> None:
+        self.roots = roots
+        self.interval = interval
+        self.failures: list[str] = []
+        self.snapshots = {root.path: self._snapshot(root) for root in roots}
+
+    @staticmethod
+    def _snapshot(root: WatchRoot) -> dict[Path, tuple[bool, int, int]]:
+        snapshot: dict[Path, tuple[bool, int, int]] = {}
+        pending = [(root.path, 0)]
+        while pending:
+            directory, level = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                snapshot[Path(entry.path)] = (is_dir, stat.st_mtime_ns, 0 if is_dir else stat.st_size)
+                if is_dir and level < root.depth:
+                    pending.append((Path(entry.path), level + 1))
+        return snapshot
+
+    def events(self, timeout: float) -> list[FileEvent]:
+        time.sleep(min(timeout, self.interval))
+        events: list[FileEvent] = []
+        for root in self.roots:
+            before = self.snapshots[root.path]
+            after = self._snapshot(root)
+            for path, state in after.items():
+                previous = before.get(path)
+                if previous is None:
+                    events.append(FileEvent(path, "created", root.path, state[0]))
+                elif previous != state and not state[0]:
+                    events.append(FileEvent(path, "modified", root.path, False))
+            events.extend(
+                FileEvent(path, "deleted", root.path, state[0]) for path, state in before.items() if path not in after
+            )
+            self.snapshots[root.path] = after
+        return events
+
+    def close(self) -> None:
+        self.snapshots.clear()
+
+
+class FileWatcher:
+    def __init__(
+        self,
+        roots: list[WatchRoot],
+        on_changes: ChangeCallback,
+        settle_delay: float = SETTLE_DELAY,
+        poll_interval: float = POLL_INTERVAL,
+        force_polling: bool = False,
+        on_degraded: DegradedCallback | None = None,
+    ) -> None:
+        self.roots = roots
+        self.on_changes = on_changes
+        self.on_degraded = on_degraded
+        self.degraded = False
+        self.settle_delay = settle_delay
+        self.backend: InotifyBackend | PollingBackend
+        if not force_polling and InotifyBackend.available():
+            try:
+                self.backend = InotifyBackend(roots)
+            except (OSError, AttributeError) as error:
+                print(f"[WATCH] inotify unavailable, polling instead: {error}")
+                self.backend = PollingBackend(roots, poll_interval)
+        else:
+            self.backend = PollingBackend(roots, poll_interval)
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name
+
+    @property
+    def live(self) -> bool:
+        return isinstance(self.backend, InotifyBackend) and not self.degraded and not self.backend.failures
+
+    def _degrade(self, reason: str) -> None:
+        if self.degraded:
+            return
+        self.degraded = True
+        if self.on_degraded is not None:
+            try:
+                self.on_degraded(reason)
+            except Exception as error:
+                print(f"[WATCH] Degraded handler failed: {error}")
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=READ_TIMEOUT + POLL_INTERVAL)
+        self.backend.close()
+
+    def _run(self) -> None:
+        try:
+            self._watch_loop()
+        finally:
+            if not self.stop_event.is_set():
+                self._degrade("Watcher thread stopped")
+
+    def _watch_loop(self) -> None:
+        pending: dict[tuple[Path, str], FileEvent] = {}
+        while not self.stop_event.is_set():
+            timeout = self.settle_delay if pending else READ_TIMEOUT
+            try:
+                events = self.backend.events(timeout)
+            except (OSError, ValueError) as error:
+                if self.stop_event.is_set():
+                    return
+                print(f"[WATCH] Watcher failed: {error}")
+                self._degrade(f"Watcher failed: {error}")
+                return
+            if self.backend.failures:
+                self._degrade(self.backend.failures[-1])
+            for event in events:
+                pending[(event.path, event.kind)] = event
+            if pending and not events:
+                batch = list(pending.values())
+                pending.clear()
+                try:
+                    self.on_changes(batch)
+                except Exception as error:
+                    print(f"[WATCH] Change handler failed: {error}")
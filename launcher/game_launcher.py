@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from .cds import CdsArchiveStore, CdsPlan
+from .crash_analysis import CrashAnalyzer, CrashReport
+from .java_runtime import JavaRuntimeManager, required_java_major
+from .jvm import JvmPlan, plan_jvm
+from .log_archive import RESOURCE_REPORT_SUFFIX
+from .logs import GAME_READY_MARKERS, GameLogPipeline, LogRotator, rotate_latest_log
+from .minecraft_service import build_launch_command, install_fabric, installed_fabric_id, start_process
+from .mod_metadata import ModMetadataIndex
+from .paths import LauncherPaths
+from .profiles import Profile, ProfileStore
+from .resource_monitor import ResourceMonitor, ResourceSummary, save_resource_report
+from .timeline import LaunchTimeline
+
+
+StatusCallback = Callable[[str], None]
+ReadyCallback = Callable[[float], None]
+SHARED_GAME_FILES = ("options.txt", "servers.dat")
+
+
+@dataclass
+class PreparedLaunch:
+    profile: Profile
+    version_id: str
+    command: list[str]
+    enabled_mods: list[Path]
+    jvm_plan: JvmPlan
+    cds_plan: CdsPlan
+    game_dir: Path
+
+    @property
+    def status(self) -> str:
+        return f"Running {self.profile.name} ({self.jvm_plan.summary}, CDS {self.cds_plan.mode})"
+
+
+@dataclass
+class GameSession:
+    prepared: PreparedLaunch
+    timeline: LaunchTimeline
+    process: subprocess.Popen
+    pipeline: GameLogPipeline
+    analyzer: CrashAnalyzer
+    stopped: bool = False
+    ready_seconds: float | None = None
+    resources: ResourceSummary | None = None
+
+
+class GameLauncher:
+    def __init__(
+        self,
+        paths: LauncherPaths,
+        profile_store: ProfileStore,
+        runtime_manager: JavaRuntimeManager,
+        cds_store: CdsArchiveStore,
+        mod_index: ModMetadataIndex,
+        log_rotator: LogRotator | None = None,
+        resource_monitor: ResourceMonitor | None = None,
+    ) -> None:
+        self.paths = paths
+        self.profile_store = profile_store
+        self.runtime_manager = runtime_manager
+        self.cds_store = cds_store
+        self.mod_index = mod_index
+        self.log_rotator = log_rotator
+        self.resource_monitor = resource_monitor if resource_monitor is not None else ResourceMonitor()
+        self.fabric_versions: dict[str, str] = {}
+
+    def invalidate_versions(self) -> None:
+        self.fabric_versions.clear()
+
+    def ensure_fabric(
+        self,
+        profile: Profile,
+        timeline: LaunchTimeline,
+        on_status: StatusCallback | None = None,
+    ) -> str:
+        with timeline.phase("fabric_detect"):
+            version_id = self.fabric_versions.get(profile.version)
+            if version_id is None or not (self.paths.minecraft / "versions" / version_id).is_dir():
+                version_id = installed_fabric_id(self.paths.minecraft, profile.version)
+        if not version_id:
+            if on_status:
+                on_status(f"Installing Fabric {profile.version}...")
+            with timeline.phase("fabric_install"):
+                install_fabric(self.paths.minecraft, profile.version)
+                version_id = installed_fabric_id(self.paths.minecraft, profile.version)
+
+        if not version_id:
+            raise RuntimeError(f"Fabric {profile.version} could not be installed.")
+        self.fabric_versions[profile.version] = version_id
+        return version_id
+
+    def prepare(
+        self,
+        profile_id: str,
+        username: str,
+        timeline: LaunchTimeline,
+        server_host: str = "",
+        server_port: str = "",
+        on_status: StatusCallback | None = None,
+        only_mods: set[Path] | None = None,
+        game_dir: Path | None = None,
+        stage_mods: bool = True,
+    ) -> PreparedLaunch:
+        profile = self.profile_store.load_profile(profile_id)
+        version_id = self.ensure_fabric(profile, timeline, on_status)
+        game_dir = game_dir or self.paths.minecraft
+
+        if stage_mods:
+            with timeline.phase("prepare_mods"):
+                if game_dir != self.paths.minecraft:
+                    self.seed_game_dir(game_dir)
+                self.profile_store.prepare_mods(profile.id, game_dir, only_mods)
+        with timeline.phase("runtime_select"):
+            java_major = required_java_major(self.paths.minecraft, version_id, profile.version)
+            runtime = self.runtime_manager.select(java_major, profile.java_runtime)
+        with timeline.phase("build_launch_command"):
+            enabled_mods = [mod.path for mod in self.profile_store.list_mods(profile.id) if mod.enabled]
+            if only_mods is not None:
+                enabled_mods = [path for path in enabled_mods if path in only_mods]
+            # Without a discovered runtime the game runs on whatever Java it finds, so plan version-agnostic flags.
+            runtime_major = runtime.major if runtime else None
+            jvm_plan = plan_jvm(profile.jvm, len(enabled_mods), runtime_major)
+            cds_plan = self.cds_store.plan(
+                profile.id,
+                version_id,
+                f"{runtime.path}:{runtime.version}" if runtime else f"bundled:{java_major}",
+                runtime_major,
+                enabled_mods,
+                profile.jvm.class_data_sharing and only_mods is None,
+                read_only=game_dir != self.paths.minecraft or not stage_mods,
+            )
+            command = build_launch_command(
+                self.paths.minecraft,
+                version_id,
+                username,
+                server_host,
+                server_port,
+                jvm_plan.arguments + cds_plan.arguments,
+                runtime.launch_executable if runtime else None,
+                game_dir,
+            )
+        timeline.details.update(
+            {
+                "version_id": version_id,
+                "mods": len(enabled_mods),
+                "java": runtime.version if runtime else f"bundled {java_major}",
+                "jvm": jvm_plan.summary,
+                "cds": cds_plan.mode,
+            }
+        )
+        if game_dir != self.paths.minecraft:
+            timeline.details["game_dir"] = game_dir.name
+        return PreparedLaunch(profile, version_id, command, enabled_mods, jvm_plan, cds_plan, game_dir)
+
+    def seed_game_dir(self, game_dir: Path) -> None:
+        game_dir.mkdir(parents=True, exist_ok=True)
+        for name in SHARED_GAME_FILES:
+            source = self.paths.minecraft / name
+            if source.is_file() and not (game_dir / name).exists():
+                shutil.copy2(source, game_dir / name)
+
+    def log_name(self, game_dir: Path) -> str:
+        return "latest.txt" if game_dir == self.paths.minecraft else f"latest-{game_dir.name}.txt"
+
+    def start(self, prepared: PreparedLaunch, timeline: LaunchTimeline) -> GameSession:
+        with timeline.phase("log_rotation"):
+            latest_log = rotate_latest_log(self.paths.logs, self.log_rotator, self.log_name(prepared.game_dir))
+
+        pipeline = GameLogPipeline(latest_log)
+        pipeline.add_listener(timeline.observe_line)
+        analyzer = CrashAnalyzer()
+        pipeline.add_listener(analyzer.feed)
+        with timeline.phase("process_spawn"):
+            process = start_process(prepared.command, prepared.game_dir)
+            pipeline.start(process.stdout)
+        self.resource_monitor.watch(process.pid)
+        return GameSession(prepared, timeline, process, pipeline, analyzer)
+
+    def wait_until_ready(self, session: GameSession, timeout: float = 600.0) -> float | None:
+        with session.timeline.phase("game_init"):
+            startup_seconds = session.pipeline.wait_for_marker(session.process, timeout=timeout)
+        if startup_seconds is not None:
+            self.record_ready(session, startup_seconds)
+        return startup_seconds
+
+    def watch_ready(self, session: GameSession, on_ready: ReadyCallback | None = None) -> None:
+        started = time.monotonic()
+
+        def listener(line: str) -> None:
+            if session.ready_seconds is not None or not any(marker in line for marker in GAME_READY_MARKERS):
+                return
+            self.record_ready(session, time.monotonic() - started)
+            if on_ready is not None:
+                on_ready(session.ready_seconds)
+
+        session.pipeline.add_listener(listener)
+
+    def record_ready(self, session: GameSession, startup_seconds: float) -> None:
+        session.ready_seconds = startup_seconds
+        self.cds_store.record_timing(session.prepared.profile.id, session.prepared.cds_plan, startup_seconds)
+        session.timeline.save(self.paths.launch_history)
+
+    def finish(self, session: GameSession) -> CrashReport:
+        exit_code = session.process.wait()
+        session.pipeline.join()
+        session.resources = self.record_resources(session)
+        if session.stopped:
+            crash = CrashReport(False, exit_code)
+        else:
+            session.analyzer.feed_crash_report(session.prepared.game_dir / "crash-reports", session.timeline.started_at)
+            crash = session.analyzer.report(exit_code, self.mod_index.for_paths(session.prepared.enabled_mods))
+
+        time.sleep(1)
+        self.profile_store.restore_mods(session.prepared.game_dir)
+        session.timeline.details["suspects"] = [suspect.jar for suspect in crash.suspects]
+        status = "stopped" if session.stopped else "crashed" if crash.crashed else "closed"
+        session.timeline.finish(status, exit_code)
+        session.timeline.save(self.paths.launch_history)
+        return crash
+
+    def record_resources(self, session: GameSession) -> ResourceSummary:
+        pid = session.process.pid
+        samples = self.resource_monitor.history(pid)
+        summary = self.resource_monitor.unwatch(pid)
+        if not summary.samples:
+            return summary
+        session.timeline.details["resources"] = summary.to_dict()
+        stamp = time.strftime("%Y-%m-%d-%H%M%S", time.localtime(session.timeline.started_at))
+        report = self.paths.logs / f"{stamp}-{session.prepared.profile.id}{RESOURCE_REPORT_SUFFIX}"
+        try:
+            save_resource_report(report, summary, samples)
+        except OSError as error:
+            print(f"[RESOURCES] Failed to save resource report: {error}")
+        print(f"[RESOURCES] {session.prepared.profile.name}: {summary.summary}")
+        return summary
+
+    def abort(self, timeline: LaunchTimeline, error: Exception, game_dir: Path | None = None) -> None:
+        self.profile_store.restore_mods(game_dir or self.paths.minecraft)
+        timeline.finish("failed", error=str(error))
+        try:
+            timeline.save(self.paths.launch_history)
+        except OSError as save_error:
+            print(f"[LAUNCH] Failed to save launch record: {save_error}")
+
+    @staticmethod
+    def stop(session: GameSession, timeout: float = 10.0) -> None:
+        session.stopped = True
+        try:
+            session.process.terminate()
+            session.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            session.process.kill()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+
+JAVA_EXECUTABLE = "java.exe" if sys.platform.startswith("win") else "java"
+PROBE_TIMEOUT = 10
+HOME_PATTERNS = ("*", "*/Contents/Home", "*/*/*")
+
+
+@dataclass(frozen=True)
+class JavaRuntime:
+    path: Path
+    version: str
+    major: int
+    arch: str
+    vendor: str = ""
+
+    @property
+    def home(self) -> Path:
+        return self.path.parent.parent
+
+    @property
+    def launch_executable(self) -> Path:
+        windowed = self.path.with_name("javaw.exe")
+        return windowed if sys.platform.startswith("win") and windowed.exists() else self.path
+
+    @property
+    def is_64bit(self) -> bool:
+        return self.arch in {"amd64", "x86_64", "aarch64", "arm64"}
+
+    @property
+    def label(self) -> str:
+        vendor = f" {self.vendor}" if self.vendor else ""
+        return f"Java {self.version} ({self.arch}){vendor} - {self.home}"
+
+
+def parse_java_major(version: str) -> int:
+    parts = [int(part) for part in re.findall(r"\d+", version)[:2]]
+    if not parts:
+        return 0
+    if parts[0] == 1 and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
+
+def fallback_java_major(minecraft_version: str) -> int:
+    parts = tuple(int(part) for part in re.findall(r"\d+", minecraft_version)[:3])
+    if not parts:
+        return 21
+    if parts[0] >= 26:
+        return 25
+    if parts < (1, 17):
+        return 8
+    if parts < (1, 18):
+        return 16
+    if parts < (1, 20, 5):
+        return 17
+    return 21
+
+
+def required_java_major(minecraft_dir: Path, version_id: str, minecraft_version: str) -> int:
+    seen: set[str] = set()
+    current = version_id
+    while current and current not in seen:
+        seen.add(current)
+        path = minecraft_dir / "versions" / current / f"{current}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            break
+        java_version = data.get("javaVersion")
+        if isinstance(java_version, dict) and java_version.get("majorVersion"):
+            return int(java_version["majorVersion"])
+        current = str(data.get("inheritsFrom", ""))
+    return fallback_java_major(minecraft_version)
+
+
+class JavaRuntimeManager:
+    def __init__(self, cache_path: Path, minecraft_dir: Path) -> None:
+        self.cache_path = cache_path
+        self.minecraft_dir = minecraft_dir
+        self.cache: dict[str, dict[str, Any]] = self._load_cache()
+        self._runtimes: list[JavaRuntime] | None = None
+        self.lock = threading.RLock()
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_cache(self) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.cache, indent=4), encoding="utf-8")
+
+    def search_homes(self) -> Iterable[Path]:
+        java_home = os.environ.get("JAVA_HOME")
+        if java_home:
+            yield Path(java_home)
+        on_path = shutil.which("java")
+        if on_path:
+            yield Path(on_path).resolve().parent.parent
+
+        roots = [self.minecraft_dir / "runtime"]
+        if sys.platform.startswith("win"):
+            for variable in ("ProgramFiles", "ProgramFiles(x86)"):
+                base = os.environ.get(variable)
+                if not base:
+                    continue
+                for vendor in ("Java", "Eclipse Adoptium", "Microsoft", "Zulu", "BellSoft", "Amazon Corretto"):
+                    roots.append(Path(base) / vendor)
+        elif sys.platform == "darwin":
+            roots.append(Path("/Library/Java/JavaVirtualMachines"))
+        else:
+            roots.extend((Path("/usr/lib/jvm"), Path("/usr/java"), Path("/opt/java")))
+
+        for root in roots:
+            if not root.is_dir():
+                continue
+            for pattern in HOME_PATTERNS:
+                for executable in root.glob(f"{pattern}/bin/{JAVA_EXECUTABLE}"):
+                    yield executable.parent.parent
+
+    def discover(self, refresh: bool = False) -> list[JavaRuntime]:
+        with self.lock:
+            if self._runtimes is not None and not refresh:
+                return self._runtimes
+            return self._discover()
+
+    def _discover(self) -> list[JavaRuntime]:
+        runtimes: dict[Path, JavaRuntime] = {}
+        known: set[str] = set()
+        for home in self.search_homes():
+            executable = home / "bin" / JAVA_EXECUTABLE
+            try:
+                executable = executable.resolve()
+                stat = executable.stat()
+            except OSError:
+                continue
+            if executable in runtimes:
+                continue
+            key = str(executable)
+            known.add(key)
+            entry = self.cache.get(key)
+            if not entry or entry.get("mtime") != stat.st_mtime or entry.get("size") != stat.st_size:
+                entry = self.inspect(executable)
+                if entry is None:
+                    self.cache.pop(key, None)
+                    continue
+                entry.update({"mtime": stat.st_mtime, "size": stat.st_size})
+                self.cache[key] = entry
+            runtimes[executable] = JavaRuntime(
+                path=executable,
+                version=str(entry.get("version", "")),
+                major=int(entry.get("major", 0)),
+                arch=str(entry.get("arch", "")),
+                vendor=str(entry.get("vendor", "")),
+            )
+
+        for stale in set(self.cache) - known:
+            del self.cache[stale]
+        try:
+            self._save_cache()
+        except OSError as error:
+            print(f"[JAVA] Failed to save runtime cache: {error}")
+
+        self._runtimes = sorted(runtimes.values(), key=lambda runtime: (-runtime.major, str(runtime.path)))
+        return self._runtimes
+
+    def inspect(self, executable: Path) -> dict[str, Any] | None:
+        release = executable.parent.parent / "release"
+        if release.exists():
+            values = self._read_release(release)
+            version = values.get("JAVA_VERSION", "")
+            if version:
+                return {
+                    "version": version,
+                    "major": parse_java_major(version),
+                    "arch": values.get("OS_ARCH", ""),
+                    "vendor": values.get("IMPLEMENTOR", ""),
+                }
+        return self._probe(executable)
+
+    @staticmethod
+    def _read_release(release: Path) -> dict[str, str]:
+        values: dict[str, str] = {}
+        try:
+            lines = release.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return values
+        for line in lines:
+            key, separator, value = line.partition("=")
+            if separator:
+                values[key.strip()] = value.strip().strip('"')
+        return values
+
+    @staticmethod
+    def _probe(executable: Path) -> dict[str, Any] | None:
+        creation_flags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0
+        try:
+            result = subprocess.run(
+                [str(executable), "-XshowSettings:properties", "-version"],
+                capture_output=True,
+                text=True,
+                timeout=PROBE_TIMEOUT,
+                creationflags=creation_flags,
+            )
+        except (OSError, subprocess.SubprocessError) as error:
+            print(f"[JAVA] Failed to inspect {executable}: {error}")
+            return None
+
+        properties: dict[str, str] = {}
+        for line in result.stderr.splitlines():
+            key, separator, value = line.strip().partition(" = ")
+            if separator:
+                properties[key] = value
+        version = properties.get("java.version", "")
+        if not version:
+            return None
+        return {
+            "version": version,
+            "major": parse_java_major(version),
+            "arch": properties.get("os.arch", ""),
+            "vendor": properties.get("java.vendor", ""),
+        }
+
+    def find(self, path: str) -> JavaRuntime | None:
+        if not path:
+            return None
+        try:
+            wanted = Path(path).resolve()
+        except OSError:
+            return None
+        return next((runtime for runtime in self.discover() if runtime.path == wanted), None)
+
+    def select(self, required_major: int, pinned: str = "") -> JavaRuntime | None:
+        if pinned:
+            runtime = self.find(pinned)
+            if runtime is None:
+                raise FileNotFoundError(f"Pinned Java runtime was not found: {pinned}")
+            if runtime.major < required_major:
+                raise RuntimeError(
+                    f"Pinned Java {runtime.version} is too old; this version needs Java {required_major}."
+                )
+            return runtime
+
+        candidates = [runtime for runtime in self.discover() if runtime.major >= required_major]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda runtime: (runtime.major != required_major, not runtime.is_64bit, runtime.major),
+        )
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import shlex
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+
+GC_PRESETS = ("auto", "g1", "zgc", "vanilla")
+
+MIN_HEAP_MB = 1024
+BASE_HEAP_MB = 2048
+HEAP_PER_MOD_MB = 24
+MAX_AUTO_HEAP_MB = 12288
+OS_RESERVE_MB = 2048
+FALLBACK_SYSTEM_MB = 8192
+HEAVY_PROFILE_MODS = 120
+HEAVY_PROFILE_HEAP_MB = 6144
+
+G1_ARGS = (
+    "-XX:+UseG1GC",
+    "-XX:+ParallelRefProcEnabled",
+    "-XX:MaxGCPauseMillis=130",
+    "-XX:+UnlockExperimentalVMOptions",
+    "-XX:+DisableExplicitGC",
+    "-XX:G1NewSizePercent=30",
+    "-XX:G1MaxNewSizePercent=40",
+    "-XX:G1HeapRegionSize=16M",
+    "-XX:G1ReservePercent=20",
+    "-XX:MaxTenuringThreshold=1",
+)
+ZGC_ARGS = (
+    "-XX:+UseZGC",
+    "-XX:+DisableExplicitGC",
+)
+
+
+@dataclass
+class JvmSettings:
+    preset: str = "auto"
+    heap_mb: int = 0
+    extra_args: str = ""
+    class_data_sharing: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "JvmSettings":
+        if not isinstance(data, dict):
+            return cls()
+        preset = str(data.get("preset", "auto"))
+        try:
+            heap_mb = max(int(data.get("heap_mb", 0)), 0)
+        except (TypeError, ValueError):
+            heap_mb = 0
+        return cls(
+            preset=preset if preset in GC_PRESETS else "auto",
+            heap_mb=heap_mb,
+            extra_args=str(data.get("extra_args", "")),
+            class_data_sharing=bool(data.get("class_data_sharing", False)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "preset": self.preset,
+            "heap_mb": self.heap_mb,
+            "extra_args": self.extra_args,
+            "class_data_sharing": self.class_data_sharing,
+        }
+
+
+@dataclass(frozen=True)
+class JvmPlan:
+    heap_mb: int
+    gc: str
+    arguments: list[str]
+
+    @property
+    def summary(self) -> str:
+        return f"-Xmx{self.heap_mb}M {self.gc}"
+
+
+def system_memory_mb() -> int | None:
+    if sys.platform.startswith("win"):
+        class MemoryStatusEx(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(MemoryStatusEx)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return int(status.ullTotalPhys // (1024 * 1024))
+        return None
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024))
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def auto_heap_mb(mod_count: int, system_mb: int | None = None) -> int:
+    total = system_mb or FALLBACK_SYSTEM_MB
+    ceiling = min(MAX_AUTO_HEAP_MB, max(total - OS_RESERVE_MB, MIN_HEAP_MB), total * 6 // 10)
+    wanted = BASE_HEAP_MB + mod_count * HEAP_PER_MOD_MB
+    heap = min(wanted, max(ceiling, MIN_HEAP_MB))
+    return max(heap // 256 * 256, MIN_HEAP_MB)
+
+
+def choose_gc(preset: str, heap_mb: int, mod_count: int, java_major: int | None) -> str:
+    if preset == "vanilla":
+        return "vanilla"
+    if preset == "zgc":
+        if java_major is not None and java_major >= 17:
+            return "zgc"
+        return "g1"
+    if preset == "g1":
+        return "g1"
+    heavy = mod_count >= HEAVY_PROFILE_MODS or heap_mb >= HEAVY_PROFILE_HEAP_MB
+    if heavy and java_major is not None and java_major >= 21:
+        return "zgc"
+    return "g1"
+
+
+def gc_arguments(gc: str, java_major: int | None) -> list[str]:
+    if gc == "g1":
+        return list(G1_ARGS)
+    if gc == "zgc":
+        arguments = list(ZGC_ARGS)
+        if java_major is not None and 21 <= java_major < 23:
+            arguments.insert(1, "-XX:+ZGenerational")
+        return arguments
+    return []
+
+
+def plan_jvm(
+    settings: JvmSettings,
+    mod_count: int,
+    java_major: int | None = None,
+    system_mb: int | None = None,
+) -> JvmPlan:
+    if system_mb is None:
+        system_mb = system_memory_mb()
+    heap_mb = settings.heap_mb or auto_heap_mb(mod_count, system_mb)
+    gc = choose_gc(settings.preset, heap_mb, mod_count, java_major)
+    arguments = [f"-Xms{min(max(heap_mb // 2, MIN_HEAP_MB // 2), heap_mb)}M", f"-Xmx{heap_mb}M"]
+    arguments.extend(gc_arguments(gc, java_major))
+    try:
+        arguments.extend(shlex.split(settings.extra_args))
+    except ValueError as error:
+        raise ValueError(f"Invalid JVM arguments: {error}") from error
+    return JvmPlan(heap_mb=heap_mb, gc=gc.upper() if gc != "vanilla" else "default GC", arguments=arguments)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+ARCHIVE_SUFFIX = ".log.gz"
+PENDING_SUFFIX = ".log"
+RESOURCE_REPORT_SUFFIX = "-resources.json"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 2
+MAX_TERMS_PER_ARCHIVE = 4000
+ERROR_LINE = re.compile(r"ERROR|FATAL|Exception|Error:|Caused by|\tat ")
+TOKEN = re.compile(r"[a-z0-9_$]{3,}")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    max_count: int = 200
+    max_bytes: int = 200 * 1024 * 1024
+    max_age_days: int = 30
+
+
+@dataclass(frozen=True)
+class LogSearchHit:
+    archive: str
+    line_number: int
+    line: str
+
+
+def tokenize(text: str) -> set[str]:
+    return set(TOKEN.findall(text.lower()))
+
+
+class LogArchive:
+    def __init__(self, logs_dir: Path, policy: RetentionPolicy | None = None) -> None:
+        self.logs_dir = logs_dir
+        self.policy = policy or RetentionPolicy()
+        self.index_path = logs_dir / INDEX_NAME
+        self.lock = threading.Lock()
+        self.archives: dict[str, dict[str, Any]] = {}
+        self.postings: dict[str, set[str]] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        for name, entry in data.get("archives", {}).items():
+            if isinstance(entry, dict):
+                self._register(name, entry)
+
+    def _register(self, name: str, entry: dict[str, Any]) -> None:
+        self.archives[name] = entry
+        for term in entry.get("terms", []):
+            self.postings.setdefault(term, set()).add(name)
+
+    def _unregister(self, name: str) -> None:
+        entry = self.archives.pop(name, None)
+        if not entry:
+            return
+        for term in entry.get("terms", []):
+            names = self.postings.get(term)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self.postings[term]
+
+    def _save_index(self) -> None:
+        data = {"version": INDEX_VERSION, "archives": self.archives}
+        temporary = self.index_path.with_name(f"{INDEX_NAME}.tmp")
+        temporary.write_text(json.dumps(data), encoding="utf-8")
+        temporary.replace(self.index_path)
+
+    def add(self, source: Path) -> Path | None:
+        if not source.exists():
+            return None
+        archive = source.with_name(f"{source.name}.gz")
+        try:
+            with source.open("rb") as raw, gzip.open(archive, "wb") as target:
+                entry = self._scan(self._copy_lines(raw, target))
+            source.unlink()
+        except OSError as error:
+            print(f"[LOGS] Failed to archive {source.name}: {error}")
+            return None
+
+        entry.update(self._stat_entry(archive))
+        with self.lock:
+            self._register(archive.name, entry)
+            self._enforce_retention()
+            self._save_index()
+        return archive
+
+    def index_existing(self, archive: Path) -> None:
+        try:
+            with gzip.open(archive, "rt", encoding="utf-8", errors="replace") as file:
+                entry = self._scan(file)
+            entry.update(self._stat_entry(archive))
+        except (OSError, EOFError) as error:
+            print(f"[LOGS] Failed to index {archive.name}: {error}")
+            return
+        with self.lock:
+            self._register(archive.name, entry)
+
+    @staticmethod
+    def _copy_lines(raw, target) -> Iterator[str]:
+        for line in raw:
+            target.write(line)
+            yield line.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _scan(lines: Iterable[str]) -> dict[str, Any]:
+        terms: set[str] = set()
+        capped = False
+        error_lines = 0
+        line_count = 0
+        for text in lines:
+            line_count += 1
+            if ERROR_LINE.search(text):
+                error_lines += 1
+                if not capped:
+                    terms.update(tokenize(text))
+                    capped = len(terms) >= MAX_TERMS_PER_ARCHIVE
+        # A capped archive is missing terms from its later lines, so searches always scan it in full.
+        entry: dict[str, Any] = {"lines": line_count, "error_lines": error_lines, "terms": sorted(terms)}
+        if capped:
+            entry["capped"] = True
+        return entry
+
+    @staticmethod
+    def _stat_entry(archive: Path) -> dict[str, Any]:
+        stat = archive.stat()
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def reconcile(self) -> None:
+        for pending in sorted(self.logs_dir.glob(f"*{PENDING_SUFFIX}")):
+            self.add(pending)
+        on_disk = {path.name: path for path in self.logs_dir.glob(f"*{ARCHIVE_SUFFIX}")}
+        with self.lock:
+            for name in set(self.archives) - set(on_disk):
+                self._unregister(name)
+            missing = [path for name, path in on_disk.items() if name not in self.archives]
+        for archive in missing:
+            self.index_existing(archive)
+        with self.lock:
+            self._enforce_retention()
+            self._save_index()
+
+    def _enforce_retention(self) -> None:
+        ordered = sorted(self.archives.items(), key=lambda item: item[1].get("mtime", 0), reverse=True)
+        cutoff = time.time() - self.policy.max_age_days * 86400
+        kept = 0
+        total = 0
+        for name, entry in ordered:
+            size = int(entry.get("size", 0))
+            expired = entry.get("mtime", 0) < cutoff
+            if expired or kept >= self.policy.max_count or total + size > self.policy.max_bytes:
+                (self.logs_dir / name).unlink(missing_ok=True)
+                self._unregister(name)
+                continue
+            kept += 1
+            total += size
+        self._prune_resource_reports(cutoff)
+
+    def _prune_resource_reports(self, cutoff: float) -> None:
+        reports = []
+        for path in self.logs_dir.glob(f"*{RESOURCE_REPORT_SUFFIX}"):
+            try:
+                reports.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        reports.sort(reverse=True)
+        for index, (mtime, path) in enumerate(reports):
+            if mtime < cutoff or index >= self.policy.max_count:
+                path.unlink(missing_ok=True)
+
+    def candidates(self, query: str) -> list[str]:
+        tokens = tokenize(query)
+        with self.lock:
+            matches = set(self.archives)
+            for token in tokens:
+                names = set(self.postings.get(token, ()))
+                # Search matches substrings, so a query token may be only part of an indexed term.
+                for term, archives in self.postings.items():
+                    if token in term:
+                        names |= archives
+                matches &= names
+            capped = {name for name, entry in self.archives.items() if entry.get("capped")}
+            return sorted(matches | capped, key=lambda name: self.archives[name].get("mtime", 0), reverse=True)
+
+    def search(self, query: str, limit: int = 200) -> list[LogSearchHit]:
+        needle = query.strip().lower()
+        hits: list[LogSearchHit] = []
+        if not needle:
+            return hits
+        for name in self.candidates(query):
+            try:
+                with gzip.open(self.logs_dir / name, "rt", encoding="utf-8", errors="replace") as file:
+                    for line_number, line in enumerate(file, start=1):
+                        if needle in line.lower():
+                            hits.append(LogSearchHit(name, line_number, line.rstrip("\r\n")))
+                            if len(hits) >= limit:
+                                return hits
+            except (OSError, EOFError) as error:
+                print(f"[LOGS] Failed to search {name}: {error}")
+        return hits
+
+    def total_bytes(self) -> int:
+        with self.lock:
+            return sum(int(entry.get("size", 0)) for entry in self.archives.values())
@@ -1,26 +1,201 @@
 from __future__ import annotations
 
 import gzip
+import queue
 import shutil
+import threading
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
+from typing import Callable, IO
 
 
-def rotate_latest_log(logs_dir: Path) -> Path:
+GAME_READY_MARKERS = ("Sound engine started", "OpenAL initialized")
+RING_BUFFER_LINES = 5000
+FLUSH_INTERVAL = 0.5
+
+LogListener = Callable[[str], None]
+
+
+class LogRotator:
+    def __init__(self, handler: Callable[[Path], object] | None = None) -> None:
+        self.handler = handler or compress_log
+        self.jobs: queue.Queue[Callable[[], object] | None] = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="log-rotator", daemon=True)
+        self.thread.start()
+
+    def submit(self, source: Path) -> None:
+        self.jobs.put(lambda: self.handler(source))
+
+    def submit_task(self, task: Callable[[], object]) -> None:
+        self.jobs.put(task)
+
+    def _run(self) -> None:
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except Exception as error:
+                print(f"[LOGS] Background log job failed: {error}")
+            finally:
+                self.jobs.task_done()
+
+    def join(self) -> None:
+        self.jobs.join()
+
+    def stop(self) -> None:
+        self.jobs.put(None)
+        self.thread.join()
+
+
+def compress_log(source: Path) -> Path | None:
+    archive = source.with_name(f"{source.name}.gz")
+    try:
+        with source.open("rb") as raw, gzip.open(archive, "wb") as target:
+            shutil.copyfileobj(raw, target)
+        source.unlink()
+    except OSError as error:
+        print(f"[LOGS] Failed to compress {source.name}: {error}")
+        return None
+    return archive
+
+
+def rotate_latest_log(logs_dir: Path, rotator: LogRotator | None = None, name: str = "latest.txt") -> Path:
     logs_dir.mkdir(exist_ok=True)
-    latest_log = logs_dir / "latest.txt"
+    latest_log = logs_dir / name
 
     if latest_log.exists():
         timestamp = time.strftime(
             "%Y-%m-%d-%H%M%S",
             time.localtime(latest_log.stat().st_mtime),
         )
-        archive = logs_dir / f"{timestamp}.log.gz"
+        pending = logs_dir / f"{timestamp}.log"
+        counter = 2
+        while pending.exists() or pending.with_name(f"{pending.name}.gz").exists():
+            pending = logs_dir / f"{timestamp}-{counter}.log"
+            counter += 1
         try:
-            with latest_log.open("rb") as source, gzip.open(archive, "wb") as target:
-                shutil.copyfileobj(source, target)
-            latest_log.unlink()
+            latest_log.replace(pending)
         except OSError as error:
             print(f"[LOGS] Failed to rotate latest log: {error}")
+            return latest_log
+        if rotator is not None:
+            rotator.submit(pending)
+        else:
+            compress_log(pending)
 
     return latest_log
+
+
+class LogRingBuffer:
+    def __init__(self, capacity: int = RING_BUFFER_LINES) -> None:
+        self.lines: deque[str] = deque(maxlen=capacity)
+        self.next_seq = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def append(self, line: str) -> None:
+        with self.condition:
+            self.lines.append(line)
+            self.next_seq += 1
+            self.condition.notify_all()
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def read_since(self, seq: int) -> tuple[int, list[str], int]:
+        with self.condition:
+            first_seq = self.next_seq - len(self.lines)
+            start = max(seq, first_seq)
+            lines = list(islice(self.lines, start - first_seq, None))
+            return self.next_seq, lines, start - seq
+
+    def wait(self, seq: int, timeout: float) -> bool:
+        with self.condition:
+            return self.condition.wait_for(lambda: self.next_seq > seq or self.closed, timeout)
+
+
+class GameLogPipeline:
+    def __init__(self, log_path: Path, capacity: int = RING_BUFFER_LINES) -> None:
+        self.log_path = log_path
+        self.buffer = LogRingBuffer(capacity)
+        self.listeners: list[LogListener] = []
+        self.reader: threading.Thread | None = None
+        self.writer: threading.Thread | None = None
+
+    def add_listener(self, listener: LogListener) -> None:
+        self.listeners.append(listener)
+
+    def start(self, stream: IO[bytes]) -> None:
+        self.writer = threading.Thread(target=self._write_loop, name="log-writer", daemon=True)
+        self.reader = threading.Thread(target=self._read_loop, args=(stream,), name="log-reader", daemon=True)
+        self.writer.start()
+        self.reader.start()
+
+    def _read_loop(self, stream: IO[bytes]) -> None:
+        try:
+            for raw in iter(stream.readline, b""):
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                self.buffer.append(line)
+                for listener in tuple(self.listeners):
+                    try:
+                        listener(line)
+                    except Exception as error:
+                        print(f"[LOGS] Listener failed: {error}")
+        finally:
+            stream.close()
+            self.buffer.close()
+
+    def _write_loop(self) -> None:
+        seq = 0
+        with self.log_path.open("w", encoding="utf-8") as file:
+            while True:
+                self.buffer.wait(seq, FLUSH_INTERVAL)
+                next_seq, lines, dropped = self.buffer.read_since(seq)
+                if dropped:
+                    file.write(f"[LAUNCHER] {dropped} log lines dropped while writing\n")
+                if lines:
+                    file.write("\n".join(lines))
+                    file.write("\n")
+                    file.flush()
+                seq = next_seq
+                if self.buffer.closed and seq == self.buffer.next_seq:
+                    return
+
+    def tail(self, since: int = 0) -> tuple[int, list[str]]:
+        next_seq, lines, _dropped = self.buffer.read_since(since)
+        return next_seq, lines
+
+    def wait_for_marker(
+        self,
+        process,
+        markers: tuple[str, ...] = GAME_READY_MARKERS,
+        timeout: float = 600.0,
+    ) -> float | None:
+        started = time.monotonic()
+        found = threading.Event()
+
+        def listener(line: str) -> None:
+            if not found.is_set() and any(marker in line for marker in markers):
+                found.set()
+
+        self.add_listener(listener)
+        try:
+            while time.monotonic() - started < timeout:
+                if found.wait(0.25):
+                    return time.monotonic() - started
+                if process.poll() is not None and self.buffer.closed:
+                    return None
+            return None
+        finally:
+            self.listeners.remove(listener)
+
+    def join(self, timeout: float | None = None) -> None:
+        for thread in (self.reader, self.writer):
+            if thread is not None:
+                thread.join(timeout)
@@ -5,8 +5,6 @@ import subprocess
 import uuid
 from pathlib import Path
 
-import minecraft_launcher_lib as mc
-
 from .constants import USERNAME_PATTERN
 
 
@@ -14,7 +12,19 @@ def valid_username(username: str) -> bool:
     return bool(re.fullmatch(USERNAME_PATTERN, username))
 
 
+def split_server_address(host: str, port: str = "") -> tuple[str, str]:
+    host = host.strip()
+    port = port.strip()
+    if ":" in host and not port:
+        split_host, split_port = host.rsplit(":", 1)
+        if split_port.isdigit():
+            return split_host, split_port
+    return host, port
+
+
 def installed_fabric_id(minecraft_dir: Path, minecraft_version: str) -> str | None:
+    import minecraft_launcher_lib as mc
+
     installed = mc.utils.get_installed_versions(str(minecraft_dir))
     matches: list[tuple[tuple[int, ...], str]] = []
 
@@ -38,6 +48,8 @@ def installed_fabric_id(minecraft_dir: Path, minecraft_version: str) -> str | No
 
 
 def install_fabric(minecraft_dir: Path, minecraft_version: str) -> None:
+    import minecraft_launcher_lib as mc
+
     mc.fabric.install_fabric(minecraft_version, str(minecraft_dir))
 
 
@@ -47,13 +59,24 @@ def build_launch_command(
     username: str,
     server_host: str = "",
     server_port: str = "",
+    jvm_arguments: list[str] | None = None,
+    java_executable: Path | None = None,
+    game_dir: Path | None = None,
 ) -> list[str]:
+    import minecraft_launcher_lib as mc
+
     player_uuid = uuid.uuid3(uuid.NAMESPACE_DNS, f"OfflinePlayer:{username}")
     settings = {
         "username": username,
         "uuid": str(player_uuid),
         "token": "offline",
     }
+    if jvm_arguments:
+        settings["jvmArguments"] = list(jvm_arguments)
+    if java_executable:
+        settings["executablePath"] = str(java_executable)
+    if game_dir is not None and game_dir != minecraft_dir:
+        settings["gameDirectory"] = str(game_dir)
     command = mc.command.get_minecraft_command(version_id, str(minecraft_dir), settings)
     if server_host.strip():
         command.extend(["--server", server_host.strip()])
@@ -62,12 +85,12 @@ def build_launch_command(
     return command
 
 
-def start_process(command: list[str], cwd: Path, log_file, hide_console: bool = True) -> subprocess.Popen:
+def start_process(command: list[str], cwd: Path, log_file=None, hide_console: bool = True) -> subprocess.Popen:
     creation_flags = subprocess.CREATE_NO_WINDOW if hide_console and hasattr(subprocess, "CREATE_NO_WINDOW") else 0
     return subprocess.Popen(
         command,
         cwd=str(cwd),
         creationflags=creation_flags,
-        stdout=log_file,
+        stdout=log_file if log_file is not None else subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )
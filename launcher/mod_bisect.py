@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .mod_metadata import ModMetadata
+
+
+CrashTest = Callable[[set[Path]], bool]
+StepCallback = Callable[["BisectStep"], None]
+
+
+class BisectCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class BisectStep:
+    number: int
+    tested: tuple[Path, ...]
+    remaining: int
+    crashed: bool | None = None
+
+
+@dataclass
+class BisectResult:
+    culprit: Path | None
+    message: str
+    steps: list[BisectStep] = field(default_factory=list)
+
+
+class DependencyGraph:
+    def __init__(self, mods: Iterable[ModMetadata]) -> None:
+        self.mods = {Path(mod.path): mod for mod in mods}
+        self.providers: dict[str, Path] = {}
+        for path, mod in self.mods.items():
+            for mod_id in (mod.mod_id, *mod.provides):
+                self.providers.setdefault(mod_id, path)
+
+    def dependencies(self, path: Path) -> set[Path]:
+        mod = self.mods.get(path)
+        if mod is None:
+            return set()
+        return {self.providers[mod_id] for mod_id in mod.depends if mod_id in self.providers} - {path}
+
+    def closure(self, paths: Iterable[Path]) -> set[Path]:
+        result: set[Path] = set()
+        stack = list(paths)
+        while stack:
+            path = stack.pop()
+            if path in result:
+                continue
+            result.add(path)
+            stack.extend(self.dependencies(path) - result)
+        return result
+
+    def topological(self, paths: Iterable[Path]) -> list[Path]:
+        wanted = sorted(set(paths), key=lambda path: path.name.lower())
+        ordered: list[Path] = []
+        visited: set[Path] = set()
+
+        def visit(path: Path, trail: set[Path]) -> None:
+            if path in visited or path in trail:
+                return
+            trail.add(path)
+            for dependency in sorted(self.dependencies(path), key=lambda item: item.name.lower()):
+                if dependency in wanted_set:
+                    visit(dependency, trail)
+            trail.discard(path)
+            visited.add(path)
+            ordered.append(path)
+
+        wanted_set = set(wanted)
+        for path in wanted:
+            visit(path, set())
+        return ordered
+
+
+class ModBisector:
+    def __init__(self, mods: list[Path], graph: DependencyGraph, crashes: CrashTest) -> None:
+        self.mods = list(mods)
+        self.graph = graph
+        self.crashes = crashes
+
+    def run(self, on_step: StepCallback | None = None) -> BisectResult:
+        result = BisectResult(None, "")
+        candidates = self.graph.topological(self.mods)
+
+        def test(paths: set[Path]) -> bool:
+            step = BisectStep(len(result.steps) + 1, tuple(sorted(paths)), len(candidates))
+            if on_step:
+                on_step(step)
+            crashed = self.crashes(paths)
+            result.steps.append(BisectStep(step.number, step.tested, step.remaining, crashed))
+            return crashed
+
+        if not test(set(self.mods)):
+            result.message = "The profile starts without crashing, so there is nothing to bisect."
+            return result
+        if test(set()):
+            result.message = "Minecraft crashes even without any mods from this profile."
+            return result
+
+        while len(candidates) > 1:
+            tested = self.graph.closure(candidates[: len(candidates) // 2])
+            if test(tested):
+                remaining = [path for path in candidates if path in tested]
+            else:
+                remaining = [path for path in candidates if path not in tested]
+            if len(remaining) == len(candidates):
+                break
+            candidates = remaining
+
+        if len(candidates) == 1:
+            alone = self.graph.closure(candidates)
+            already_crashed = any(step.crashed and set(step.tested) == alone for step in result.steps)
+            if not already_crashed and not test(alone):
+                candidates = []
+
+        if len(candidates) != 1:
+            result.message = "No single mod reproduces the crash; it likely needs a combination of mods."
+            return result
+
+        culprit = candidates[0]
+        result.culprit = culprit
+        name = self.graph.mods[culprit].name if culprit in self.graph.mods else culprit.name
+        result.message = f"{name} ({culprit.name}) causes the crash ({len(result.steps)} launches)."
+        return result
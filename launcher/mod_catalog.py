@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from .modrinth import API_BASE, ModrinthProject, SearchPage, project_from_hit, search_hits
+
+
+CATALOG_SCHEMA_VERSION = 1
+SYNC_PAGE_SIZE = 100
+SYNC_REQUEST_DELAY = 0.25
+SYNC_INTERVAL = 6 * 60 * 60
+FULL_RESYNC_INTERVAL = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    icon_url TEXT NOT NULL,
+    downloads INTEGER NOT NULL,
+    date_modified TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS project_versions (
+    game_version TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    PRIMARY KEY (game_version, project_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    game_version TEXT PRIMARY KEY,
+    newest_modified TEXT NOT NULL DEFAULT '',
+    synced_at REAL NOT NULL DEFAULT 0,
+    full_synced_at REAL NOT NULL DEFAULT 0,
+    crawl_offset INTEGER NOT NULL DEFAULT 0,
+    crawl_newest TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS crawl_seen (
+    game_version TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    PRIMARY KEY (game_version, project_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS projects_downloads ON projects (downloads DESC);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+    title, slug, description, content='projects', content_rowid='rowid', tokenize='unicode61'
+);
+"""
+
+
+@dataclass(frozen=True)
+class CatalogSyncResult:
+    game_version: str
+    full: bool
+    projects: int
+    requests: int
+    complete: bool
+
+    @property
+    def summary(self) -> str:
+        mode = "full" if self.full else "incremental"
+        state = "done" if self.complete else "interrupted"
+        return f"{self.game_version}: {mode} sync {state}, {self.projects} projects in {self.requests} requests"
+
+
+class ModCatalog:
+    def __init__(
+        self,
+        path: Path,
+        api_base: str = API_BASE,
+        request_delay: float = SYNC_REQUEST_DELAY,
+    ) -> None:
+        self.path = path
+        self.api_base = api_base
+        self.request_delay = request_delay
+        self.lock = threading.RLock()
+        self.connection: sqlite3.Connection | None = None
+        self.fts = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is not None:
+            return self.connection
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != CATALOG_SCHEMA_VERSION:
+            for table in ("projects_fts", "crawl_seen", "sync_state", "project_versions", "projects"):
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            connection.execute(f"PRAGMA user_version={CATALOG_SCHEMA_VERSION}")
+        connection.executescript(SCHEMA)
+        try:
+            connection.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError as error:
+            print(f"[CATALOG] Full-text search unavailable, using substring search: {error}")
+        connection.commit()
+        self.connection = connection
+        return connection
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def has_version(self, game_version: str) -> bool:
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT full_synced_at FROM sync_state WHERE game_version = ?",
+                (game_version,),
+            ).fetchone()
+        return bool(row and row[0])
+
+    def needs_sync(self, game_version: str, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT synced_at, crawl_offset FROM sync_state WHERE game_version = ?",
+                (game_version,),
+            ).fetchone()
+        return row is None or bool(row[1]) or now - row[0] >= SYNC_INTERVAL
+
+    def search(self, query: str, game_version: str, page: int = 0, page_size: int = 12) -> SearchPage:
+        tokens = [token for token in "".join(c if c.isalnum() else " " for c in query.lower()).split() if token]
+        where = "v.game_version = ?"
+        params: list[object] = [game_version]
+        if tokens and self.fts:
+            where += " AND p.rowid IN (SELECT rowid FROM projects_fts WHERE projects_fts MATCH ?)"
+            params.append(" ".join(f'"{token}"*' for token in tokens))
+        elif tokens:
+            for token in tokens:
+                where += " AND (p.title LIKE ? OR p.slug LIKE ? OR p.description LIKE ?)"
+                params.extend([f"%{token}%"] * 3)
+
+        with self.lock:
+            connection = self._connect()
+            total = connection.execute(
+                f"SELECT COUNT(*) FROM projects p JOIN project_versions v USING (project_id) WHERE {where}",
+                params,
+            ).fetchone()[0]
+            rows = connection.execute(
+                "SELECT p.project_id, p.slug, p.title, p.description, p.icon_url, p.downloads "
+                f"FROM projects p JOIN project_versions v USING (project_id) WHERE {where} "
+                "ORDER BY p.downloads DESC, p.title LIMIT ? OFFSET ?",
+                [*params, page_size, page * page_size],
+            ).fetchall()
+        projects = tuple(ModrinthProject(*row) for row in rows)
+        return SearchPage(query, game_version, page, projects, int(total), page_size)
+
+    def sync(
+        self,
+        game_version: str,
+        should_stop: Callable[[], bool] | None = None,
+        now: float | None = None,
+    ) -> CatalogSyncResult:
+        now = time.time() if now is None else now
+        with self.lock:
+            connection = self._connect()
+            connection.execute("INSERT OR IGNORE INTO sync_state (game_version) VALUES (?)", (game_version,))
+            newest, full_synced_at, offset, crawl_newest = connection.execute(
+                "SELECT newest_modified, full_synced_at, crawl_offset, crawl_newest FROM sync_state "
+                "WHERE game_version = ?",
+                (game_version,),
+            ).fetchone()
+            connection.commit()
+
+        full = not newest or bool(offset) or now - full_synced_at >= FULL_RESYNC_INTERVAL
+        if not full:
+            offset = 0
+            crawl_newest = newest
+        elif not offset:
+            crawl_newest = ""
+            with self.lock:
+                self.connection.execute("DELETE FROM crawl_seen WHERE game_version = ?", (game_version,))
+                self.connection.commit()
+
+        projects = 0
+        requests = 0
+        complete = False
+        while True:
+            if should_stop is not None and should_stop():
+                break
+            if requests and self.request_delay:
+                time.sleep(self.request_delay)
+            data = search_hits("", game_version, offset, SYNC_PAGE_SIZE, index="updated", api_base=self.api_base)
+            requests += 1
+            hits = [hit for hit in data.get("hits", []) if hit.get("project_id")]
+            modified = [str(hit.get("date_modified", "")) for hit in hits]
+            reached_known = False
+            if full:
+                crawl_newest = crawl_newest or max(modified, default="")
+            else:
+                reached_known = any(date < newest for date in modified)
+                hits = [hit for hit, date in zip(hits, modified) if date >= newest]
+                crawl_newest = max([crawl_newest, *modified])
+            offset += SYNC_PAGE_SIZE
+            exhausted = not data.get("hits") or offset >= int(data.get("total_hits", 0))
+            complete = exhausted or reached_known
+            with self.lock:
+                self._store_hits(game_version, hits, full)
+                self.connection.execute(
+                    "UPDATE sync_state SET crawl_offset = ?, crawl_newest = ? WHERE game_version = ?",
+                    (0 if complete or not full else offset, crawl_newest if full else "", game_version),
+                )
+                self.connection.commit()
+            projects += len(hits)
+            if complete:
+                break
+
+        if complete:
+            with self.lock:
+                if full:
+                    self._drop_unseen(game_version)
+                self.connection.execute(
+                    "UPDATE sync_state SET newest_modified = ?, synced_at = ?, "
+                    "full_synced_at = CASE WHEN ? THEN ? ELSE full_synced_at END WHERE game_version = ?",
+                    (max(newest, crawl_newest), now, full, now, game_version),
+                )
+                self.connection.commit()
+        return CatalogSyncResult(game_version, full, projects, requests, complete)
+
+    def _store_hits(self, game_version: str, hits: list[dict], full: bool) -> None:
+        connection = self.connection
+        for hit in hits:
+            project = project_from_hit(hit)
+            modified = str(hit.get("date_modified", ""))
+            row = connection.execute(
+                "SELECT rowid, title, slug, description FROM projects WHERE project_id = ?",
+                (project.project_id,),
+            ).fetchone()
+            if row is not None and self.fts:
+                connection.execute(
+                    "INSERT INTO projects_fts (projects_fts, rowid, title, slug, description) "
+                    "VALUES ('delete', ?, ?, ?, ?)",
+                    row,
+                )
+            connection.execute(
+                "INSERT INTO projects (project_id, slug, title, description, icon_url, downloads, date_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (project_id) DO UPDATE SET slug = excluded.slug, "
+                "title = excluded.title, description = excluded.description, icon_url = excluded.icon_url, "
+                "downloads = excluded.downloads, date_modified = excluded.date_modified",
+                (
+                    project.project_id,
+                    project.slug,
+                    project.title,
+                    project.description,
+                    project.icon_url,
+                    project.downloads,
+                    modified,
+                ),
+            )
+            if self.fts:
+                connection.execute(
+                    "INSERT INTO projects_fts (rowid, title, slug, description) "
+                    "SELECT rowid, title, slug, description FROM projects WHERE project_id = ?",
+                    (project.project_id,),
+                )
+            connection.execute(
+                "INSERT OR IGNORE INTO project_versions (game_version, project_id) VALUES (?, ?)",
+                (game_version, project.project_id),
+            )
+            if full:
+                connection.execute(
+                    "INSERT OR IGNORE INTO crawl_seen (game_version, project_id) VALUES (?, ?)",
+                    (game_version, project.project_id),
+                )
+
+    def _drop_unseen(self, game_version: str) -> None:
+        connection = self.connection
+        connection.execute(
+            "DELETE FROM project_versions WHERE game_version = ? AND project_id NOT IN "
+            "(SELECT project_id FROM crawl_seen WHERE game_version = ?)",
+            (game_version, game_version),
+        )
+        connection.execute("DELETE FROM crawl_seen WHERE game_version = ?", (game_version,))
+        orphans = connection.execute(
+            "SELECT rowid, title, slug, description FROM projects "
+            "WHERE project_id NOT IN (SELECT project_id FROM project_versions)"
+        ).fetchall()
+        for row in orphans:
+            if self.fts:
+                connection.execute(
+                    "INSERT INTO projects_fts (projects_fts, rowid, title, slug, description) "
+                    "VALUES ('delete', ?, ?, ?, ?)",
+                    row,
+                )
+            connection.execute("DELETE FROM projects WHERE rowid = ?", (row[0],))
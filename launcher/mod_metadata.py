@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import threading
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+
+FABRIC_MOD_JSON = "fabric.mod.json"
+CACHE_VERSION = 1
+MAX_PACKAGES = 400
+PLATFORM_MOD_IDS = frozenset({"minecraft", "java", "fabricloader", "fabric"})
+
+
+@dataclass(frozen=True)
+class ModMetadata:
+    path: str
+    mod_id: str
+    name: str
+    version: str = ""
+    depends: tuple[str, ...] = ()
+    provides: tuple[str, ...] = ()
+    mixins: tuple[str, ...] = ()
+    packages: tuple[str, ...] = ()
+
+    @property
+    def jar_name(self) -> str:
+        return Path(self.path).name
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ModMetadata":
+        return cls(
+            path=str(data.get("path", "")),
+            mod_id=str(data.get("mod_id", "")),
+            name=str(data.get("name", "")),
+            version=str(data.get("version", "")),
+            depends=tuple(data.get("depends", ())),
+            provides=tuple(data.get("provides", ())),
+            mixins=tuple(data.get("mixins", ())),
+            packages=tuple(data.get("packages", ())),
+        )
+
+
+def read_mod_metadata(path: Path) -> ModMetadata:
+    fallback_id = path.name.split(".jar")[0].lower()
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        data: dict[str, Any] = {}
+        if FABRIC_MOD_JSON in names:
+            try:
+                raw = archive.read(FABRIC_MOD_JSON).decode("utf-8", errors="replace")
+                loaded = json.loads(raw, strict=False)
+                data = loaded if isinstance(loaded, dict) else {}
+            except (ValueError, KeyError):
+                data = {}
+
+    packages: set[str] = set()
+    for name in names:
+        if not name.endswith(".class") or name.startswith("META-INF/"):
+            continue
+        parts = name.split("/")[:-1]
+        if parts:
+            packages.add(".".join(parts))
+        if len(packages) >= MAX_PACKAGES:
+            break
+
+    mixins = []
+    for entry in data.get("mixins", []) or []:
+        config = entry.get("config") if isinstance(entry, dict) else entry
+        if isinstance(config, str):
+            mixins.append(config)
+
+    depends = data.get("depends", {})
+    return ModMetadata(
+        path=str(path),
+        mod_id=str(data.get("id") or fallback_id),
+        name=str(data.get("name") or data.get("id") or path.stem),
+        version=str(data.get("version", "")),
+        depends=tuple(sorted(str(key) for key in depends)) if isinstance(depends, dict) else (),
+        provides=tuple(str(item) for item in data.get("provides", []) if isinstance(item, str)),
+        mixins=tuple(mixins),
+        packages=tuple(sorted(packages)),
+    )
+
+
+class ModMetadataIndex:
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict[str, Any]] = self._load()
+        self.dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        entries = data.get("mods", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {"version": CACHE_VERSION, "mods": self.entries}
+            self.dirty = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_name(f"{self.cache_path.name}.tmp")
+        temporary.write_text(json.dumps(data), encoding="utf-8")
+        temporary.replace(self.cache_path)
+
+    def get(self, path: Path) -> ModMetadata | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = str(path)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return ModMetadata.from_dict(entry["metadata"])
+
+        try:
+            metadata = read_mod_metadata(path)
+        except (OSError, zipfile.BadZipFile) as error:
+            print(f"[MODS] Failed to read metadata from {path.name}: {error}")
+            return None
+        with self.lock:
+            self.entries[key] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "metadata": asdict(metadata),
+            }
+            self.dirty = True
+        return metadata
+
+    def for_paths(self, paths: Iterable[Path]) -> list[ModMetadata]:
+        result = [metadata for path in paths if (metadata := self.get(path)) is not None]
+        try:
+            self.save()
+        except OSError as error:
+            print(f"[MODS] Failed to save metadata cache: {error}")
+        return result
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from .modrinth import SearchPage, search_page
+
+
+SEARCH_PAGE_SIZE = 12
+SEARCH_CACHE_SIZE = 128
+
+SearchKey = tuple[str, str, int]
+PageFetcher = Callable[[str, str, int, int], SearchPage]
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class SearchCache:
+    def __init__(
+        self,
+        capacity: int = SEARCH_CACHE_SIZE,
+        page_size: int = SEARCH_PAGE_SIZE,
+        fetcher: PageFetcher = search_page,
+    ) -> None:
+        self.capacity = capacity
+        self.page_size = page_size
+        self.fetcher = fetcher
+        self.lock = threading.Lock()
+        self.pages: OrderedDict[SearchKey, SearchPage] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(query: str, game_version: str, page: int) -> SearchKey:
+        return normalize_query(query), game_version, page
+
+    def __contains__(self, key: SearchKey) -> bool:
+        with self.lock:
+            return key in self.pages
+
+    def get(self, query: str, game_version: str, page: int) -> SearchPage | None:
+        key = self.key(query, game_version, page)
+        with self.lock:
+            result = self.pages.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.pages.move_to_end(key)
+            return result
+
+    def put(self, result: SearchPage) -> None:
+        key = self.key(result.query, result.game_version, result.page)
+        with self.lock:
+            self.pages[key] = result
+            self.pages.move_to_end(key)
+            while len(self.pages) > self.capacity:
+                self.pages.popitem(last=False)
+
+    def fetch(self, query: str, game_version: str, page: int) -> SearchPage:
+        cached = self.get(query, game_version, page)
+        if cached is not None:
+            return cached
+        result = self.fetcher(normalize_query(query), game_version, page, self.page_size)
+        self.put(result)
+        return result
+
+    def clear(self) -> None:
+        with self.lock:
+            self.pages.clear()
@@ -28,7 +28,44 @@ def request_json(url: str):
         return json.loads(response.read().decode("utf-8"))
 
 
-def search_mods(query: str, game_version: str, limit: int = 12) -> list[ModrinthProject]:
+@dataclass(frozen=True)
+class SearchPage:
+    query: str
+    game_version: str
+    page: int
+    projects: tuple[ModrinthProject, ...]
+    total_hits: int
+    page_size: int
+
+    @property
+    def has_more(self) -> bool:
+        return (self.page + 1) * self.page_size < self.total_hits
+
+
+def search_mods(query: str, game_version: str, limit: int = 12, offset: int = 0) -> list[ModrinthProject]:
+    return [project_from_hit(hit) for hit in search_hits(query, game_version, offset, limit).get("hits", [])]
+
+
+def search_page(
+    query: str,
+    game_version: str,
+    page: int = 0,
+    page_size: int = 12,
+    api_base: str = API_BASE,
+) -> SearchPage:
+    data = search_hits(query, game_version, page * page_size, page_size, api_base=api_base)
+    projects = tuple(project_from_hit(hit) for hit in data.get("hits", []))
+    return SearchPage(query, game_version, page, projects, int(data.get("total_hits", 0)), page_size)
+
+
+def search_hits(
+    query: str,
+    game_version: str,
+    offset: int = 0,
+    limit: int = 12,
+    index: str = "downloads",
+    api_base: str = API_BASE,
+) -> dict:
     facets = json.dumps(
         [
             ["project_type:mod"],
@@ -41,24 +78,23 @@ def search_mods(query: str, game_version: str, limit: int = 12) -> list[Modrinth
         {
             "query": query,
             "facets": facets,
-            "index": "downloads",
+            "index": index,
             "limit": limit,
+            "offset": offset,
         }
     )
-    data = request_json(f"{API_BASE}/search?{params}")
-    projects: list[ModrinthProject] = []
-    for hit in data.get("hits", []):
-        projects.append(
-            ModrinthProject(
-                project_id=str(hit.get("project_id", "")),
-                slug=str(hit.get("slug", "")),
-                title=str(hit.get("title", "")),
-                description=str(hit.get("description", "")),
-                icon_url=str(hit.get("icon_url") or ""),
-                downloads=int(hit.get("downloads", 0)),
-            )
-        )
-    return projects
+    return request_json(f"{api_base}/search?{params}")
+
+
+def project_from_hit(hit: dict) -> ModrinthProject:
+    return ModrinthProject(
+        project_id=str(hit.get("project_id", "")),
+        slug=str(hit.get("slug", "")),
+        title=str(hit.get("title", "")),
+        description=str(hit.get("description", "")),
+        icon_url=str(hit.get("icon_url") or ""),
+        downloads=int(hit.get("downloads", 0)),
+    )
 
 
 def latest_primary_file(project_id: str, game_version: str) -> dict:
@@ -5,7 +5,8 @@ from pathlib import Path
 
 MOD_SUFFIXES = (".jar", ".mrpack")
 DISABLED_SUFFIX = ".disabled"
-TEMP_PREFIX = "tmp_el_"
+# Prefix of the jar copies staged by launcher versions before the staging journal.
+LEGACY_TEMP_PREFIX = "tmp_el_"
 
 
 def is_mod_file(path: Path) -> bool:
@@ -24,30 +24,46 @@ def bundled_path(relative_path: str) -> Path:
 class LauncherPaths:
     root: Path
     minecraft: Path
+    instances: Path
     config: Path
     profiles: Path
     mods: Path
     temp_mods: Path
+    staging_journal: Path
     logs: Path
+    launch_history: Path
+    startup_report: Path
     cache: Path
     modrinth_icons: Path
+    mod_catalog: Path
+    java_runtimes: Path
+    cds: Path
+    mod_metadata: Path
     icon: Path
     steve_skin: Path
 
     @classmethod
-    def create(cls) -> "LauncherPaths":
-        root = project_root()
+    def create(cls, root: Path | None = None) -> "LauncherPaths":
+        root = root or project_root()
         mods = root / "mods"
         return cls(
             root=root,
             minecraft=root / ".minecraft",
+            instances=root / "instances",
             config=root / "launcher_config.json",
             profiles=root / "profiles",
             mods=mods,
             temp_mods=mods / "temp-mods",
+            staging_journal=mods / "staging.journal",
             logs=root / "logs",
+            launch_history=root / "logs" / "launches",
+            startup_report=root / "logs" / "startup.json",
             cache=root / "cache",
             modrinth_icons=root / "cache" / "modrinth-icons",
+            mod_catalog=root / "cache" / "modrinth-catalog.sqlite3",
+            java_runtimes=root / "cache" / "java-runtimes.json",
+            cds=root / "cache" / "cds",
+            mod_metadata=root / "cache" / "mod-metadata.json",
             icon=bundled_path("assets/icon.ico"),
             steve_skin=bundled_path("assets/steve_skin.png"),
         )
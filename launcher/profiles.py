@@ -3,12 +3,15 @@ from __future__ import annotations
 import json
 import re
 import shutil
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .constants import SUPPORTED_VERSIONS
-from .mods import DISABLED_SUFFIX, MOD_SUFFIXES, TEMP_PREFIX, is_mod_file
+from .jvm import JvmSettings
+from .mods import DISABLED_SUFFIX, LEGACY_TEMP_PREFIX, MOD_SUFFIXES, is_mod_file
+from .staging import StagingEntry, StagingJournal, link_or_copy, move_replacing
 
 
 DEFAULT_PROFILE_ID = "default"
@@ -21,6 +24,8 @@ class Profile:
     version: str
     icon: str = ""
     mods: dict[str, dict[str, Any]] = field(default_factory=dict)
+    jvm: JvmSettings = field(default_factory=JvmSettings)
+    java_runtime: str = ""
 
 
 @dataclass(frozen=True)
@@ -34,6 +39,22 @@ class ProfileMod:
     source: str = "custom"
 
 
+@dataclass
+class BulkModResult:
+    changed: list[Path] = field(default_factory=list)
+    skipped: list[ProfileMod] = field(default_factory=list)
+    failed: list[tuple[ProfileMod | Path, str]] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        parts = [f"{len(self.changed)} changed"]
+        if self.skipped:
+            parts.append(f"{len(self.skipped)} inherited skipped")
+        if self.failed:
+            parts.append(f"{len(self.failed)} failed")
+        return ", ".join(parts)
+
+
 @dataclass
 class QuickPlaySlot:
     index: int
@@ -52,6 +73,10 @@ def enabled_filename(path: Path) -> str:
     return path.name.removesuffix(DISABLED_SUFFIX)
 
 
+def mod_key(path: Path) -> Path:
+    return path.with_name(enabled_filename(path))
+
+
 def display_name(path: Path, metadata: dict[str, Any] | None = None) -> str:
     if metadata and metadata.get("title"):
         return str(metadata["title"])
@@ -59,10 +84,14 @@ def display_name(path: Path, metadata: dict[str, Any] | None = None) -> str:
 
 
 class ProfileStore:
-    def __init__(self, profiles_root: Path, temp_mods: Path, root: Path) -> None:
+    def __init__(self, profiles_root: Path, temp_mods: Path, root: Path, journal_path: Path | None = None) -> None:
         self.profiles_root = profiles_root
         self.temp_mods = temp_mods
         self.root = root
+        self.journal = StagingJournal(journal_path or temp_mods.parent / "staging.journal")
+        self.mod_cache: dict[str, tuple[tuple[int, int], list[ProfileMod]]] = {}
+        self.live = False
+        self.staging_lock = threading.RLock()
         self.profiles_root.mkdir(parents=True, exist_ok=True)
         self.temp_mods.mkdir(parents=True, exist_ok=True)
         self.ensure_default_profile()
@@ -103,6 +132,8 @@ class ProfileStore:
             version=str(data.get("version", SUPPORTED_VERSIONS[-2])),
             icon=str(data.get("icon", "")),
             mods=dict(data.get("mods", {})),
+            jvm=JvmSettings.from_dict(data.get("jvm")),
+            java_runtime=str(data.get("java_runtime", "")),
         )
 
     def save_profile(self, profile: Profile) -> None:
@@ -115,11 +146,35 @@ class ProfileStore:
             "version": profile.version,
             "icon": profile.icon,
             "mods": profile.mods,
+            "jvm": profile.jvm.to_dict(),
+            "java_runtime": profile.java_runtime,
         }
         self.profile_config_path(profile.id).write_text(
             json.dumps(data, indent=4),
             encoding="utf-8",
         )
+        self.invalidate(profile.id)
+
+    def invalidate(self, profile_id: str | None = None) -> None:
+        if profile_id is None:
+            self.mod_cache.clear()
+        else:
+            self.mod_cache.pop(profile_id, None)
+
+    def apply_changes(self, paths: Iterable[Path]) -> set[str]:
+        changed: set[str] = set()
+        for path in paths:
+            try:
+                parts = path.relative_to(self.profiles_root).parts
+            except ValueError:
+                continue
+            if not parts:
+                self.invalidate()
+                return {profile_dir.name for profile_dir in self.profiles_root.iterdir() if profile_dir.is_dir()}
+            changed.add(parts[0])
+        for profile_id in changed:
+            self.invalidate(profile_id)
+        return changed
 
     def list_profiles(self) -> list[Profile]:
         profiles = []
@@ -152,6 +207,8 @@ class ProfileStore:
         name: str | None = None,
         version: str | None = None,
         icon: str | None = None,
+        jvm: JvmSettings | None = None,
+        java_runtime: str | None = None,
     ) -> Profile:
         profile = self.load_profile(profile_id)
         if name is not None:
@@ -160,23 +217,44 @@ class ProfileStore:
             profile.version = version
         if icon is not None:
             profile.icon = icon
+        if jvm is not None:
+            profile.jvm = jvm
+        if java_runtime is not None:
+            profile.java_runtime = java_runtime
         self.save_profile(profile)
         return profile
 
     def add_custom_mod(self, profile_id: str, source: Path) -> Path:
         if source.suffix.lower() not in MOD_SUFFIXES:
             raise ValueError("Only .jar and .mrpack files are supported.")
+        result = self.add_custom_mods(profile_id, [source])
+        if result.failed:
+            raise OSError(result.failed[0][1])
+        return result.changed[0]
+
+    def add_custom_mods(self, profile_id: str, sources: Iterable[Path]) -> BulkModResult:
+        result = BulkModResult()
         profile = self.load_profile(profile_id)
-        target = self.mods_dir(profile_id) / source.name
-        shutil.copy2(source, target)
-        key = enabled_filename(target)
-        profile.mods[key] = {
-            "title": source.stem,
-            "source": "custom",
-            "icon": "",
-        }
-        self.save_profile(profile)
-        return target
+        mods_dir = self.mods_dir(profile_id)
+        for source in sources:
+            if source.suffix.lower() not in MOD_SUFFIXES:
+                result.failed.append((source, "Only .jar and .mrpack files are supported."))
+                continue
+            target = mods_dir / source.name
+            try:
+                shutil.copy2(source, target)
+            except OSError as error:
+                result.failed.append((source, str(error)))
+                continue
+            profile.mods[enabled_filename(target)] = {
+                "title": source.stem,
+                "source": "custom",
+                "icon": "",
+            }
+            result.changed.append(target)
+        if result.changed:
+            self.save_profile(profile)
+        return result
 
     def add_downloaded_mod(
         self,
@@ -216,20 +294,37 @@ class ProfileStore:
         return self.root / path
 
     def list_mods(self, profile_id: str) -> list[ProfileMod]:
-        profile = self.load_profile(profile_id)
-        own = self._list_profile_mods(profile, inherited=False, source_profile=profile.name)
-        if profile.id == DEFAULT_PROFILE_ID:
-            return own
+        own = self._cached_profile_mods(profile_id)
+        if profile_id == DEFAULT_PROFILE_ID:
+            return list(own)
 
         own_names = {mod.name.lower() for mod in own}
-        default = self.load_profile(DEFAULT_PROFILE_ID)
         inherited = [
-            mod
-            for mod in self._list_profile_mods(default, inherited=True, source_profile=default.name)
+            replace(mod, inherited=True)
+            for mod in self._cached_profile_mods(DEFAULT_PROFILE_ID)
             if mod.name.lower() not in own_names
         ]
         return inherited + own
 
+    def _cached_profile_mods(self, profile_id: str) -> list[ProfileMod]:
+        cached = self.mod_cache.get(profile_id)
+        if cached is not None and self.live:
+            return cached[1]
+        stamp = self._mods_stamp(profile_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        profile = self.load_profile(profile_id)
+        mods = self._list_profile_mods(profile, inherited=False, source_profile=profile.name)
+        self.mod_cache[profile_id] = (stamp, mods)
+        return mods
+
+    def _mods_stamp(self, profile_id: str) -> tuple[int, int]:
+        try:
+            config_mtime = self.profile_config_path(profile_id).stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Profile does not exist: {profile_id}") from None
+        return config_mtime, self.mods_dir(profile_id).stat().st_mtime_ns
+
     def _list_profile_mods(self, profile: Profile, inherited: bool, source_profile: str) -> list[ProfileMod]:
         entries: list[ProfileMod] = []
         for path in sorted(self.mods_dir(profile.id).iterdir(), key=lambda item: item.name.lower()):
@@ -254,45 +349,174 @@ class ProfileStore:
     def toggle_mod(self, mod: ProfileMod, enable: bool) -> None:
         if mod.inherited:
             raise PermissionError("This mod is inherited from Default. Edit it in the Default profile.")
-        if enable and mod.path.name.endswith(DISABLED_SUFFIX):
-            mod.path.rename(mod.path.with_name(mod.path.name.removesuffix(DISABLED_SUFFIX)))
-        elif not enable and not mod.path.name.endswith(DISABLED_SUFFIX):
-            mod.path.rename(mod.path.with_name(f"{mod.path.name}{DISABLED_SUFFIX}"))
-
-    def prepare_mods(self, profile_id: str, minecraft_dir: Path) -> None:
-        mc_mods = minecraft_dir / "mods"
-        mc_mods.mkdir(exist_ok=True)
-        self.temp_mods.mkdir(parents=True, exist_ok=True)
-
-        for suffix in MOD_SUFFIXES:
-            for path in mc_mods.glob(f"*{suffix}"):
-                target = self.temp_mods / path.name
-                if target.exists():
-                    target.unlink()
-                shutil.move(str(path), str(target))
-
-        copied: dict[str, Path] = {}
-        for mod in self.list_mods(profile_id):
-            if not mod.enabled:
+        result = self.set_mods_enabled([mod], enable)
+        if result.failed:
+            raise OSError(result.failed[0][1])
+
+    def set_mods_enabled(self, mods: Iterable[ProfileMod], enable: bool) -> BulkModResult:
+        result = BulkModResult()
+        touched: set[Path] = set()
+        for mod in mods:
+            if mod.inherited:
+                result.skipped.append(mod)
                 continue
-            target = mc_mods / f"{TEMP_PREFIX}{enabled_filename(mod.path)}"
-            if target.name in copied:
-                copied[target.name].unlink(missing_ok=True)
-            shutil.copy2(mod.path, target)
-            copied[target.name] = target
-
-    def restore_mods(self, minecraft_dir: Path) -> None:
+            if enable == mod.path.name.endswith(DISABLED_SUFFIX):
+                name = mod.path.name.removesuffix(DISABLED_SUFFIX) if enable else f"{mod.path.name}{DISABLED_SUFFIX}"
+                try:
+                    mod.path.rename(mod.path.with_name(name))
+                except OSError as error:
+                    result.failed.append((mod, str(error)))
+                    continue
+                result.changed.append(mod.path.with_name(name))
+                touched.add(mod.path.parent)
+        self._invalidate_dirs(touched)
+        return result
+
+    def remove_mods(self, mods: Iterable[ProfileMod]) -> BulkModResult:
+        result = BulkModResult()
+        removed: dict[str, list[str]] = {}
+        for mod in mods:
+            if mod.inherited:
+                result.skipped.append(mod)
+                continue
+            try:
+                mod.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as error:
+                result.failed.append((mod, str(error)))
+                continue
+            result.changed.append(mod.path)
+            removed.setdefault(mod.path.parent.parent.name, []).append(enabled_filename(mod.path))
+
+        for profile_id, keys in removed.items():
+            profile = self.load_profile(profile_id)
+            dropped = [profile.mods.pop(key, None) for key in keys]
+            if any(metadata is not None for metadata in dropped):
+                self.save_profile(profile)
+            self.invalidate(profile_id)
+        return result
+
+    def move_mods(self, mods: Iterable[ProfileMod], target_profile_id: str) -> BulkModResult:
+        result = BulkModResult()
+        target = self.load_profile(target_profile_id)
+        target_dir = self.mods_dir(target_profile_id)
+        sources: dict[str, Profile] = {}
+        for mod in mods:
+            source_id = mod.path.parent.parent.name
+            if mod.inherited or source_id == target_profile_id:
+                result.skipped.append(mod)
+                continue
+            destination = target_dir / mod.path.name
+            if destination.exists():
+                result.failed.append((mod, f"{destination.name} already exists in {target.name}."))
+                continue
+            try:
+                shutil.move(str(mod.path), str(destination))
+            except OSError as error:
+                result.failed.append((mod, str(error)))
+                continue
+            result.changed.append(destination)
+            source = sources.get(source_id) or sources.setdefault(source_id, self.load_profile(source_id))
+            metadata = source.mods.pop(enabled_filename(mod.path), None)
+            if metadata is not None:
+                target.mods[enabled_filename(destination)] = metadata
+
+        for source in sources.values():
+            self.save_profile(source)
+        if result.changed:
+            self.save_profile(target)
+        return result
+
+    def _invalidate_dirs(self, mod_dirs: set[Path]) -> None:
+        for mod_dir in mod_dirs:
+            self.invalidate(mod_dir.parent.name)
+
+    def parked_mods_dir(self, minecraft_dir: Path) -> Path:
+        if minecraft_dir.name == ".minecraft":
+            return self.temp_mods
+        return self.temp_mods / minecraft_dir.name
+
+    def prepare_mods(self, profile_id: str, minecraft_dir: Path, only: set[Path] | None = None) -> None:
         mc_mods = minecraft_dir / "mods"
-        mc_mods.mkdir(exist_ok=True)
-        self.temp_mods.mkdir(parents=True, exist_ok=True)
-
-        for suffix in MOD_SUFFIXES:
-            for path in mc_mods.glob(f"{TEMP_PREFIX}*{suffix}"):
-                path.unlink(missing_ok=True)
-
-        for suffix in MOD_SUFFIXES:
-            for path in self.temp_mods.glob(f"*{suffix}"):
+        with self.staging_lock:
+            self.recover_staging(minecraft_dir)
+            mc_mods.mkdir(parents=True, exist_ok=True)
+            parked_dir = self.parked_mods_dir(minecraft_dir)
+            parked_dir.mkdir(parents=True, exist_ok=True)
+
+            parked = [path.name for suffix in MOD_SUFFIXES for path in mc_mods.glob(f"*{suffix}")]
+            if parked:
+                self.journal.append(StagingEntry("park", mc_mods, tuple(parked), parked_dir))
+                for name in parked:
+                    move_replacing(mc_mods / name, parked_dir / name)
+
+            staged: dict[str, Path] = {}
+            for mod in self.list_mods(profile_id):
+                if mod.enabled and (only is None or mod.path in only):
+                    staged[enabled_filename(mod.path)] = mod.path
+            self.journal.append(StagingEntry("stage", mc_mods, tuple(staged)))
+            for name, source in staged.items():
+                link_or_copy(source, mc_mods / name)
+
+    def restore_mods(self, minecraft_dir: Path | None = None) -> int:
+        return self.recover_staging(minecraft_dir)
+
+    def recover_staging(self, minecraft_dir: Path | None = None) -> int:
+        with self.staging_lock:
+            entries = self.journal.entries()
+            kept: list[StagingEntry] = []
+            if minecraft_dir is not None:
+                mc_mods = minecraft_dir / "mods"
+                kept = [entry for entry in entries if entry.directory != mc_mods]
+                entries = [entry for entry in entries if entry.directory == mc_mods]
+                if not entries:
+                    return self.sweep_legacy_staging(minecraft_dir)
+            restored = self._roll_back(entries)
+            if kept:
+                self.journal.rewrite(kept)
+            elif self.journal.active:
+                self.journal.clear()
+            return restored
+
+    def sweep_legacy_staging(self, minecraft_dir: Path) -> int:
+        # Sessions from before the journal left tmp_el_ copies behind and parked the user's jars directly in
+        # temp-mods. Without a journal entry for this directory nothing else can be staged there, so clean up.
+        parked_dir = self.parked_mods_dir(minecraft_dir)
+        if parked_dir != self.temp_mods:
+            return 0
+        mc_mods = minecraft_dir / "mods"
+        with self.staging_lock:
+            if any(entry.directory == mc_mods for entry in self.journal.entries()):
+                return 0
+            for suffix in MOD_SUFFIXES:
+                for path in mc_mods.glob(f"{LEGACY_TEMP_PREFIX}*{suffix}"):
+                    path.unlink(missing_ok=True)
+            restored = 0
+            for path in [path for suffix in MOD_SUFFIXES for path in parked_dir.glob(f"*{suffix}")]:
                 target = mc_mods / path.name
                 if target.exists():
-                    target.unlink()
-                shutil.move(str(path), str(target))
+                    print(f"[STAGING] Leaving {path.name} in {parked_dir.name}, mods already has a file with that name")
+                    continue
+                mc_mods.mkdir(parents=True, exist_ok=True)
+                move_replacing(path, target)
+                restored += 1
+            if restored:
+                print(f"[STAGING] Returned {restored} mods parked by an older launcher session")
+            return restored
+
+    @staticmethod
+    def _roll_back(entries: list[StagingEntry]) -> int:
+        restored = 0
+        for entry in reversed(entries):
+            if entry.op == "stage":
+                for name in entry.names:
+                    (entry.directory / name).unlink(missing_ok=True)
+            elif entry.op == "park" and entry.parked is not None:
+                entry.directory.mkdir(parents=True, exist_ok=True)
+                for name in entry.names:
+                    parked = entry.parked / name
+                    if parked.exists():
+                        move_replacing(parked, entry.directory / name)
+                        restored += 1
+        return restored
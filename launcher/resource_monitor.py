@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import ctypes
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+
+SAMPLE_INTERVAL = 1.0
+HISTORY_SAMPLES = 600
+SAVED_SAMPLES = 300
+MIB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ProcessStats:
+    cpu_seconds: float
+    rss_bytes: int
+    threads: int
+    read_bytes: int
+    write_bytes: int
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    at: float
+    rss_bytes: int
+    cpu_percent: float
+    threads: int
+    read_bytes: int
+    write_bytes: int
+
+
+class ResourceBackend(Protocol):
+    name: str
+
+    def read(self, pid: int) -> ProcessStats | None: ...
+
+
+class ProcfsBackend:
+    name = "procfs"
+
+    def __init__(self, proc_root: Path = Path("/proc")) -> None:
+        self.proc_root = proc_root
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+
+    @staticmethod
+    def available() -> bool:
+        return Path("/proc/self/stat").exists()
+
+    def read(self, pid: int) -> ProcessStats | None:
+        folder = self.proc_root / str(pid)
+        try:
+            stat = (folder / "stat").read_bytes()
+        except OSError:
+            return None
+        # Fields after the parenthesised command name start at field 3 (state).
+        fields = stat[stat.rfind(b")") + 2 :].split()
+        if len(fields) < 22 or fields[0] == b"Z":
+            return None
+        read_bytes = write_bytes = 0
+        try:
+            for line in (folder / "io").read_bytes().splitlines():
+                key, _separator, value = line.partition(b":")
+                if key == b"read_bytes":
+                    read_bytes = int(value)
+                elif key == b"write_bytes":
+                    write_bytes = int(value)
+        except (OSError, ValueError):
+            pass
+        return ProcessStats(
+            cpu_seconds=(int(fields[11]) + int(fields[12])) / self.clock_ticks,
+            rss_bytes=int(fields[21]) * self.page_size,
+            threads=int(fields[17]),
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+        )
+
+
+class WindowsBackend:
+    name = "win32"
+
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    TH32CS_SNAPTHREAD = 0x00000004
+
+    def __init__(self) -> None:
+        from ctypes import wintypes
+
+        class MemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        class IoCounters(ctypes.Structure):
+            _fields_ = [
+                ("ReadOperationCount", ctypes.c_ulonglong),
+                ("WriteOperationCount", ctypes.c_ulonglong),
+                ("OtherOperationCount", ctypes.c_ulonglong),
+                ("ReadTransferCount", ctypes.c_ulonglong),
+                ("WriteTransferCount", ctypes.c_ulonglong),
+                ("OtherTransferCount", ctypes.c_ulonglong),
+            ]
+
+        class ThreadEntry32(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ThreadID", wintypes.DWORD),
+                ("th32OwnerProcessID", wintypes.DWORD),
+                ("tpBasePri", wintypes.LONG),
+                ("tpDeltaPri", wintypes.LONG),
+                ("dwFlags", wintypes.DWORD),
+            ]
+
+        self.wintypes = wintypes
+        self.MemoryCounters = MemoryCounters
+        self.IoCounters = IoCounters
+        self.ThreadEntry32 = ThreadEntry32
+        self.kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self.kernel32.OpenProcess.restype = wintypes.HANDLE
+        self.kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        self.kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self.psapi = ctypes.WinDLL("psapi", use_last_error=True)
+
+    @staticmethod
+    def available() -> bool:
+        return sys.platform == "win32"
+
+    def read(self, pid: int) -> ProcessStats | None:
+        wintypes = self.wintypes
+        handle = self.kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            created, exited, kernel, user = (wintypes.FILETIME() for _index in range(4))
+            if not self.kernel32.GetProcessTimes(
+                handle,
+                ctypes.byref(created),
+                ctypes.byref(exited),
+                ctypes.byref(kernel),
+                ctypes.byref(user),
+            ):
+                return None
+            memory = self.MemoryCounters()
+            memory.cb = ctypes.sizeof(memory)
+            if not self.psapi.GetProcessMemoryInfo(handle, ctypes.byref(memory), memory.cb):
+                return None
+            io = self.IoCounters()
+            self.kernel32.GetProcessIoCounters(handle, ctypes.byref(io))
+        finally:
+            self.kernel32.CloseHandle(handle)
+        ticks = sum((filetime.dwHighDateTime << 32) | filetime.dwLowDateTime for filetime in (kernel, user))
+        return ProcessStats(
+            cpu_seconds=ticks / 10_000_000,
+            rss_bytes=int(memory.WorkingSetSize),
+            threads=self._thread_count(pid),
+            read_bytes=int(io.ReadTransferCount),
+            write_bytes=int(io.WriteTransferCount),
+        )
+
+    def _thread_count(self, pid: int) -> int:
+        snapshot = self.kernel32.CreateToolhelp32Snapshot(self.TH32CS_SNAPTHREAD, 0)
+        if not snapshot or snapshot == ctypes.c_void_p(-1).value:
+            return 0
+        try:
+            entry = self.ThreadEntry32()
+            entry.dwSize = ctypes.sizeof(entry)
+            count = 0
+            found = self.kernel32.Thread32First(snapshot, ctypes.byref(entry))
+            while found:
+                count += entry.th32OwnerProcessID == pid
+                found = self.kernel32.Thread32Next(snapshot, ctypes.byref(entry))
+            return count
+        finally:
+            self.kernel32.CloseHandle(snapshot)
+
+
+def default_backend() -> ResourceBackend | None:
+    for backend in (ProcfsBackend, WindowsBackend):
+        if backend.available():
+            try:
+                return backend()
+            except (OSError, AttributeError, ValueError) as error:
+                print(f"[RESOURCES] {backend.name} sampler unavailable: {error}")
+    return None
+
+
+class SampleRing:
+    def __init__(self, capacity: int = HISTORY_SAMPLES) -> None:
+        self.capacity = capacity
+        self.at = array("d", bytes(8 * capacity))
+        self.cpu = array("f", bytes(4 * capacity))
+        self.rss = array("Q", bytes(8 * capacity))
+        self.read = array("Q", bytes(8 * capacity))
+        self.write = array("Q", bytes(8 * capacity))
+        self.threads = array("H", bytes(2 * capacity))
+        self.next = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, sample: ResourceSample) -> None:
+        index = self.next
+        self.at[index] = sample.at
+        self.cpu[index] = sample.cpu_percent
+        self.rss[index] = sample.rss_bytes
+        self.read[index] = sample.read_bytes
+        self.write[index] = sample.write_bytes
+        self.threads[index] = min(sample.threads, 0xFFFF)
+        self.next = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _sample(self, index: int) -> ResourceSample:
+        return ResourceSample(
+            self.at[index],
+            self.rss[index],
+            round(self.cpu[index], 1),
+            self.threads[index],
+            self.read[index],
+            self.write[index],
+        )
+
+    def latest(self) -> ResourceSample | None:
+        return self._sample((self.next - 1) % self.capacity) if self.count else None
+
+    def samples(self, limit: int | None = None) -> list[ResourceSample]:
+        count = self.count if limit is None else min(limit, self.count)
+        start = self.next - count
+        return [self._sample((start + offset) % self.capacity) for offset in range(count)]
+
+
+@dataclass
+class ResourceSummary:
+    pid: int
+    backend: str = ""
+    samples: int = 0
+    seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    avg_rss_bytes: int = 0
+    peak_cpu_percent: float = 0.0
+    avg_cpu_percent: float = 0.0
+    peak_threads: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+    @property
+    def summary(self) -> str:
+        if not self.samples:
+            return "no resource samples"
+        return (
+            f"RAM peak {self.peak_rss_bytes / MIB:.0f} MB (avg {self.avg_rss_bytes / MIB:.0f} MB), "
+            f"CPU avg {self.avg_cpu_percent:.0f}% (peak {self.peak_cpu_percent:.0f}%), "
+            f"{self.peak_threads} threads"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "backend": self.backend,
+            "samples": self.samples,
+            "seconds": round(self.seconds, 1),
+            "peak_rss_mb": round(self.peak_rss_bytes / MIB, 1),
+            "avg_rss_mb": round(self.avg_rss_bytes / MIB, 1),
+            "peak_cpu_percent": round(self.peak_cpu_percent, 1),
+            "avg_cpu_percent": round(self.avg_cpu_percent, 1),
+            "peak_threads": self.peak_threads,
+            "read_mb": round(self.read_bytes / MIB, 1),
+            "write_mb": round(self.write_bytes / MIB, 1),
+        }
+
+
+class TrackedProcess:
+    def __init__(self, pid: int, capacity: int) -> None:
+        self.pid = pid
+        self.ring = SampleRing(capacity)
+        self.started = time.monotonic()
+        self.last: ProcessStats | None = None
+        self.last_at = 0.0
+        self.first: ProcessStats | None = None
+        self.samples = 0
+        self.rss_total = 0
+        self.cpu_total = 0.0
+        self.peak_rss = 0
+        self.peak_cpu = 0.0
+        self.peak_threads = 0
+
+    def record(self, stats: ProcessStats, now: float, cpu_count: int) -> None:
+        cpu_percent = 0.0
+        if self.last is not None and now > self.last_at:
+            cpu_percent = max(stats.cpu_seconds - self.last.cpu_seconds, 0.0) / (now - self.last_at) * 100
+            cpu_percent = min(cpu_percent, 100.0 * cpu_count)
+        if self.first is None:
+            self.first = stats
+        self.last = stats
+        self.last_at = now
+        self.ring.append(
+            ResourceSample(
+                now - self.started,
+                stats.rss_bytes,
+                cpu_percent,
+                stats.threads,
+                stats.read_bytes,
+                stats.write_bytes,
+            )
+        )
+        self.samples += 1
+        self.rss_total += stats.rss_bytes
+        self.cpu_total += cpu_percent
+        self.peak_rss = max(self.peak_rss, stats.rss_bytes)
+        self.peak_cpu = max(self.peak_cpu, cpu_percent)
+        self.peak_threads = max(self.peak_threads, stats.threads)
+
+    def summary(self, backend: str) -> ResourceSummary:
+        result = ResourceSummary(self.pid, backend, self.samples, time.monotonic() - self.started)
+        if not self.samples or self.first is None or self.last is None:
+            return result
+        result.peak_rss_bytes = self.peak_rss
+        result.avg_rss_bytes = self.rss_total // self.samples
+        result.peak_cpu_percent = self.peak_cpu
+        # The first sample has no CPU delta yet, so it is left out of the average.
+        result.avg_cpu_percent = self.cpu_total / max(self.samples - 1, 1)
+        result.peak_threads = self.peak_threads
+        result.read_bytes = max(self.last.read_bytes - self.first.read_bytes, 0)
+        result.write_bytes = max(self.last.write_bytes - self.first.write_bytes, 0)
+        return result
+
+
+class ResourceMonitor:
+    def __init__(
+        self,
+        backend: ResourceBackend | None = None,
+        interval: float = SAMPLE_INTERVAL,
+        capacity: int = HISTORY_SAMPLES,
+    ) -> None:
+        self.backend = backend if backend is not None else default_backend()
+        self.interval = interval
+        self.capacity = capacity
+        self.cpu_count = os.cpu_count() or 1
+        self.lock = threading.Lock()
+        self.tracked: dict[int, TrackedProcess] = {}
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name if self.backend is not None else "none"
+
+    def watch(self, pid: int) -> None:
+        if self.backend is None:
+            return
+        with self.lock:
+            self.tracked[pid] = TrackedProcess(pid, self.capacity)
+            self._sample(self.tracked[pid])
+            if self.thread is None:
+                self.stop_event.clear()
+                self.thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+                self.thread.start()
+
+    def unwatch(self, pid: int) -> ResourceSummary:
+        with self.lock:
+            tracked = self.tracked.pop(pid, None)
+        if tracked is None:
+            return ResourceSummary(pid, self.backend_name)
+        return tracked.summary(self.backend_name)
+
+    def latest(self, pid: int) -> ResourceSample | None:
+        with self.lock:
+            tracked = self.tracked.get(pid)
+            return tracked.ring.latest() if tracked is not None else None
+
+    def history(self, pid: int, limit: int | None = None) -> list[ResourceSample]:
+        with self.lock:
+            tracked = self.tracked.get(pid)
+            return tracked.ring.samples(limit) if tracked is not None else []
+
+    def summary(self, pid: int) -> ResourceSummary | None:
+        with self.lock:
+            tracked = self.tracked.get(pid)
+            return tracked.summary(self.backend_name) if tracked is not None else None
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval + 1)
+
+    def _sample(self, tracked: TrackedProcess) -> None:
+        try:
+            stats = self.backend.read(tracked.pid)
+        except (OSError, ValueError, IndexError) as error:
+            print(f"[RESOURCES] Sampling {tracked.pid} failed: {error}")
+            return
+        if stats is not None:
+            tracked.record(stats, time.monotonic(), self.cpu_count)
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            with self.lock:
+                if not self.tracked:
+                    self.thread = None
+                    return
+                for tracked in list(self.tracked.values()):
+                    self._sample(tracked)
+        with self.lock:
+            self.thread = None
+
+
+def save_resource_report(
+    path: Path,
+    summary: ResourceSummary,
+    samples: list[ResourceSample],
+    limit: int = SAVED_SAMPLES,
+) -> Path:
+    step = max(-(-len(samples) // limit), 1) if limit else 1
+    history = [
+        [round(sample.at, 1), round(sample.rss_bytes / MIB, 1), sample.cpu_percent, sample.threads]
+        for sample in samples[::step]
+    ]
+    data = {
+        **summary.to_dict(),
+        "history_columns": ["seconds", "rss_mb", "cpu_percent", "threads"],
+        "history": history,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+    return path
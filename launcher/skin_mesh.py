@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+
+from PIL import Image
+
+
+Point3D = tuple[float, float, float]
+UvRegion = tuple[int, int, int, int]
+
+SCREEN_TILT = 0.18
+ALPHA_CUTOFF = 16
+MIN_FACE_AREA = 1e-6
+HEAD_OVERLAY_INFLATE = 0.5
+LIMB_OVERLAY_INFLATE = 0.25
+
+
+@dataclass(frozen=True)
+class Cuboid:
+    min_x: float
+    min_y: float
+    min_z: float
+    max_x: float
+    max_y: float
+    max_z: float
+    uv: dict[str, UvRegion]
+
+
+@dataclass(frozen=True)
+class Face:
+    points: tuple[Point3D, Point3D, Point3D, Point3D]
+    uv: UvRegion
+
+
+class SkinMesh:
+    def __init__(self) -> None:
+        self.xs = array("d")
+        self.ys = array("d")
+        self.zs = array("d")
+        self.center_x = array("d")
+        self.center_z = array("d")
+        self.face_of = array("i")
+        self.colors: list[str] = []
+        self.face_xs = array("d")
+        self.face_ys = array("d")
+        self.face_zs = array("d")
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    @classmethod
+    def build(cls, skin: Image.Image | None, overlay: bool = False) -> "SkinMesh":
+        mesh = cls()
+        pixels = skin.load() if skin is not None else None
+        size = skin.size if skin is not None else (64, 64)
+        for face_index, face in enumerate(model_faces(size, overlay and skin is not None)):
+            mesh._add_face(face_index, face, pixels, size)
+        return mesh
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_xs) // 4
+
+    def _add_face(self, face_index: int, face: Face, pixels, size: tuple[int, int]) -> None:
+        for x, y, z in face.points:
+            self.face_xs.append(x)
+            self.face_ys.append(y)
+            self.face_zs.append(z)
+
+        u0, v0, u1, v1 = face.uv
+        columns = max(abs(u1 - u0), 1)
+        rows = max(abs(v1 - v0), 1)
+        origin, right, _bottom_right, down = face.points
+        step_s = tuple((right[axis] - origin[axis]) / columns for axis in range(3))
+        step_t = tuple((down[axis] - origin[axis]) / rows for axis in range(3))
+
+        for row in range(rows):
+            for column in range(columns):
+                color = sample_color(pixels, size, texture_coord(u0, u1, column), texture_coord(v0, v1, row))
+                if color is None:
+                    continue
+                corners = ((column, row), (column + 1, row), (column + 1, row + 1), (column, row + 1))
+                for s, t in corners:
+                    self.xs.append(origin[0] + step_s[0] * s + step_t[0] * t)
+                    self.ys.append(origin[1] + step_s[1] * s + step_t[1] * t)
+                    self.zs.append(origin[2] + step_s[2] * s + step_t[2] * t)
+                self.center_x.append(sum(self.xs[-4:]) / 4)
+                self.center_z.append(sum(self.zs[-4:]) / 4)
+                self.face_of.append(face_index)
+                self.colors.append(color)
+
+    def visible_faces(self, yaw: float) -> list[bool]:
+        radians = math.radians(yaw)
+        cos = math.cos(radians)
+        sin = math.sin(radians)
+        screen_x = [x * cos - z * sin for x, z in zip(self.face_xs, self.face_zs)]
+        screen_y = [(x * sin + z * cos) * SCREEN_TILT - y for x, y, z in zip(self.face_xs, self.face_ys, self.face_zs)]
+
+        return [
+            winding_area(screen_x[base : base + 4], screen_y[base : base + 4]) > MIN_FACE_AREA
+            for base in range(0, len(screen_x), 4)
+        ]
+
+    def project(
+        self,
+        yaw: float,
+        scale: float,
+        offset_x: float,
+        offset_y: float,
+    ) -> tuple[list[int], list[float], list[float]]:
+        radians = math.radians(yaw)
+        cos = math.cos(radians)
+        sin = math.sin(radians)
+        tilt = scale * SCREEN_TILT
+
+        screen_x = [offset_x + (x * cos - z * sin) * scale for x, z in zip(self.xs, self.zs)]
+        screen_y = [offset_y - y * scale + (x * sin + z * cos) * tilt for x, y, z in zip(self.xs, self.ys, self.zs)]
+        depth = [x * sin + z * cos for x, z in zip(self.center_x, self.center_z)]
+        visible = self.visible_faces(yaw)
+        face_of = self.face_of
+        order = sorted((index for index in range(len(depth)) if visible[face_of[index]]), key=depth.__getitem__)
+        return order, screen_x, screen_y
+
+    @staticmethod
+    def quad_coords(index: int, screen_x: list[float], screen_y: list[float]) -> list[float]:
+        base = index * 4
+        return [
+            screen_x[base],
+            screen_y[base],
+            screen_x[base + 1],
+            screen_y[base + 1],
+            screen_x[base + 2],
+            screen_y[base + 2],
+            screen_x[base + 3],
+            screen_y[base + 3],
+        ]
+
+
+def winding_area(screen_x: list[float], screen_y: list[float]) -> float:
+    area = 0.0
+    count = len(screen_x)
+    for current in range(count):
+        following = (current + 1) % count
+        area += screen_x[current] * screen_y[following] - screen_x[following] * screen_y[current]
+    return area
+
+
+def texture_coord(start: int, end: int, offset: int) -> int:
+    if end >= start:
+        return start + offset
+    return start - offset - 1
+
+
+def sample_color(pixels, size: tuple[int, int], skin_u: int, skin_v: int) -> str | None:
+    if pixels is None:
+        return "#ffffff"
+
+    width, height = size
+    texel = width / 64
+    x = min(max(int((skin_u + 0.5) * texel), 0), width - 1)
+    y = min(max(int((skin_v + 0.5) * texel), 0), height - 1)
+    red, green, blue, alpha = pixels[x, y]
+    if alpha < ALPHA_CUTOFF:
+        return None
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def model_faces(skin_size: tuple[int, int], overlay: bool = False) -> Iterable[Face]:
+    modern = skin_size[1] >= skin_size[0]
+    cuboids = [
+        Cuboid(-4, 24, -4, 4, 32, 4, head_uv()),
+        Cuboid(-4, 12, -2, 4, 24, 2, body_uv()),
+        Cuboid(-8, 12, -2, -4, 24, 2, right_arm_uv()),
+        Cuboid(4, 12, -2, 8, 24, 2, left_arm_uv(modern)),
+        Cuboid(-4, 0, -2, 0, 12, 2, right_leg_uv()),
+        Cuboid(0, 0, -2, 4, 12, 2, left_leg_uv(modern)),
+    ]
+    if overlay:
+        layers = [(cuboids[0], HEAD_OVERLAY_INFLATE, (32, 0))]
+        if modern:
+            layers.extend(
+                [
+                    (cuboids[1], LIMB_OVERLAY_INFLATE, (0, 16)),
+                    (cuboids[2], LIMB_OVERLAY_INFLATE, (0, 16)),
+                    (cuboids[3], LIMB_OVERLAY_INFLATE, (16, 0)),
+                    (cuboids[4], LIMB_OVERLAY_INFLATE, (0, 16)),
+                    (cuboids[5], LIMB_OVERLAY_INFLATE, (-16, 0)),
+                ]
+            )
+        cuboids.extend(overlay_cuboid(cuboid, inflate, offset) for cuboid, inflate, offset in layers)
+    for cuboid in cuboids:
+        yield from cuboid_faces(cuboid)
+
+
+def overlay_cuboid(cuboid: Cuboid, inflate: float, offset: tuple[int, int]) -> Cuboid:
+    du, dv = offset
+    return Cuboid(
+        cuboid.min_x - inflate,
+        cuboid.min_y - inflate,
+        cuboid.min_z - inflate,
+        cuboid.max_x + inflate,
+        cuboid.max_y + inflate,
+        cuboid.max_z + inflate,
+        {name: (u0 + du, v0 + dv, u1 + du, v1 + dv) for name, (u0, v0, u1, v1) in cuboid.uv.items()},
+    )
+
+
+def cuboid_faces(cuboid: Cuboid) -> Iterable[Face]:
+    x0, y0, z0 = cuboid.min_x, cuboid.min_y, cuboid.min_z
+    x1, y1, z1 = cuboid.max_x, cuboid.max_y, cuboid.max_z
+    face_points = {
+        "front": ((x0, y1, z1), (x1, y1, z1), (x1, y0, z1), (x0, y0, z1)),
+        "back": ((x1, y1, z0), (x0, y1, z0), (x0, y0, z0), (x1, y0, z0)),
+        "left": ((x0, y1, z0), (x0, y1, z1), (x0, y0, z1), (x0, y0, z0)),
+        "right": ((x1, y1, z1), (x1, y1, z0), (x1, y0, z0), (x1, y0, z1)),
+        "top": ((x0, y1, z0), (x1, y1, z0), (x1, y1, z1), (x0, y1, z1)),
+        "bottom": ((x0, y0, z1), (x1, y0, z1), (x1, y0, z0), (x0, y0, z0)),
+    }
+    for name, points in face_points.items():
+        yield Face(points, cuboid.uv[name])
+
+
+def head_uv() -> dict[str, UvRegion]:
+    return {
+        "top": (8, 0, 16, 8),
+        "bottom": (16, 0, 24, 8),
+        "right": (8, 8, 0, 16),
+        "front": (8, 8, 16, 16),
+        "left": (24, 8, 16, 16),
+        "back": (24, 8, 32, 16),
+    }
+
+
+def body_uv() -> dict[str, UvRegion]:
+    return {
+        "top": (20, 16, 28, 20),
+        "bottom": (28, 16, 36, 20),
+        "right": (20, 20, 16, 32),
+        "front": (20, 20, 28, 32),
+        "left": (32, 20, 28, 32),
+        "back": (32, 20, 40, 32),
+    }
+
+
+def right_arm_uv() -> dict[str, UvRegion]:
+    return {
+        "top": (44, 16, 48, 20),
+        "bottom": (48, 16, 52, 20),
+        "right": (44, 20, 40, 32),
+        "front": (44, 20, 48, 32),
+        "left": (52, 20, 48, 32),
+        "back": (52, 20, 56, 32),
+    }
+
+
+def left_arm_uv(modern: bool) -> dict[str, UvRegion]:
+    if modern:
+        return {
+            "top": (36, 48, 40, 52),
+            "bottom": (40, 48, 44, 52),
+            "right": (36, 52, 32, 64),
+            "front": (36, 52, 40, 64),
+            "left": (44, 52, 40, 64),
+            "back": (44, 52, 48, 64),
+        }
+    return right_arm_uv()
+
+
+def right_leg_uv() -> dict[str, UvRegion]:
+    return {
+        "top": (4, 16, 8, 20),
+        "bottom": (8, 16, 12, 20),
+        "right": (4, 20, 0, 32),
+        "front": (4, 20, 8, 32),
+        "left": (12, 20, 8, 32),
+        "back": (12, 20, 16, 32),
+    }
+
+
+def left_leg_uv(modern: bool) -> dict[str, UvRegion]:
+    if modern:
+        return {
+            "top": (20, 48, 24, 52),
+            "bottom": (24, 48, 28, 52),
+            "right": (20, 52, 16, 64),
+            "front": (20, 52, 24, 64),
+            "left": (28, 52, 24, 64),
+            "back": (28, 52, 32, 64),
+        }
+    return right_leg_uv()
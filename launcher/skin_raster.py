@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, TypeVar
+
+from PIL import Image, ImageChops, ImageDraw
+
+from .skin_mesh import ALPHA_CUTOFF, MIN_FACE_AREA, SCREEN_TILT, Point3D, UvRegion, model_faces, winding_area
+
+
+FRAME_YAW_STEP = 5
+FRAME_CACHE_SIZE = 360 // FRAME_YAW_STEP
+BACKGROUND = (23, 28, 34, 255)
+
+CachedFrame = TypeVar("CachedFrame")
+
+
+@dataclass(frozen=True)
+class TexturedFace:
+    points: tuple[Point3D, Point3D, Point3D, Point3D]
+    texture: Image.Image
+    width: int
+    height: int
+
+
+class FrameCache(Generic[CachedFrame]):
+    def __init__(self, capacity: int = FRAME_CACHE_SIZE) -> None:
+        self.capacity = capacity
+        self.frames: OrderedDict[Hashable, CachedFrame] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> CachedFrame | None:
+        frame = self.frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.frames.move_to_end(key)
+        return frame
+
+    def put(self, key: Hashable, frame: CachedFrame) -> None:
+        self.frames[key] = frame
+        self.frames.move_to_end(key)
+        while len(self.frames) > self.capacity:
+            self.frames.popitem(last=False)
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+
+def quantize_yaw(yaw: float) -> int:
+    return int(round(yaw / FRAME_YAW_STEP)) * FRAME_YAW_STEP % 360
+
+
+class SkinRasterizer:
+    def __init__(self, skin: Image.Image | None, overlay: bool = True) -> None:
+        source = skin if skin is not None else Image.new("RGBA", (64, 64), (255, 255, 255, 255))
+        self.faces = [
+            textured
+            for face in model_faces(source.size, overlay and skin is not None)
+            if (textured := self._texture_face(source, face.points, face.uv)) is not None
+        ]
+
+    @staticmethod
+    def _texture_face(
+        skin: Image.Image,
+        points: tuple[Point3D, Point3D, Point3D, Point3D],
+        uv: UvRegion,
+    ) -> TexturedFace | None:
+        texel = skin.size[0] / 64
+        u0, v0, u1, v1 = uv
+        box = (
+            round(min(u0, u1) * texel),
+            round(min(v0, v1) * texel),
+            round(max(u0, u1) * texel),
+            round(max(v0, v1) * texel),
+        )
+        texture = skin.crop(box)
+        if u1 < u0:
+            texture = texture.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+        if v1 < v0:
+            texture = texture.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+        alpha = texture.getchannel("A").point(lambda value: 0 if value < ALPHA_CUTOFF else value)
+        if alpha.getbbox() is None:
+            return None
+        texture.putalpha(alpha)
+
+        width, height = texture.size
+        padded = Image.new("RGBA", (width + 2, height + 2))
+        padded.paste(texture, (1, 1))
+        padded.paste(texture.crop((0, 0, 1, height)), (0, 1))
+        padded.paste(texture.crop((width - 1, 0, width, height)), (width + 1, 1))
+        padded.paste(padded.crop((0, 1, width + 2, 2)), (0, 0))
+        padded.paste(padded.crop((0, height, width + 2, height + 1)), (0, height + 1))
+        return TexturedFace(points, padded, width, height)
+
+    def render(self, yaw: float, width: int, height: int) -> Image.Image:
+        frame = Image.new("RGBA", (width, height), BACKGROUND)
+        scale = min(width / 28, height / 38)
+        offset_x = width / 2
+        offset_y = height - 18
+        radians = math.radians(yaw)
+        cos = math.cos(radians)
+        sin = math.sin(radians)
+
+        projected = []
+        for face in self.faces:
+            screen = []
+            depth = 0.0
+            for x, y, z in face.points:
+                rotated_z = x * sin + z * cos
+                screen.append(
+                    (
+                        offset_x + (x * cos - z * sin) * scale,
+                        offset_y - y * scale + rotated_z * scale * SCREEN_TILT,
+                    )
+                )
+                depth += rotated_z
+            xs = [point[0] for point in screen]
+            ys = [point[1] for point in screen]
+            if winding_area(xs, ys) > MIN_FACE_AREA * scale * scale:
+                projected.append((depth, face, screen))
+
+        for _depth, face, screen in sorted(projected, key=lambda item: item[0]):
+            self._draw_face(frame, face, screen)
+        return frame
+
+    @staticmethod
+    def _draw_face(frame: Image.Image, face: TexturedFace, screen: list[tuple[float, float]]) -> None:
+        left = max(int(math.floor(min(x for x, _y in screen))), 0)
+        top = max(int(math.floor(min(y for _x, y in screen))), 0)
+        right = min(int(math.ceil(max(x for x, _y in screen))) + 1, frame.size[0])
+        bottom = min(int(math.ceil(max(y for _x, y in screen))) + 1, frame.size[1])
+        if right <= left or bottom <= top:
+            return
+
+        (origin_x, origin_y), (across_x, across_y), _corner, (down_x, down_y) = screen
+        ax = (across_x - origin_x) / face.width
+        ay = (across_y - origin_y) / face.width
+        bx = (down_x - origin_x) / face.height
+        by = (down_y - origin_y) / face.height
+        determinant = ax * by - bx * ay
+        if abs(determinant) < 1e-9:
+            return
+
+        shift_x = left - origin_x
+        shift_y = top - origin_y
+        data = (
+            by / determinant,
+            -bx / determinant,
+            (by * shift_x - bx * shift_y) / determinant + 1,
+            -ay / determinant,
+            ax / determinant,
+            (ax * shift_y - ay * shift_x) / determinant + 1,
+        )
+        size = (right - left, bottom - top)
+        warped = face.texture.transform(size, Image.Transform.AFFINE, data, resample=Image.Resampling.NEAREST)
+
+        mask = Image.new("L", size, 0)
+        ImageDraw.Draw(mask).polygon([(x - left, y - top) for x, y in screen], fill=255)
+        warped.putalpha(ImageChops.multiply(warped.getchannel("A"), mask))
+        frame.alpha_composite(warped, (left, top))
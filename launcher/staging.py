@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+
+JOURNAL_VERSION = 1
+
+
+@dataclass(frozen=True)
+class StagingEntry:
+    op: str
+    directory: Path
+    names: tuple[str, ...]
+    parked: Path | None = None
+
+    def to_dict(self) -> dict:
+        data = {"v": JOURNAL_VERSION, "op": self.op, "dir": str(self.directory), "names": list(self.names)}
+        if self.parked is not None:
+            data["parked"] = str(self.parked)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StagingEntry":
+        parked = data.get("parked")
+        return cls(
+            op=str(data["op"]),
+            directory=Path(data["dir"]),
+            names=tuple(str(name) for name in data.get("names", [])),
+            parked=Path(parked) if parked else None,
+        )
+
+
+class StagingJournal:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @property
+    def active(self) -> bool:
+        try:
+            return self.path.stat().st_size > 0
+        except FileNotFoundError:
+            return False
+
+    def append(self, entry: StagingEntry) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(entry.to_dict()) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def entries(self) -> list[StagingEntry]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        entries: list[StagingEntry] = []
+        for line in lines:
+            try:
+                data = json.loads(line)
+                if data.get("v") == JOURNAL_VERSION:
+                    entries.append(StagingEntry.from_dict(data))
+            except (ValueError, KeyError, AttributeError):
+                print(f"[STAGING] Skipping unreadable journal line: {line[:80]}")
+        return entries
+
+    def rewrite(self, entries: list[StagingEntry]) -> None:
+        if not entries:
+            self.clear()
+            return
+        pending = self.path.with_name(f"{self.path.name}.tmp")
+        with pending.open("w", encoding="utf-8") as file:
+            file.writelines(json.dumps(entry.to_dict()) + "\n" for entry in entries)
+            file.flush()
+            os.fsync(file.fileno())
+        pending.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def move_replacing(source: Path, target: Path) -> None:
+    if target.exists():
+        target.unlink()
+    shutil.move(str(source), str(target))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+MAX_STARTUP_REPORTS = 20
+STARTUP_PROBE_ENV = "ENCHANTED_STARTUP_PROBE"
+
+
+class StartupTimer:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.marks: list[tuple[str, float]] = []
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def mark(self, name: str) -> float:
+        seconds = self.elapsed()
+        if name not in self.names:
+            self.marks.append((name, seconds))
+        return seconds
+
+    @property
+    def names(self) -> set[str]:
+        return {name for name, _seconds in self.marks}
+
+    @property
+    def summary(self) -> str:
+        return ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.marks)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "marks": {name: round(seconds, 4) for name, seconds in self.marks},
+            "loaded_modules": len(sys.modules),
+        }
+
+    def save(self, path: Path) -> None:
+        try:
+            reports = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            reports = []
+        if not isinstance(reports, list):
+            reports = []
+        reports.append(self.to_dict())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(reports[-MAX_STARTUP_REPORTS:], indent=4), encoding="utf-8")
+
+
+def close_splash() -> None:
+    try:
+        import pyi_splash
+    except ImportError:
+        return
+    try:
+        pyi_splash.close()
+    except RuntimeError:
+        pass
+
+
+def write_startup_probe(timer: StartupTimer) -> bool:
+    probe = os.environ.get(STARTUP_PROBE_ENV)
+    if not probe:
+        return False
+    data = timer.to_dict()
+    data["first_window_at"] = time.time()
+    try:
+        Path(probe).write_text(json.dumps(data), encoding="utf-8")
+    except OSError as error:
+        print(f"[STARTUP] Failed to write startup probe: {error}")
+    return True
+
+
+STARTUP = StartupTimer()
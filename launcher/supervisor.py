@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import itertools
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from .game_launcher import GameSession
+
+
+POLL_INTERVAL = 0.5
+STOP_TIMEOUT = 10.0
+
+
+@dataclass
+class GameInstance:
+    id: int
+    session: GameSession
+    on_exit: Callable[["GameInstance"], None] | None = None
+    started: float = field(default_factory=time.monotonic)
+    exit_code: int | None = None
+    pidfd: int | None = None
+
+    @property
+    def process(self) -> subprocess.Popen:
+        return self.session.process
+
+    @property
+    def game_dir(self) -> Path:
+        return self.session.prepared.game_dir
+
+    @property
+    def running(self) -> bool:
+        return self.exit_code is None
+
+    @property
+    def label(self) -> str:
+        return f"#{self.id} {self.session.prepared.profile.name}"
+
+
+ExitCallback = Callable[[GameInstance], None]
+
+
+def pidfd_supported() -> bool:
+    return sys.platform.startswith("linux") and hasattr(os, "pidfd_open")
+
+
+class ProcessSupervisor:
+    def __init__(self, poll_interval: float = POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.instances: dict[int, GameInstance] = {}
+        self.reserved: set[Path] = set()
+        self.ids = itertools.count(1)
+        self.use_pidfd = pidfd_supported()
+        self.wake_read, self.wake_write = os.pipe() if self.use_pidfd else (-1, -1)
+        self.wake_event = threading.Event()
+        self.closed = False
+        self.thread: threading.Thread | None = None
+
+    def reserve_game_dir(self, primary: Path, instances_root: Path) -> Path:
+        with self.lock:
+            candidate = primary
+            for number in itertools.count(2):
+                if candidate not in self.reserved:
+                    break
+                candidate = instances_root / str(number)
+            self.reserved.add(candidate)
+            return candidate
+
+    def release_game_dir(self, game_dir: Path) -> None:
+        with self.lock:
+            self.reserved.discard(game_dir)
+
+    def add(self, session: GameSession, on_exit: ExitCallback | None = None) -> GameInstance:
+        instance = GameInstance(next(self.ids), session, on_exit)
+        if self.use_pidfd:
+            try:
+                instance.pidfd = os.pidfd_open(session.process.pid)
+            except OSError as error:
+                print(f"[SUPERVISOR] pidfd unavailable for {session.process.pid}, polling instead: {error}")
+        with self.lock:
+            self.instances[instance.id] = instance
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="process-supervisor", daemon=True)
+                self.thread.start()
+        self._wake()
+        return instance
+
+    def running(self) -> list[GameInstance]:
+        with self.lock:
+            return [instance for instance in self.instances.values() if instance.running]
+
+    def get(self, instance_id: int) -> GameInstance | None:
+        with self.lock:
+            return self.instances.get(instance_id)
+
+    def stop(self, instance_id: int, timeout: float = STOP_TIMEOUT) -> None:
+        instance = self.get(instance_id)
+        if instance is not None and instance.running:
+            self.stop_all(timeout, [instance])
+
+    def stop_all(self, timeout: float = STOP_TIMEOUT, instances: list[GameInstance] | None = None) -> int:
+        targets = self.running() if instances is None else instances
+        for instance in targets:
+            instance.session.stopped = True
+            try:
+                instance.process.terminate()
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout
+        for instance in targets:
+            try:
+                instance.process.wait(timeout=max(deadline - time.monotonic(), 0.0))
+            except subprocess.TimeoutExpired:
+                print(f"[SUPERVISOR] {instance.label} did not stop in {timeout:.0f}s, killing it")
+                instance.process.kill()
+                instance.process.wait()
+        return len(targets)
+
+    def shutdown(self) -> None:
+        with self.lock:
+            self.closed = True
+            thread = self.thread
+        self._wake()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.poll_interval + 1)
+        with self.lock:
+            for instance in self.instances.values():
+                if instance.pidfd is not None:
+                    os.close(instance.pidfd)
+                    instance.pidfd = None
+        if self.use_pidfd:
+            for fd in (self.wake_read, self.wake_write):
+                os.close(fd)
+            self.use_pidfd = False
+
+    def _wake(self) -> None:
+        if self.use_pidfd:
+            try:
+                os.write(self.wake_write, b"\0")
+            except OSError:
+                pass
+        self.wake_event.set()
+
+    def _wait(self) -> None:
+        if not self.use_pidfd:
+            self.wake_event.wait(self.poll_interval)
+            self.wake_event.clear()
+            return
+        with self.lock:
+            pidfds = [instance.pidfd for instance in self.instances.values() if instance.pidfd is not None]
+            polling = any(instance.pidfd is None for instance in self.instances.values())
+        readable, _writable, _errors = select.select(
+            [self.wake_read, *pidfds],
+            [],
+            [],
+            self.poll_interval if polling else None,
+        )
+        if self.wake_read in readable:
+            os.read(self.wake_read, 4096)
+
+    def _run(self) -> None:
+        while True:
+            with self.lock:
+                if self.closed:
+                    self.thread = None
+                    return
+            self._wait()
+            with self.lock:
+                exited = [instance for instance in self.instances.values() if instance.process.poll() is not None]
+                for instance in exited:
+                    del self.instances[instance.id]
+            for instance in exited:
+                self._reap(instance)
+
+    def _reap(self, instance: GameInstance) -> None:
+        instance.exit_code = instance.process.returncode
+        if instance.pidfd is not None:
+            os.close(instance.pidfd)
+            instance.pidfd = None
+        print(f"[SUPERVISOR] {instance.label} exited with code {instance.exit_code}")
+        if instance.on_exit is None:
+            return
+        try:
+            instance.on_exit(instance)
+        except Exception as error:
+            print(f"[SUPERVISOR] Exit handler for {instance.label} failed: {error}")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import threading
+import traceback
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable
+
+
+Callback = Callable[[], None]
+Dispatcher = Callable[[Callback], None]
+DISPATCH_INTERVAL_MS = 25
+
+
+class TaskPriority(IntEnum):
+    LAUNCH = 0
+    INSTALL = 10
+    SEARCH = 20
+    PREFETCH = 30
+
+
+@dataclass(eq=False)
+class Task:
+    fn: Callable[[], Any]
+    key: str | None = None
+    priority: int = TaskPriority.SEARCH
+    on_done: Callable[[Any], None] | None = None
+    on_error: Callable[[Exception], None] | None = None
+    on_finally: Callback | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+class TaskScheduler:
+    def __init__(self, max_workers: int = 4, dispatch: Dispatcher | None = None) -> None:
+        self.max_workers = max_workers
+        self.dispatch = dispatch or (lambda callback: callback())
+        self.condition = threading.Condition()
+        self.pending: list[tuple[int, int, Task]] = []
+        self.current: dict[str, Task] = {}
+        self.workers: list[threading.Thread] = []
+        self.idle_workers = 0
+        self.counter = itertools.count()
+        self.closed = False
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        key: str | None = None,
+        priority: int = TaskPriority.SEARCH,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        on_finally: Callback | None = None,
+    ) -> Task:
+        task = Task(fn, key, priority, on_done, on_error, on_finally)
+        with self.condition:
+            if self.closed:
+                task.cancel()
+                return task
+            if key is not None:
+                previous = self.current.get(key)
+                if previous is not None:
+                    previous.cancel()
+                self.current[key] = task
+            heapq.heappush(self.pending, (int(priority), next(self.counter), task))
+            if self.idle_workers == 0 and len(self.workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name=f"task-worker-{len(self.workers)}", daemon=True)
+                self.workers.append(worker)
+                worker.start()
+            self.condition.notify()
+        return task
+
+    def cancel(self, key: str) -> None:
+        with self.condition:
+            task = self.current.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def is_current(self, task: Task) -> bool:
+        if task.cancelled:
+            return False
+        if task.key is None:
+            return True
+        with self.condition:
+            return self.current.get(task.key) is task
+
+    def shutdown(self) -> None:
+        with self.condition:
+            self.closed = True
+            for _priority, _order, task in self.pending:
+                task.cancel()
+            self.pending.clear()
+            self.condition.notify_all()
+
+    def _next_task(self) -> Task | None:
+        with self.condition:
+            while not self.pending and not self.closed:
+                self.idle_workers += 1
+                self.condition.wait()
+                self.idle_workers -= 1
+            if self.closed:
+                return None
+            return heapq.heappop(self.pending)[2]
+
+    def _work(self) -> None:
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            if task.cancelled:
+                if task.on_finally is not None:
+                    self.dispatch(lambda task=task: self._deliver(task, None, None))
+                continue
+            try:
+                result = task.fn()
+            except Exception as error:
+                if task.on_error is None:
+                    traceback.print_exc()
+                self.dispatch(lambda task=task, error=error: self._deliver(task, task.on_error, error))
+            else:
+                self.dispatch(lambda task=task, result=result: self._deliver(task, task.on_done, result))
+
+    def _deliver(self, task: Task, callback: Callable[[Any], None] | None, value: Any) -> None:
+        # Results of cancelled or superseded tasks are dropped, but on_finally always runs so callers can
+        # release whatever they set up when submitting.
+        current = self.is_current(task)
+        with self.condition:
+            if task.key is not None and self.current.get(task.key) is task:
+                del self.current[task.key]
+        try:
+            if current and callback is not None:
+                callback(value)
+        finally:
+            if task.on_finally is not None:
+                task.on_finally()
+
+
+class TkDispatcher:
+    def __init__(self, widget, interval_ms: int = DISPATCH_INTERVAL_MS) -> None:
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.callbacks: queue.SimpleQueue[Callback] = queue.SimpleQueue()
+        self.after_id: str | None = None
+
+    def __call__(self, callback: Callback) -> None:
+        self.callbacks.put(callback)
+
+    def start(self) -> None:
+        self.after_id = self.widget.after(self.interval_ms, self._drain)
+
+    def stop(self) -> None:
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                callback = self.callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception:
+                traceback.print_exc()
+        self.after_id = self.widget.after(self.interval_ms, self._drain)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from .logs import GAME_READY_MARKERS
+
+
+LOG_MARKERS = {
+    "fabric_loaded": ("with Fabric Loader",),
+    "window_created": ("Backend library:",),
+    "game_ready": GAME_READY_MARKERS,
+}
+REGRESSION_FACTOR = 2.0
+MAX_LAUNCH_RECORDS = 200
+
+
+class LaunchTimeline:
+    def __init__(self, profile_id: str, profile_name: str, version: str) -> None:
+        self.profile_id = profile_id
+        self.profile_name = profile_name
+        self.version = version
+        self.started_at = time.time()
+        self.started = time.monotonic()
+        self.phases: list[dict[str, Any]] = []
+        self.markers: dict[str, float] = {}
+        self.details: dict[str, Any] = {}
+        self.status = "running"
+        self.error = ""
+        self.exit_code: int | None = None
+        self.path: Path | None = None
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {
+                    "name": name,
+                    "start": round(start, 3),
+                    "seconds": round(self.elapsed() - start, 3),
+                }
+            )
+
+    def mark(self, name: str) -> None:
+        self.markers.setdefault(name, round(self.elapsed(), 3))
+
+    def observe_line(self, line: str) -> None:
+        for name, needles in LOG_MARKERS.items():
+            if name not in self.markers and any(needle in line for needle in needles):
+                self.mark(name)
+
+    def finish(self, status: str, exit_code: int | None = None, error: str = "") -> None:
+        self.status = status
+        self.exit_code = exit_code
+        self.error = error
+        self.mark("finished")
+
+    @property
+    def ready_seconds(self) -> float | None:
+        return self.markers.get("game_ready")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "profile_id": self.profile_id,
+            "profile_name": self.profile_name,
+            "version": self.version,
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "error": self.error,
+            "ready_seconds": self.ready_seconds,
+            "phases": self.phases,
+            "markers": self.markers,
+            "details": self.details,
+        }
+
+    def save(self, directory: Path) -> Path:
+        created = self.path is None
+        if self.path is None:
+            stamp = time.strftime("%Y-%m-%d-%H%M%S", time.localtime(self.started_at))
+            self.path = directory / f"{stamp}-{self.profile_id}.json"
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.to_dict(), indent=4), encoding="utf-8")
+        if created:
+            prune_launch_history(directory)
+        return self.path
+
+
+def prune_launch_history(directory: Path, keep: int = MAX_LAUNCH_RECORDS) -> None:
+    for path in sorted(directory.glob("*.json"), reverse=True)[keep:]:
+        path.unlink(missing_ok=True)
+
+
+def load_launch_history(directory: Path, limit: int = 50) -> list[dict[str, Any]]:
+    if not directory.is_dir():
+        return []
+    records: list[dict[str, Any]] = []
+    for path in sorted(directory.glob("*.json"), reverse=True)[:limit]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(data, dict):
+            records.append(data)
+    return records
+
+
+def is_regression(record: dict[str, Any], history: list[dict[str, Any]]) -> bool:
+    ready = record.get("ready_seconds")
+    if not ready:
+        return False
+    previous = [
+        item["ready_seconds"]
+        for item in history
+        if item is not record
+        and item.get("profile_id") == record.get("profile_id")
+        and item.get("ready_seconds")
+        and item.get("started_at", "") < record.get("started_at", "")
+    ]
+    if len(previous) < 2:
+        return False
+    return ready > statistics.median(previous) * REGRESSION_FACTOR
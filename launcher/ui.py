@@ -1,39 +1,59 @@
 from __future__ import annotations
 
 import os
-import subprocess
-import threading
-import time
 import traceback
 import webbrowser
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import customtkinter as ctk
 
-try:
-    from PIL import Image
-except ImportError:  # pragma: no cover - handled at runtime in the UI
-    Image = None
-
+from .cds import CdsArchiveStore
 from .config import LauncherConfig
+from .crash_analysis import CrashReport
 from .constants import APP_NAME, DISCORD_URL, GITHUB_URL, SUPPORTED_VERSIONS
 from .dialogs import Dialog
-from .file_picker import pick_mod_file
-from .logs import rotate_latest_log
-from .minecraft_service import (
-    build_launch_command,
-    install_fabric,
-    installed_fabric_id,
-    start_process,
-    valid_username,
-)
-from .modrinth import ModrinthProject, download_project_file, download_project_icon, search_mods
+from .file_picker import pick_mod_files
+from .fs_watch import FileEvent, FileWatcher, WatchRoot
+from .game_launcher import GameLauncher, GameSession
+from .java_runtime import JavaRuntime, JavaRuntimeManager
+from .jvm import GC_PRESETS, MIN_HEAP_MB, JvmSettings
+from .log_archive import LogArchive, LogSearchHit
+from .logs import GameLogPipeline, LogRotator
+from .minecraft_service import split_server_address, valid_username
+from .mod_bisect import BisectCancelled, BisectStep, DependencyGraph, ModBisector
+from .mod_catalog import CatalogSyncResult, ModCatalog
+from .mod_metadata import ModMetadataIndex
+from .mod_search import SearchCache
 from .paths import LauncherPaths
-from .profiles import DEFAULT_PROFILE_ID, Profile, ProfileMod, ProfileStore, QuickPlaySlot
-from .skin_viewer import SteveSkinViewer
+from .profiles import DEFAULT_PROFILE_ID, BulkModResult, Profile, ProfileMod, ProfileStore, QuickPlaySlot, mod_key
+from .resource_monitor import MIB
+from .startup import STARTUP, close_splash, write_startup_probe
+from .supervisor import GameInstance, ProcessSupervisor
+from .tasks import TaskPriority, TaskScheduler, TkDispatcher
+from .timeline import LaunchTimeline, is_regression, load_launch_history
+
+if TYPE_CHECKING:
+    from .modrinth import ModrinthProject, SearchPage
+    from .skin_viewer import SteveSkinViewer
 
 
 MAX_QUICKPLAYS = 4
+LIVE_LOG_LINES = 500
+LIVE_LOG_INTERVAL_MS = 500
+AUTO_RUNTIME_LABEL = "Auto"
+DEFERRED_INIT_DELAY_MS = 50
+MAX_BACKGROUND_TASKS = 4
+BISECT_READY_TIMEOUT = 300.0
+SEARCH_DEBOUNCE_MS = 300
+SEARCH_MIN_CHARS = 2
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+NO_INSTANCE_LABEL = "No game running"
+RESOURCE_GRAPH_INTERVAL_MS = 1000
+RESOURCE_GRAPH_SAMPLES = 120
+RESOURCE_GRAPH_WIDTH = 180
+RESOURCE_GRAPH_HEIGHT = 36
 
 
 class Tooltip:
@@ -67,27 +87,98 @@ class Tooltip:
 
 
 class LauncherApp(ctk.CTk):
-    def __init__(self) -> None:
+    def __init__(self, paths: LauncherPaths | None = None) -> None:
         super().__init__()
+        STARTUP.mark("tk_root")
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
 
-        self.paths = LauncherPaths.create()
+        self.paths = paths or LauncherPaths.create()
         self.paths.ensure_runtime_dirs(SUPPORTED_VERSIONS)
         self.config = LauncherConfig(self.paths.config)
-        self.profile_store = ProfileStore(self.paths.profiles, self.paths.temp_mods, self.paths.root)
-
-        self.minecraft_proc: subprocess.Popen | None = None
+        self.profile_store = ProfileStore(
+            self.paths.profiles,
+            self.paths.temp_mods,
+            self.paths.root,
+            self.paths.staging_journal,
+        )
+        try:
+            if self.profile_store.journal.active:
+                restored = self.profile_store.recover_staging()
+                print(f"[STAGING] Rolled back an unfinished session, restored {restored} of your mods")
+            self.profile_store.sweep_legacy_staging(self.paths.minecraft)
+        except OSError as error:
+            print(f"[STAGING] Recovery failed, will retry before the next launch: {error}")
+        self.runtime_manager = JavaRuntimeManager(self.paths.java_runtimes, self.paths.minecraft)
+        self.runtime_labels: dict[str, str] = {AUTO_RUNTIME_LABEL: ""}
+        self.dispatcher = TkDispatcher(self)
+        self.tasks = TaskScheduler(MAX_BACKGROUND_TASKS, self.dispatcher)
+        self.dispatcher.start()
+        self.cds_store = CdsArchiveStore(self.paths.cds)
+        self.mod_index = ModMetadataIndex(self.paths.mod_metadata)
+
+        self.supervisor = ProcessSupervisor()
+        self.active_instance: GameInstance | None = None
+        self.bisecting = False
+        self.pending_launches = 0
+        self.closing = False
+        self.log_archive = LogArchive(self.paths.logs)
+        self.log_rotator = LogRotator(self.log_archive.add)
+        self.log_rotator.submit_task(self.log_archive.reconcile)
+        self.game_launcher = GameLauncher(
+            self.paths,
+            self.profile_store,
+            self.runtime_manager,
+            self.cds_store,
+            self.mod_index,
+            self.log_rotator,
+        )
+        self.log_pipeline: GameLogPipeline | None = None
+        self.live_log_seq = 0
         self.selected_profile_id = self._initial_profile_id()
-        self.selected_mod: ProfileMod | None = None
+        self.selected_mods: set[Path] = set()
+        self.mod_anchor: Path | None = None
+        self.mod_rows: dict[Path, tuple[ctk.CTkFrame, ProfileMod]] = {}
         self.quickplays = self.load_quickplays()
         self.modrinth_results: list[ModrinthProject] = []
-        self.image_refs: list[ctk.CTkImage] = []
+        self.modrinth_pages: list[SearchPage] = []
+        self.mod_catalog = ModCatalog(self.paths.mod_catalog)
+        self.catalog_syncing: set[str] = set()
+        self.search_cache = SearchCache(fetcher=self.fetch_modrinth_page)
+        self.search_after_id: str | None = None
+        self.modrinth_more: ctk.CTkButton | None = None
+        self.image_cache: dict[tuple[Path, tuple[int, int]], ctk.CTkImage] = {}
+        self.file_watcher: FileWatcher | None = None
         self.tooltip = Tooltip(self)
+        self.skin_viewer: SteveSkinViewer | None = None
+        self.tab_builders: dict[str, tuple[Callable[[], None], Callable[[], None] | None]] = {}
+        self.built_tabs: set[str] = set()
+        STARTUP.mark("services")
 
         self._setup_window()
         self._build_layout()
         self.refresh_all()
+        STARTUP.mark("layout")
+        self.after_idle(self._on_first_window)
+        self.after(DEFERRED_INIT_DELAY_MS, self._deferred_init)
+
+    def _on_first_window(self) -> None:
+        STARTUP.mark("first_window")
+        close_splash()
+        if write_startup_probe(STARTUP):
+            self.after(0, self.on_close)
+
+    def _deferred_init(self) -> None:
+        self._build_skin_viewer()
+        self.discover_runtimes()
+        self.sync_mod_catalog()
+        self.start_file_watcher()
+        STARTUP.mark("deferred_init")
+        print(f"[STARTUP] {STARTUP.summary}")
+        try:
+            STARTUP.save(self.paths.startup_report)
+        except OSError as error:
+            print(f"[STARTUP] Failed to save startup report: {error}")
 
     def _initial_profile_id(self) -> str:
         saved = str(
@@ -237,8 +328,8 @@ class LauncherApp(ctk.CTk):
         )
         self.launch_button.grid(row=2, column=0, pady=(0, 24))
 
-        self.skin_viewer = SteveSkinViewer(center, skin_path=self.paths.steve_skin, width=230, height=250)
-        self.skin_viewer.grid(row=3, column=0)
+        self.skin_slot = ctk.CTkFrame(center, width=230, height=250, fg_color="#171c22", corner_radius=8)
+        self.skin_slot.grid(row=3, column=0)
 
         bottom = ctk.CTkFrame(center, fg_color="transparent")
         bottom.grid(row=4, column=0, sticky="ew", padx=22, pady=20)
@@ -249,6 +340,32 @@ class LauncherApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(bottom, text="", width=180, anchor="e")
         self.status_label.grid(row=0, column=1, sticky="e")
 
+        self.resource_frame = ctk.CTkFrame(bottom, fg_color="transparent")
+        self.resource_frame.grid(row=1, column=0, columnspan=2, sticky="e", pady=(8, 0))
+        self.resource_label = ctk.CTkLabel(self.resource_frame, text="", text_color="#a8b3bd", anchor="e")
+        self.resource_label.grid(row=0, column=0, sticky="e", padx=(0, 10))
+        self.resource_graph = ctk.CTkCanvas(
+            self.resource_frame,
+            width=RESOURCE_GRAPH_WIDTH,
+            height=RESOURCE_GRAPH_HEIGHT,
+            bg="#171c22",
+            highlightthickness=0,
+        )
+        self.resource_graph.grid(row=0, column=1)
+        self.resource_frame.grid_remove()
+
+    def _build_skin_viewer(self) -> None:
+        from .skin_viewer import SteveSkinViewer
+
+        self.skin_viewer = SteveSkinViewer(
+            self.skin_slot.master,
+            skin_path=self.paths.steve_skin,
+            width=230,
+            height=250,
+        )
+        self.skin_viewer.grid(row=3, column=0)
+        self.skin_slot.destroy()
+
     def _build_right_panel(self) -> None:
         right = ctk.CTkFrame(self, width=340, corner_radius=8)
         right.grid(row=1, column=2, sticky="nsew", padx=(8, 14), pady=(0, 14))
@@ -256,16 +373,37 @@ class LauncherApp(ctk.CTk):
         right.grid_columnconfigure(0, weight=1)
         right.grid_rowconfigure(0, weight=1)
 
-        self.right_tabs = ctk.CTkTabview(right)
+        self.right_tabs = ctk.CTkTabview(right, command=self.on_tab_change)
         self.right_tabs.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
         self.profile_tab = self.right_tabs.add("Profile")
         self.mods_tab = self.right_tabs.add("Mody")
         self.modrinth_tab = self.right_tabs.add("Modrinth")
+        self.history_tab = self.right_tabs.add("History")
+        self.log_tab = self.right_tabs.add("Log")
 
         self._build_profile_tab()
-        self._build_mods_tab()
-        self._build_modrinth_tab()
+        self.tab_builders = {
+            "Mody": (self._build_mods_tab, self.refresh_mods),
+            "Modrinth": (self._build_modrinth_tab, self.refresh_modrinth_results),
+            "History": (self._build_history_tab, self.refresh_launch_history),
+            "Log": (self._build_log_tab, self.show_live_log),
+        }
+
+    def on_tab_change(self) -> None:
+        self.ensure_tab(self.right_tabs.get())
+
+    def ensure_tab(self, name: str) -> None:
+        if name in self.built_tabs or name not in self.tab_builders:
+            return
+        build, refresh = self.tab_builders[name]
+        self.built_tabs.add(name)
+        build()
+        if refresh:
+            refresh()
+
+    def tab_built(self, name: str) -> bool:
+        return name in self.built_tabs
 
     def _build_profile_tab(self) -> None:
         self.profile_tab.grid_columnconfigure(0, weight=1)
@@ -285,8 +423,31 @@ class LauncherApp(ctk.CTk):
         self.profile_name_entry = ctk.CTkEntry(self.profile_tab)
         self.profile_name_entry.grid(row=2, column=0, sticky="ew", padx=12, pady=(4, 12))
 
+        ctk.CTkLabel(self.profile_tab, text="Memory (MB, 0 = auto)").grid(row=3, column=0, sticky="w", padx=12)
+        self.profile_heap_entry = ctk.CTkEntry(self.profile_tab, placeholder_text="0")
+        self.profile_heap_entry.grid(row=4, column=0, sticky="ew", padx=12, pady=(4, 12))
+
+        ctk.CTkLabel(self.profile_tab, text="Garbage collector").grid(row=5, column=0, sticky="w", padx=12)
+        self.profile_gc_combo = ctk.CTkComboBox(self.profile_tab, values=list(GC_PRESETS), state="readonly")
+        self.profile_gc_combo.grid(row=6, column=0, sticky="ew", padx=12, pady=(4, 12))
+
+        ctk.CTkLabel(self.profile_tab, text="JVM arguments").grid(row=7, column=0, sticky="w", padx=12)
+        self.profile_jvm_args_entry = ctk.CTkEntry(self.profile_tab, placeholder_text="-XX:+AlwaysPreTouch")
+        self.profile_jvm_args_entry.grid(row=8, column=0, sticky="ew", padx=12, pady=(4, 12))
+
+        ctk.CTkLabel(self.profile_tab, text="Java runtime").grid(row=9, column=0, sticky="w", padx=12)
+        self.profile_runtime_combo = ctk.CTkComboBox(
+            self.profile_tab,
+            values=list(self.runtime_labels),
+            state="readonly",
+        )
+        self.profile_runtime_combo.grid(row=10, column=0, sticky="ew", padx=12, pady=(4, 12))
+
+        self.profile_cds_checkbox = ctk.CTkCheckBox(self.profile_tab, text="Class Data Sharing (faster startup)")
+        self.profile_cds_checkbox.grid(row=11, column=0, sticky="w", padx=12, pady=(0, 12))
+
         ctk.CTkButton(self.profile_tab, text="Save Profile", command=self.save_profile_fields).grid(
-            row=3,
+            row=12,
             column=0,
             sticky="ew",
             padx=12,
@@ -304,24 +465,52 @@ class LauncherApp(ctk.CTk):
         actions.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 10))
         actions.grid_columnconfigure((0, 1, 2), weight=1)
 
-        ctk.CTkButton(actions, text="Add File", command=self.add_custom_mod).grid(
+        ctk.CTkButton(actions, text="Add Files", command=self.add_custom_mods).grid(
             row=0,
             column=0,
             sticky="ew",
             padx=(0, 4),
         )
-        ctk.CTkButton(actions, text="Enable", command=lambda: self.toggle_selected_mod(True)).grid(
+        ctk.CTkButton(actions, text="Enable", command=lambda: self.toggle_selected_mods(True)).grid(
             row=0,
             column=1,
             sticky="ew",
             padx=4,
         )
-        ctk.CTkButton(actions, text="Disable", command=lambda: self.toggle_selected_mod(False)).grid(
+        ctk.CTkButton(actions, text="Disable", command=lambda: self.toggle_selected_mods(False)).grid(
             row=0,
             column=2,
             sticky="ew",
             padx=(4, 0),
         )
+        ctk.CTkButton(actions, text="Select All", command=self.select_all_mods).grid(
+            row=1,
+            column=0,
+            sticky="ew",
+            padx=(0, 4),
+            pady=(8, 0),
+        )
+        ctk.CTkButton(actions, text="Move To...", command=self.move_selected_mods).grid(
+            row=1,
+            column=1,
+            sticky="ew",
+            padx=4,
+            pady=(8, 0),
+        )
+        ctk.CTkButton(
+            actions,
+            text="Remove",
+            fg_color="#7a2630",
+            hover_color="#963040",
+            command=self.remove_selected_mods,
+        ).grid(row=1, column=2, sticky="ew", padx=(4, 0), pady=(8, 0))
+        ctk.CTkButton(actions, text="Find Crashing Mod", command=self.bisect_mods).grid(
+            row=2,
+            column=0,
+            columnspan=3,
+            sticky="ew",
+            pady=(8, 0),
+        )
 
     def _build_modrinth_tab(self) -> None:
         self.modrinth_tab.grid_columnconfigure(0, weight=1)
@@ -329,6 +518,8 @@ class LauncherApp(ctk.CTk):
 
         self.modrinth_query = ctk.CTkEntry(self.modrinth_tab, placeholder_text="Search Modrinth")
         self.modrinth_query.grid(row=0, column=0, sticky="ew", padx=8, pady=(12, 8))
+        self.modrinth_query.bind("<KeyRelease>", self.on_modrinth_typed)
+        self.modrinth_query.bind("<Return>", lambda _event: self.search_modrinth())
         ctk.CTkButton(self.modrinth_tab, text="Search", command=self.search_modrinth).grid(
             row=1,
             column=0,
@@ -337,7 +528,49 @@ class LauncherApp(ctk.CTk):
             pady=(0, 8),
         )
         self.modrinth_results_frame = ctk.CTkScrollableFrame(self.modrinth_tab, corner_radius=8)
-        self.modrinth_results_frame.grid(row=2, column=0, sticky="nsew", padx=8, pady=(0, 10))
+        self.modrinth_results_frame.grid(row=2, column=0, sticky="nsew", padx=8, pady=(0, 4))
+        self.modrinth_status = ctk.CTkLabel(self.modrinth_tab, text="", anchor="w", text_color="#8d99a6")
+        self.modrinth_status.grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 4))
+        self.offline_catalog_switch = ctk.CTkSwitch(
+            self.modrinth_tab,
+            text="Offline catalog",
+            command=self.toggle_offline_catalog,
+        )
+        self.offline_catalog_switch.grid(row=4, column=0, sticky="w", padx=12, pady=(0, 10))
+        if self.offline_catalog_enabled():
+            self.offline_catalog_switch.select()
+
+    def _build_history_tab(self) -> None:
+        self.history_tab.grid_columnconfigure(0, weight=1)
+        self.history_tab.grid_rowconfigure(0, weight=1)
+
+        self.history_frame = ctk.CTkScrollableFrame(self.history_tab, corner_radius=8)
+        self.history_frame.grid(row=0, column=0, sticky="nsew", padx=8, pady=(12, 10))
+
+    def _build_log_tab(self) -> None:
+        self.log_tab.grid_columnconfigure(0, weight=1)
+        self.log_tab.grid_rowconfigure(1, weight=1)
+
+        search = ctk.CTkFrame(self.log_tab, fg_color="transparent")
+        search.grid(row=0, column=0, sticky="ew", padx=8, pady=(12, 8))
+        search.grid_columnconfigure(0, weight=1)
+        self.log_search_entry = ctk.CTkEntry(search, placeholder_text="Search old logs")
+        self.log_search_entry.grid(row=0, column=0, sticky="ew", padx=(0, 6))
+        self.log_search_entry.bind("<Return>", lambda _event: self.search_log_archive())
+        ctk.CTkButton(search, text="Search", width=70, command=self.search_log_archive).grid(row=0, column=1)
+        self.instance_menu = ctk.CTkOptionMenu(
+            search,
+            values=[NO_INSTANCE_LABEL],
+            width=150,
+            command=self.select_instance,
+        )
+        self.instance_menu.grid(row=0, column=2, padx=(12, 6))
+        ctk.CTkButton(search, text="Stop", width=60, command=self.stop_active_instance).grid(row=0, column=3)
+        self.refresh_instances()
+
+        self.live_log_box = ctk.CTkTextbox(self.log_tab, wrap="none", font=("Consolas", 11))
+        self.live_log_box.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 10))
+        self.live_log_box.configure(state="disabled")
 
     def refresh_all(self) -> None:
         self.refresh_quickplay()
@@ -345,6 +578,7 @@ class LauncherApp(ctk.CTk):
         self.refresh_selected_profile()
         self.refresh_mods()
         self.refresh_modrinth_results()
+        self.refresh_launch_history()
 
     def current_profile(self) -> Profile:
         return self.profile_store.load_profile(self.selected_profile_id)
@@ -407,14 +641,27 @@ class LauncherApp(ctk.CTk):
         self.profile_icon_label.configure(text=profile.name[:1].upper() if profile.name else "?")
         self.profile_name_entry.delete(0, "end")
         self.profile_name_entry.insert(0, profile.name)
+        self.profile_heap_entry.delete(0, "end")
+        self.profile_heap_entry.insert(0, str(profile.jvm.heap_mb))
+        self.profile_gc_combo.set(profile.jvm.preset)
+        self.profile_jvm_args_entry.delete(0, "end")
+        self.profile_jvm_args_entry.insert(0, profile.jvm.extra_args)
+        self.profile_runtime_combo.set(self.runtime_label(profile.java_runtime))
+        if profile.jvm.class_data_sharing:
+            self.profile_cds_checkbox.select()
+        else:
+            self.profile_cds_checkbox.deselect()
 
     def refresh_mods(self) -> None:
+        if not self.tab_built("Mody"):
+            self.selected_mods.clear()
+            return
         for child in self.mods_frame.winfo_children():
             child.destroy()
+        self.mod_rows.clear()
 
-        selected_path = self.selected_mod.path if self.selected_mod else None
-        self.selected_mod = None
         mods = self.profile_store.list_mods(self.selected_profile_id)
+        self.selected_mods.intersection_update(mod_key(mod.path) for mod in mods)
         if not mods:
             ctk.CTkLabel(
                 self.mods_frame,
@@ -424,14 +671,15 @@ class LauncherApp(ctk.CTk):
             return
 
         for mod in mods:
-            selected = mod.path == selected_path
-            if selected:
-                self.selected_mod = mod
-            self._add_mod_row(mod, selected)
+            self._add_mod_row(mod, mod_key(mod.path) in self.selected_mods)
+
+    @staticmethod
+    def mod_row_color(mod: ProfileMod, selected: bool) -> str:
+        return "#1f6aa5" if selected else "#252b33" if mod.inherited else "#17251c" if mod.enabled else "#2a1717"
 
     def _add_mod_row(self, mod: ProfileMod, selected: bool) -> None:
-        color = "#1f6aa5" if selected else "#252b33" if mod.inherited else "#17251c" if mod.enabled else "#2a1717"
-        row = ctk.CTkFrame(self.mods_frame, fg_color=color, corner_radius=8)
+        row = ctk.CTkFrame(self.mods_frame, fg_color=self.mod_row_color(mod, selected), corner_radius=8)
+        self.mod_rows[mod_key(mod.path)] = (row, mod)
         row.pack(fill="x", pady=4)
         row.grid_columnconfigure(1, weight=1)
 
@@ -463,9 +711,9 @@ class LauncherApp(ctk.CTk):
             padx=8,
         )
 
-        row.bind("<Button-1>", lambda _event, selected_mod=mod: self.select_mod(selected_mod))
+        row.bind("<Button-1>", lambda event, selected_mod=mod: self.select_mod(selected_mod, event.state))
         for child in row.winfo_children():
-            child.bind("<Button-1>", lambda _event, selected_mod=mod: self.select_mod(selected_mod))
+            child.bind("<Button-1>", lambda event, selected_mod=mod: self.select_mod(selected_mod, event.state))
         if mod.inherited:
             text = "Skopiowane z profilu Default. Edytuj ten mod w profilu Default."
             self.tooltip.bind(row, text)
@@ -473,9 +721,12 @@ class LauncherApp(ctk.CTk):
                 self.tooltip.bind(child, text)
 
     def refresh_modrinth_results(self) -> None:
+        if not self.tab_built("Modrinth"):
+            return
         for child in self.modrinth_results_frame.winfo_children():
             child.destroy()
 
+        self.modrinth_more = None
         if not self.modrinth_results:
             ctk.CTkLabel(
                 self.modrinth_results_frame,
@@ -485,49 +736,286 @@ class LauncherApp(ctk.CTk):
             return
 
         for project in self.modrinth_results:
-            row = ctk.CTkFrame(self.modrinth_results_frame, fg_color="#171c22", corner_radius=8)
-            row.pack(fill="x", pady=5)
+            self._add_modrinth_row(project)
+        self._add_modrinth_more()
+
+    def _add_modrinth_row(self, project: ModrinthProject) -> None:
+        row = ctk.CTkFrame(self.modrinth_results_frame, fg_color="#171c22", corner_radius=8)
+        row.pack(fill="x", pady=5)
+        row.grid_columnconfigure(0, weight=1)
+        ctk.CTkLabel(row, text=project.title, anchor="w", font=ctk.CTkFont(weight="bold")).grid(
+            row=0,
+            column=0,
+            sticky="ew",
+            padx=10,
+            pady=(8, 0),
+        )
+        ctk.CTkLabel(
+            row,
+            text=project.description,
+            anchor="w",
+            justify="left",
+            wraplength=220,
+            text_color="#a8b3bd",
+        ).grid(row=1, column=0, sticky="ew", padx=10, pady=(2, 8))
+        ctk.CTkButton(row, text="Add", width=64, command=lambda p=project: self.install_modrinth(p)).grid(
+            row=0,
+            column=1,
+            rowspan=2,
+            padx=8,
+        )
+
+    def _add_modrinth_more(self) -> None:
+        self.modrinth_more = None
+        if not self.modrinth_pages or not self.modrinth_pages[-1].has_more:
+            return
+        self.modrinth_more = ctk.CTkButton(
+            self.modrinth_results_frame,
+            text="Load more",
+            fg_color="#2b3440",
+            hover_color="#3a4654",
+            command=self.load_more_modrinth,
+        )
+        self.modrinth_more.pack(fill="x", padx=10, pady=(5, 10))
+
+    def refresh_launch_history(self) -> None:
+        if not self.tab_built("History"):
+            return
+        for child in self.history_frame.winfo_children():
+            child.destroy()
+
+        history = load_launch_history(self.paths.launch_history)
+        if not history:
+            ctk.CTkLabel(
+                self.history_frame,
+                text="No launches recorded yet.",
+                text_color="#8d99a6",
+            ).pack(anchor="w", padx=10, pady=10)
+            return
+
+        for record in history:
+            regression = is_regression(record, history)
+            row = ctk.CTkFrame(
+                self.history_frame,
+                fg_color="#2a1717" if regression else "#171c22",
+                corner_radius=8,
+            )
+            row.pack(fill="x", pady=4)
             row.grid_columnconfigure(0, weight=1)
-            ctk.CTkLabel(row, text=project.title, anchor="w", font=ctk.CTkFont(weight="bold")).grid(
-                row=0,
-                column=0,
-                sticky="ew",
-                padx=10,
-                pady=(8, 0),
+            ready = record.get("ready_seconds")
+            ready_text = f"ready in {ready:.1f}s" if ready else str(record.get("status", ""))
+            if regression:
+                ready_text += " (slower)"
+            ctk.CTkLabel(
+                row,
+                text=f"{record.get('profile_name', '')} - {record.get('version', '')}",
+                anchor="w",
+                font=ctk.CTkFont(weight="bold"),
+            ).grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
+            ctk.CTkLabel(row, text=ready_text, text_color="#a8b3bd").grid(row=0, column=1, padx=10, pady=(8, 0))
+            phases = ", ".join(
+                f"{phase['name']} {phase['seconds']:.1f}s"
+                for phase in record.get("phases", [])
+                if isinstance(phase, dict) and phase.get("seconds", 0) >= 0.05
             )
+            resources = record.get("details", {}).get("resources")
+            if isinstance(resources, dict) and resources.get("samples"):
+                phases += (
+                    f"\nRAM peak {resources.get('peak_rss_mb', 0):.0f} MB, "
+                    f"CPU avg {resources.get('avg_cpu_percent', 0):.0f}%"
+                )
             ctk.CTkLabel(
                 row,
-                text=project.description,
+                text=f"{record.get('started_at', '')}\n{phases}",
                 anchor="w",
                 justify="left",
-                wraplength=220,
-                text_color="#a8b3bd",
-            ).grid(row=1, column=0, sticky="ew", padx=10, pady=(2, 8))
-            ctk.CTkButton(row, text="Add", width=64, command=lambda p=project: self.install_modrinth(p)).grid(
-                row=0,
-                column=1,
-                rowspan=2,
-                padx=8,
+                wraplength=260,
+                text_color="#8d99a6",
+            ).grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(2, 8))
+
+    def attach_live_log(self, pipeline: GameLogPipeline) -> None:
+        self.log_pipeline = pipeline
+        self.live_log_seq = 0
+        self.show_live_log()
+
+    def show_live_log(self) -> None:
+        if not self.tab_built("Log") or self.log_pipeline is None:
+            return
+        self.live_log_box.configure(state="normal")
+        self.live_log_box.delete("1.0", "end")
+        self.live_log_box.configure(state="disabled")
+        self.poll_live_log()
+
+    def poll_live_log(self) -> None:
+        pipeline = self.log_pipeline
+        if pipeline is None:
+            return
+        self.live_log_seq, lines = pipeline.tail(self.live_log_seq)
+        if lines:
+            self.live_log_box.configure(state="normal")
+            self.live_log_box.insert("end", "\n".join(lines[-LIVE_LOG_LINES:]) + "\n")
+            line_count = int(self.live_log_box.index("end-1c").split(".")[0])
+            if line_count > LIVE_LOG_LINES:
+                self.live_log_box.delete("1.0", f"{line_count - LIVE_LOG_LINES}.0")
+            self.live_log_box.see("end")
+            self.live_log_box.configure(state="disabled")
+        if pipeline.buffer.closed and pipeline.buffer.next_seq == self.live_log_seq:
+            return
+        self.after(LIVE_LOG_INTERVAL_MS, self.poll_live_log)
+
+    def show_resource_graph(self, session: GameSession) -> None:
+        if not self.game_launcher.resource_monitor.available:
+            return
+        self.resource_frame.grid()
+        self.poll_resource_graph(session)
+
+    def poll_resource_graph(self, session: GameSession) -> None:
+        monitor = self.game_launcher.resource_monitor
+        samples = monitor.history(session.process.pid, RESOURCE_GRAPH_SAMPLES)
+        active = self.active_instance
+        if active is None or active.session is not session or session.process.poll() is not None:
+            self.resource_graph.delete("all")
+            self.resource_frame.grid_remove()
+            return
+
+        self.resource_graph.delete("all")
+        if samples:
+            latest = samples[-1]
+            self.resource_label.configure(
+                text=f"RAM {latest.rss_bytes / MIB:.0f} MB  CPU {latest.cpu_percent:.0f}%  {latest.threads} thr"
             )
+            step = RESOURCE_GRAPH_WIDTH / max(RESOURCE_GRAPH_SAMPLES - 1, 1)
+            offset = RESOURCE_GRAPH_WIDTH - step * (len(samples) - 1)
+            peak_rss = max(sample.rss_bytes for sample in samples) or 1
+            peak_cpu = max(100.0, *(sample.cpu_percent for sample in samples))
+            for values, peak, color in (
+                ([sample.rss_bytes for sample in samples], peak_rss, "#4f9cf0"),
+                ([sample.cpu_percent for sample in samples], peak_cpu, "#e0a040"),
+            ):
+                if len(values) < 2:
+                    continue
+                points = []
+                for index, value in enumerate(values):
+                    points.extend(
+                        (offset + index * step, RESOURCE_GRAPH_HEIGHT - 2 - value / peak * (RESOURCE_GRAPH_HEIGHT - 4))
+                    )
+                self.resource_graph.create_line(*points, fill=color, width=1.5)
+        self.after(RESOURCE_GRAPH_INTERVAL_MS, lambda: self.poll_resource_graph(session))
+
+    def search_log_archive(self) -> None:
+        query = self.log_search_entry.get().strip()
+        if not query:
+            Dialog.show(self, "Search", "Type an error, class or mod name first.", "warning")
+            return
+
+        self.tasks.submit(
+            lambda: self.log_archive.search(query),
+            key="log-search",
+            on_done=lambda hits: self.show_log_search_results(query, hits),
+            on_error=lambda error: Dialog.show(self, "Log search failed", str(error), "error"),
+        )
+
+    def show_log_search_results(self, query: str, hits: list[LogSearchHit]) -> None:
+        window = ctk.CTkToplevel(self)
+        window.title(f"Logs: {query}")
+        window.geometry("760x420")
+        window.transient(self)
+        box = ctk.CTkTextbox(window, wrap="none", font=("Consolas", 11))
+        box.pack(fill="both", expand=True, padx=12, pady=12)
+        if hits:
+            box.insert("end", "\n".join(f"{hit.archive}:{hit.line_number}: {hit.line}" for hit in hits))
+        else:
+            box.insert("end", "No matching error lines in archived logs.")
+        box.configure(state="disabled")
 
     def load_image(self, path: Path | None, size: tuple[int, int]) -> ctk.CTkImage | None:
-        if not path or Image is None or not path.exists():
+        if not path:
+            return None
+        cached = self.image_cache.get((path, size))
+        if cached is not None:
+            return cached
+        if not path.exists():
             return None
         try:
+            from PIL import Image
+
             image = ctk.CTkImage(Image.open(path), size=size)
         except Exception:
             return None
-        self.image_refs.append(image)
+        self.image_cache[(path, size)] = image
         return image
 
+    def start_file_watcher(self) -> None:
+        roots = [
+            WatchRoot(self.paths.profiles, depth=2),
+            WatchRoot(self.paths.minecraft / "versions", depth=1),
+            WatchRoot(self.paths.modrinth_icons),
+        ]
+        try:
+            self.file_watcher = FileWatcher(
+                roots,
+                lambda events: self.dispatcher(lambda: self.on_files_changed(events)),
+                on_degraded=self.on_watcher_degraded,
+            )
+        except OSError as error:
+            print(f"[WATCH] File watcher unavailable: {error}")
+            return
+        self.profile_store.invalidate()
+        self.profile_store.live = self.file_watcher.live
+        self.file_watcher.start()
+        print(f"[WATCH] Watching profiles, versions and icons ({self.file_watcher.backend_name})")
+
+    def on_watcher_degraded(self, reason: str) -> None:
+        self.profile_store.live = False
+        print(f"[WATCH] Falling back to modification-time checks for mods: {reason}")
+
+    def on_files_changed(self, events: list[FileEvent]) -> None:
+        overflow = any(event.kind == "overflow" for event in events)
+        if overflow or any(event.root == self.paths.minecraft / "versions" for event in events):
+            self.game_launcher.invalidate_versions()
+
+        icons = {event.path for event in events if event.root == self.paths.modrinth_icons}
+        stale_icons = [key for key in self.image_cache if overflow or key[0] in icons]
+        for key in stale_icons:
+            del self.image_cache[key]
+
+        profile_events = [event for event in events if event.root == self.paths.profiles]
+        changed = self.profile_store.apply_changes(event.path for event in profile_events)
+        profile_list_changed = overflow or any(
+            len(parts) == 1 or parts[1] == "profile.json"
+            for parts in (event.path.relative_to(self.paths.profiles).parts for event in profile_events)
+            if parts
+        )
+        if profile_list_changed:
+            if not self.profile_store.profile_config_path(self.selected_profile_id).exists():
+                self.select_profile(DEFAULT_PROFILE_ID)
+                return
+            self.refresh_profiles()
+            self.refresh_quickplay()
+        if stale_icons or self.selected_profile_id in changed or DEFAULT_PROFILE_ID in changed:
+            self.refresh_mods_if_changed(force=bool(stale_icons))
+
+    def refresh_mods_if_changed(self, force: bool = False) -> None:
+        if not self.tab_built("Mody"):
+            return
+        shown = [(mod.path, mod.enabled, mod.name, mod.icon_path) for _row, mod in self.mod_rows.values()]
+        current = [
+            (mod.path, mod.enabled, mod.name, mod.icon_path)
+            for mod in self.profile_store.list_mods(self.selected_profile_id)
+        ]
+        if force or shown != current:
+            self.refresh_mods()
+
     def select_profile(self, profile_id: str) -> None:
         self.selected_profile_id = profile_id
         self.config.set("selected_profile_id", profile_id)
-        self.selected_mod = None
+        self.selected_mods.clear()
+        self.mod_anchor = None
         self.refresh_profiles()
         self.refresh_selected_profile()
         self.refresh_mods()
         self.refresh_quickplay()
+        self.sync_mod_catalog()
 
     def create_profile(self) -> None:
         dialog = ctk.CTkInputDialog(text="Profile name", title="New Profile")
@@ -538,13 +1026,51 @@ class LauncherApp(ctk.CTk):
         self.select_profile(profile.id)
 
     def save_profile_fields(self) -> None:
+        heap_text = self.profile_heap_entry.get().strip() or "0"
+        if not heap_text.isdigit():
+            Dialog.show(self, "Invalid memory", "Memory must be a whole number of megabytes.", "warning")
+            return
+        if 0 < int(heap_text) < MIN_HEAP_MB:
+            Dialog.show(self, "Invalid memory", f"Memory must be at least {MIN_HEAP_MB} MB, or 0 for auto.", "warning")
+            return
         self.profile_store.update_profile(
             self.selected_profile_id,
             name=self.profile_name_entry.get(),
             version=self.version_combo.get(),
+            jvm=JvmSettings(
+                preset=self.profile_gc_combo.get(),
+                heap_mb=int(heap_text),
+                extra_args=self.profile_jvm_args_entry.get().strip(),
+                class_data_sharing=bool(self.profile_cds_checkbox.get()),
+            ),
+            java_runtime=self.runtime_labels.get(self.profile_runtime_combo.get(), self.current_profile().java_runtime),
         )
         self.refresh_all()
 
+    def discover_runtimes(self) -> None:
+        self.tasks.submit(
+            lambda: self.runtime_manager.discover(refresh=True),
+            key="java-runtimes",
+            priority=TaskPriority.PREFETCH,
+            on_done=self.apply_runtimes,
+        )
+
+    def apply_runtimes(self, runtimes: list[JavaRuntime]) -> None:
+        self.runtime_labels = {AUTO_RUNTIME_LABEL: ""}
+        for runtime in runtimes:
+            self.runtime_labels[runtime.label] = str(runtime.path)
+        self.profile_runtime_combo.configure(values=list(self.runtime_labels))
+        self.profile_runtime_combo.set(self.runtime_label(self.current_profile().java_runtime))
+
+    def runtime_label(self, path: str) -> str:
+        if not path:
+            return AUTO_RUNTIME_LABEL
+        label = next((label for label, value in self.runtime_labels.items() if value == path), None)
+        if label is None:
+            label = path
+            self.runtime_labels[label] = path
+        return label
+
     def on_version_change(self, version: str) -> None:
         self.profile_store.update_profile(self.selected_profile_id, version=version)
         self.refresh_selected_profile()
@@ -554,37 +1080,125 @@ class LauncherApp(ctk.CTk):
         self.config.set("username", self.username_entry.get().strip())
 
     def split_server_address(self, host: str, port: str) -> tuple[str, str]:
-        host = host.strip()
-        port = port.strip()
-        if ":" in host and not port:
-            split_host, split_port = host.rsplit(":", 1)
-            if split_port.isdigit():
-                return split_host, split_port
-        return host, port
-
-    def add_custom_mod(self) -> None:
-        path = pick_mod_file(self.winfo_id())
-        if not path:
-            return
+        return split_server_address(host, port)
+
+    def add_custom_mods(self) -> None:
         try:
-            self.profile_store.add_custom_mod(self.selected_profile_id, Path(path))
-            self.refresh_mods()
+            paths = pick_mod_files(self.winfo_id())
         except Exception as error:
             Dialog.show(self, "Add mod failed", str(error), "error")
+            return
+        if paths:
+            profile_id = self.selected_profile_id
+            self.apply_bulk_mods("Add mod failed", lambda: self.profile_store.add_custom_mods(profile_id, paths))
+
+    def select_mod(self, mod: ProfileMod, state: int = 0) -> None:
+        key = mod_key(mod.path)
+        order = list(self.mod_rows)
+        if state & SHIFT_MASK and self.mod_anchor in self.mod_rows:
+            first, last = sorted((order.index(self.mod_anchor), order.index(key)))
+            self.selected_mods = set(order[first : last + 1])
+        elif state & CONTROL_MASK:
+            self.selected_mods ^= {key}
+            self.mod_anchor = key
+        else:
+            self.selected_mods = {key}
+            self.mod_anchor = key
+        self.update_mod_selection()
 
-    def select_mod(self, mod: ProfileMod) -> None:
-        self.selected_mod = mod
-        self.refresh_mods()
+    def select_all_mods(self) -> None:
+        everything = {key for key, (_row, mod) in self.mod_rows.items() if not mod.inherited}
+        self.selected_mods = set() if self.selected_mods == everything else everything
+        self.update_mod_selection()
 
-    def toggle_selected_mod(self, enable: bool) -> None:
-        if not self.selected_mod:
-            Dialog.show(self, "Select mod", "Please select a mod first.", "warning")
-            return
+    def update_mod_selection(self) -> None:
+        for key, (row, mod) in self.mod_rows.items():
+            row.configure(fg_color=self.mod_row_color(mod, key in self.selected_mods))
+
+    def selected_mod_list(self) -> list[ProfileMod]:
+        return [mod for key, (_row, mod) in self.mod_rows.items() if key in self.selected_mods]
+
+    def apply_bulk_mods(self, title: str, operation: Callable[[], BulkModResult]) -> None:
         try:
-            self.profile_store.toggle_mod(self.selected_mod, enable)
-            self.refresh_mods()
+            result = operation()
         except Exception as error:
-            Dialog.show(self, "Mod update failed", str(error), "error")
+            Dialog.show(self, title, str(error), "error")
+            return
+        self.refresh_mods()
+        if result.failed or result.skipped:
+            lines = [result.summary]
+            lines.extend(f"{item.name}: {reason}" for item, reason in result.failed[:5])
+            if result.skipped:
+                lines.append("Inherited mods can only be edited in the Default profile.")
+            Dialog.show(self, title, "\n".join(lines), "warning")
+
+    def toggle_selected_mods(self, enable: bool) -> None:
+        mods = self.selected_mod_list()
+        if not mods:
+            Dialog.show(self, "Select mod", "Please select a mod first.", "warning")
+            return
+        self.apply_bulk_mods("Mod update failed", lambda: self.profile_store.set_mods_enabled(mods, enable))
+
+    def remove_selected_mods(self) -> None:
+        mods = [mod for mod in self.selected_mod_list() if not mod.inherited]
+        if not mods:
+            Dialog.show(self, "Select mod", "Please select a mod from this profile first.", "warning")
+            return
+        names = ", ".join(mod.name for mod in mods[:5]) + (f" and {len(mods) - 5} more" if len(mods) > 5 else "")
+        if not Dialog.confirm(self, "Remove mods", f"Delete {names} from this profile?"):
+            return
+        self.apply_bulk_mods("Remove mods failed", lambda: self.profile_store.remove_mods(mods))
+
+    def move_selected_mods(self) -> None:
+        mods = [mod for mod in self.selected_mod_list() if not mod.inherited]
+        if not mods:
+            Dialog.show(self, "Select mod", "Please select a mod from this profile first.", "warning")
+            return
+        others = [profile for profile in self.profile_store.list_profiles() if profile.id != self.selected_profile_id]
+        if not others:
+            Dialog.show(self, "Move mods", "Create another profile to move mods into first.", "warning")
+            return
+        self.open_move_mods_dialog(mods, others)
+
+    def open_move_mods_dialog(self, mods: list[ProfileMod], others: list[Profile]) -> None:
+        target_ids: dict[str, str] = {}
+        for profile in others:
+            label = f"{profile.name} ({profile.version})"
+            if label in target_ids:
+                label = f"{label} [{profile.id}]"
+            target_ids[label] = profile.id
+
+        window = ctk.CTkToplevel(self)
+        window.title("Move mods")
+        window.geometry("380x170")
+        window.resizable(False, False)
+        window.transient(self)
+        window.grab_set()
+
+        body = ctk.CTkFrame(window, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=18, pady=18)
+        body.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(body, text=f"Move {len(mods)} mods to").grid(row=0, column=0, sticky="w")
+        target_combo = ctk.CTkComboBox(body, values=list(target_ids), state="readonly")
+        target_combo.grid(row=1, column=0, sticky="ew", pady=(4, 14))
+        target_combo.set(next(iter(target_ids)))
+
+        actions = ctk.CTkFrame(body, fg_color="transparent")
+        actions.grid(row=2, column=0, sticky="ew")
+        actions.grid_columnconfigure(0, weight=1)
+
+        def close() -> None:
+            window.grab_release()
+            window.destroy()
+
+        def move() -> None:
+            target_id = target_ids[target_combo.get()]
+            close()
+            self.apply_bulk_mods("Move mods failed", lambda: self.profile_store.move_mods(mods, target_id))
+
+        ctk.CTkButton(actions, text="Cancel", width=100, command=close).grid(row=0, column=1, padx=(0, 8))
+        ctk.CTkButton(actions, text="Move", width=100, command=move).grid(row=0, column=2)
 
     def open_profile_folder(self) -> None:
         folder = self.profile_store.mods_dir(self.selected_profile_id)
@@ -593,52 +1207,172 @@ class LauncherApp(ctk.CTk):
         except Exception as error:
             Dialog.show(self, "Open folder failed", str(error), "error")
 
-    def search_modrinth(self) -> None:
+    def on_modrinth_typed(self, event) -> None:
+        if event.keysym in ("Return", "KP_Enter"):
+            return
+        if self.search_after_id is not None:
+            self.after_cancel(self.search_after_id)
+        self.search_after_id = self.after(SEARCH_DEBOUNCE_MS, lambda: self.search_modrinth(explicit=False))
+
+    def search_modrinth(self, explicit: bool = True) -> None:
+        if self.search_after_id is not None:
+            self.after_cancel(self.search_after_id)
+            self.search_after_id = None
         query = self.modrinth_query.get().strip()
         if not query:
-            Dialog.show(self, "Search", "Type a mod name first.", "warning")
+            self.tasks.cancel("modrinth-search")
+            self.modrinth_pages = []
+            self.modrinth_results = []
+            self.modrinth_status.configure(text="")
+            self.refresh_modrinth_results()
+            if explicit:
+                Dialog.show(self, "Search", "Type a mod name first.", "warning")
             return
-        profile = self.current_profile()
-        self.set_busy(True, "Searching Modrinth...")
+        version = self.current_profile().version
+        if not explicit:
+            if len(query) < SEARCH_MIN_CHARS:
+                return
+            shown = self.modrinth_pages[0] if self.modrinth_pages else None
+            if shown and SearchCache.key(query, version, 0) == SearchCache.key(shown.query, shown.game_version, 0):
+                return
+        self.load_modrinth_page(query, version, 0, explicit)
 
-        def worker() -> None:
-            try:
-                results = search_mods(query, profile.version)
-                self.after(0, lambda: self.apply_modrinth_results(results))
-            except Exception as error:
-                self.after(0, lambda: Dialog.show(self, "Modrinth search failed", str(error), "error"))
-            finally:
-                self.after(0, lambda: self.set_busy(False, ""))
+    def offline_catalog_enabled(self) -> bool:
+        return bool(self.config.get("offline_catalog", False))
 
-        threading.Thread(target=worker, daemon=True).start()
+    def toggle_offline_catalog(self) -> None:
+        enabled = bool(self.offline_catalog_switch.get())
+        self.config.set("offline_catalog", enabled)
+        self.search_cache.clear()
+        if enabled:
+            self.sync_mod_catalog()
 
-    def apply_modrinth_results(self, results: list[ModrinthProject]) -> None:
-        self.modrinth_results = results
-        self.refresh_modrinth_results()
+    def fetch_modrinth_page(self, query: str, game_version: str, page: int, page_size: int) -> SearchPage:
+        if self.offline_catalog_enabled() and self.mod_catalog.has_version(game_version):
+            return self.mod_catalog.search(query, game_version, page, page_size)
+        from .modrinth import search_page
+
+        return search_page(query, game_version, page, page_size)
+
+    def sync_mod_catalog(self) -> None:
+        if not self.offline_catalog_enabled():
+            return
+        version = self.current_profile().version
+        if version in self.catalog_syncing:
+            return
+        self.catalog_syncing.add(version)
+
+        def sync() -> CatalogSyncResult | None:
+            if not self.mod_catalog.needs_sync(version):
+                return None
+            return self.mod_catalog.sync(version, should_stop=lambda: self.tasks.closed)
+
+        def synced(result: CatalogSyncResult | None) -> None:
+            if result is None:
+                return
+            print(f"[CATALOG] {result.summary}")
+            if result.complete:
+                self.search_cache.clear()
+
+        self.tasks.submit(
+            sync,
+            key=f"catalog-sync:{version}",
+            priority=TaskPriority.PREFETCH,
+            on_done=synced,
+            on_error=lambda error: print(f"[CATALOG] Sync for {version} failed: {error}"),
+            on_finally=lambda: self.catalog_syncing.discard(version),
+        )
+
+    def load_more_modrinth(self) -> None:
+        if not self.modrinth_pages:
+            return
+        last = self.modrinth_pages[-1]
+        if self.modrinth_more is not None:
+            self.modrinth_more.configure(state="disabled", text="Loading...")
+        self.load_modrinth_page(last.query, last.game_version, last.page + 1, True)
+
+    def load_modrinth_page(self, query: str, game_version: str, page: int, explicit: bool) -> None:
+        self.tasks.cancel("modrinth-search")
+        cached = self.search_cache.get(query, game_version, page)
+        if cached is not None:
+            self.apply_modrinth_page(cached)
+            return
+        self.modrinth_status.configure(text="Searching Modrinth...")
+
+        def failed(error: Exception) -> None:
+            self.modrinth_status.configure(text="Search failed.")
+            if self.modrinth_more is not None:
+                self.modrinth_more.configure(state="normal", text="Load more")
+            if explicit:
+                Dialog.show(self, "Modrinth search failed", str(error), "error")
+
+        self.tasks.submit(
+            lambda: self.search_cache.fetch(query, game_version, page),
+            key="modrinth-search",
+            priority=TaskPriority.SEARCH,
+            on_done=self.apply_modrinth_page,
+            on_error=failed,
+        )
+
+    def apply_modrinth_page(self, result: SearchPage) -> None:
+        if result.page == 0:
+            self.modrinth_pages = [result]
+            self.modrinth_results = list(result.projects)
+            self.refresh_modrinth_results()
+        elif self.modrinth_pages and result.page == self.modrinth_pages[-1].page + 1:
+            self.modrinth_pages.append(result)
+            self.modrinth_results.extend(result.projects)
+            if self.tab_built("Modrinth"):
+                if self.modrinth_more is not None:
+                    self.modrinth_more.destroy()
+                for project in result.projects:
+                    self._add_modrinth_row(project)
+                self._add_modrinth_more()
+        else:
+            return
+        if self.tab_built("Modrinth"):
+            self.modrinth_status.configure(text=f"{len(self.modrinth_results)} of {result.total_hits} mods")
+        self.prefetch_modrinth_page(result)
+
+    def prefetch_modrinth_page(self, result: SearchPage) -> None:
+        if not result.has_more:
+            return
+        following = result.page + 1
+        if SearchCache.key(result.query, result.game_version, following) in self.search_cache:
+            return
+        self.tasks.submit(
+            lambda: self.search_cache.fetch(result.query, result.game_version, following),
+            key="modrinth-prefetch",
+            priority=TaskPriority.PREFETCH,
+            on_error=lambda _error: None,
+        )
 
     def install_modrinth(self, project: ModrinthProject) -> None:
         profile = self.current_profile()
         self.set_busy(True, f"Downloading {project.title}...")
 
-        def worker() -> None:
-            try:
-                download_dir = self.paths.cache / "modrinth-downloads"
-                icon = download_project_icon(project, self.paths.modrinth_icons)
-                mod_file = download_project_file(project, profile.version, download_dir)
-                self.profile_store.add_downloaded_mod(
-                    profile.id,
-                    mod_file,
-                    title=project.title,
-                    project_id=project.project_id,
-                    icon_path=icon,
-                )
-                self.after(0, self.refresh_mods)
-            except Exception as error:
-                self.after(0, lambda: Dialog.show(self, "Modrinth install failed", str(error), "error"))
-            finally:
-                self.after(0, lambda: self.set_busy(False, ""))
+        def install() -> None:
+            from .modrinth import download_project_file, download_project_icon
+
+            download_dir = self.paths.cache / "modrinth-downloads"
+            icon = download_project_icon(project, self.paths.modrinth_icons)
+            mod_file = download_project_file(project, profile.version, download_dir)
+            self.profile_store.add_downloaded_mod(
+                profile.id,
+                mod_file,
+                title=project.title,
+                project_id=project.project_id,
+                icon_path=icon,
+            )
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.tasks.submit(
+            install,
+            key=f"install:{profile.id}:{project.project_id}",
+            priority=TaskPriority.INSTALL,
+            on_done=lambda _result: self.refresh_mods(),
+            on_error=lambda error: Dialog.show(self, "Modrinth install failed", str(error), "error"),
+            on_finally=lambda: self.set_busy(False, ""),
+        )
 
     def load_quickplays(self) -> list[QuickPlaySlot]:
         raw = self.config.get("quickplays", [])
@@ -795,89 +1529,261 @@ class LauncherApp(ctk.CTk):
                 "warning",
             )
             return
+        if self.bisecting:
+            Dialog.show(self, "Searching for a crash", "Wait for the crashing mod search to finish first.", "warning")
+            return
 
         profile = self.safe_profile(profile_id or self.selected_profile_id)
         host = server_host or ""
         port = server_port or ""
 
-        self.config.set("username", username)
-        self.config.set("last_profile_id", profile.id)
+        with self.config.transaction():
+            self.config.set("username", username)
+            self.config.set("last_profile_id", profile.id)
         self.set_busy(True, f"Preparing {profile.name}...")
+        timeline = LaunchTimeline(profile.id, profile.name, profile.version)
 
-        thread = threading.Thread(
-            target=self._launch_worker,
-            args=(username, profile.id, host or "", port or ""),
-            daemon=True,
+        self.pending_launches += 1
+        self.tasks.submit(
+            lambda: self._launch_worker(username, profile.id, host, port, timeline),
+            priority=TaskPriority.LAUNCH,
+            on_finally=self.launch_settled,
         )
-        thread.start()
 
-    def _launch_worker(self, username: str, profile_id: str, server_host: str, server_port: str) -> None:
+    def launch_settled(self) -> None:
+        self.pending_launches -= 1
+
+    def _launch_worker(
+        self,
+        username: str,
+        profile_id: str,
+        server_host: str,
+        server_port: str,
+        timeline: LaunchTimeline,
+    ) -> None:
+        game_dir = self.supervisor.reserve_game_dir(self.paths.minecraft, self.paths.instances)
         try:
-            profile = self.profile_store.load_profile(profile_id)
-            version_id = installed_fabric_id(self.paths.minecraft, profile.version)
-            if not version_id:
-                self.after(0, lambda: self.set_busy(True, f"Installing Fabric {profile.version}..."))
-                install_fabric(self.paths.minecraft, profile.version)
-                version_id = installed_fabric_id(self.paths.minecraft, profile.version)
-
-            if not version_id:
-                raise RuntimeError(f"Fabric {profile.version} could not be installed.")
-
-            self.profile_store.prepare_mods(profile.id, self.paths.minecraft)
-            command = build_launch_command(
-                self.paths.minecraft,
-                version_id,
+            prepared = self.game_launcher.prepare(
+                profile_id,
                 username,
+                timeline,
                 server_host,
                 server_port,
+                on_status=lambda text: self.after(0, lambda: self.set_busy(True, text)),
+                game_dir=game_dir,
             )
-            latest_log = rotate_latest_log(self.paths.logs)
-
-            with latest_log.open("w", encoding="utf-8") as log_file:
-                self.minecraft_proc = start_process(command, self.paths.minecraft, log_file)
-                self.after(0, lambda: self.set_busy(False, f"Running {profile.name}"))
-                self.minecraft_proc.wait()
-
-            time.sleep(1)
-            self.profile_store.restore_mods(self.paths.minecraft)
-            self.minecraft_proc = None
-            self.after(0, self.refresh_quickplay)
-            self.after(0, lambda: self.set_busy(False, "Minecraft closed"))
+            session = self.game_launcher.start(prepared, timeline)
         except Exception as error:
             traceback.print_exc()
-            self.profile_store.restore_mods(self.paths.minecraft)
-            self.minecraft_proc = None
+            self.game_launcher.abort(timeline, error, game_dir)
+            self.supervisor.release_game_dir(game_dir)
+            self.after(0, self.refresh_launch_history)
             self.after(0, lambda: self.set_busy(False, ""))
             self.after(0, lambda: Dialog.show(self, "Launch failed", str(error), "error"))
+            return
+
+        instance = self.supervisor.add(session, self.on_instance_exit)
+        self.game_launcher.watch_ready(session, lambda _seconds: self.after(0, self.refresh_launch_history))
+        self.after(0, lambda: self.show_instance(instance))
+        self.after(0, lambda: self.set_busy(False, prepared.status))
+
+    def on_instance_exit(self, instance: GameInstance) -> None:
+        self.tasks.submit(
+            lambda: self.game_launcher.finish(instance.session),
+            priority=TaskPriority.LAUNCH,
+            on_done=lambda crash: self.instance_finished(instance, crash),
+            on_error=lambda error: self.instance_finished(instance, None, error),
+        )
+
+    def instance_finished(
+        self,
+        instance: GameInstance,
+        crash: CrashReport | None,
+        error: Exception | None = None,
+    ) -> None:
+        self.supervisor.release_game_dir(instance.game_dir)
+        if self.active_instance is instance:
+            running = self.supervisor.running()
+            self.active_instance = None
+            if running:
+                self.show_instance(running[-1])
+        self.refresh_instances()
+        self.refresh_launch_history()
+        self.refresh_quickplay()
+        if crash is None:
+            print(f"[LAUNCH] Cleanup after {instance.label} failed: {error}")
+            self.profile_store.restore_mods(instance.game_dir)
+            self.set_busy(False, f"{instance.label}: exit code {instance.exit_code}")
+            return
+        self.set_busy(False, f"{instance.label}: {crash.summary}")
+        if crash.crashed:
+            self.show_crash_report(crash)
+
+    def show_instance(self, instance: GameInstance) -> None:
+        if not instance.running:
+            return
+        self.active_instance = instance
+        self.attach_live_log(instance.session.pipeline)
+        self.show_resource_graph(instance.session)
+        self.refresh_instances()
+
+    def refresh_instances(self) -> None:
+        if not self.tab_built("Log"):
+            return
+        labels = [instance.label for instance in self.supervisor.running()]
+        self.instance_menu.configure(values=labels or [NO_INSTANCE_LABEL])
+        active = self.active_instance
+        self.instance_menu.set(active.label if active is not None and active.label in labels else NO_INSTANCE_LABEL)
+
+    def select_instance(self, label: str) -> None:
+        for instance in self.supervisor.running():
+            if instance.label == label:
+                self.show_instance(instance)
+                return
+
+    def stop_active_instance(self) -> None:
+        instance = self.active_instance
+        if instance is None or not instance.running:
+            return
+        self.set_busy(True, f"Stopping {instance.label}...")
+        self.tasks.submit(
+            lambda: self.supervisor.stop(instance.id),
+            priority=TaskPriority.LAUNCH,
+            on_finally=lambda: self.set_busy(False, f"Stopped {instance.label}"),
+        )
+
+    def bisect_mods(self) -> None:
+        if self.is_minecraft_running() or self.bisecting or self.pending_launches:
+            Dialog.show(self, "Minecraft is running", "Close Minecraft before searching for a crashing mod.", "warning")
+            return
+        username = self.username_entry.get().strip()
+        if not valid_username(username):
+            Dialog.show(self, "Invalid username", "Set a valid username before searching for a crash.", "warning")
+            return
+        profile = self.current_profile()
+        mods = [mod.path for mod in self.profile_store.list_mods(profile.id) if mod.enabled]
+        if not mods:
+            Dialog.show(self, "No mods", "This profile has no enabled mods.", "warning")
+            return
+        should_start = Dialog.confirm(
+            self,
+            "Find crashing mod",
+            f"Minecraft will be started several times with different halves of {len(mods)} mods "
+            "and closed as soon as it loads. This can take a while.",
+        )
+        if not should_start:
+            return
+
+        self.bisecting = True
+        self.set_busy(True, f"Searching for crashing mod in {profile.name}...")
+        self.tasks.submit(
+            lambda: self._bisect_worker(username, profile, mods),
+            priority=TaskPriority.LAUNCH,
+        )
+
+    def _bisect_worker(self, username: str, profile: Profile, mods: list[Path]) -> None:
+        game_dir = self.supervisor.reserve_game_dir(self.paths.minecraft, self.paths.instances)
+
+        def crashes(subset: set[Path]) -> bool:
+            if self.closing:
+                raise BisectCancelled()
+            timeline = LaunchTimeline(profile.id, profile.name, profile.version)
+            timeline.details["bisect"] = len(subset)
+            try:
+                prepared = self.game_launcher.prepare(
+                    profile.id,
+                    username,
+                    timeline,
+                    only_mods=subset,
+                    game_dir=game_dir,
+                )
+                session = self.game_launcher.start(prepared, timeline)
+            except Exception as error:
+                self.game_launcher.abort(timeline, error, game_dir)
+                raise
+            self.supervisor.add(session)
+            if self.closing:
+                self.game_launcher.stop(session)
+            ready = self.game_launcher.wait_until_ready(session, BISECT_READY_TIMEOUT) is not None
+            # Stopped from outside (the launcher is closing): not a verdict, abort the whole search.
+            cancelled = session.stopped or self.closing
+            if session.process.poll() is None:
+                self.game_launcher.stop(session)
+            crash = self.game_launcher.finish(session)
+            if cancelled:
+                raise BisectCancelled()
+            return not ready or crash.crashed
+
+        def on_step(step: BisectStep) -> None:
+            text = f"Bisect launch {step.number}: {len(step.tested)} mods, {step.remaining} suspects left"
+            self.after(0, lambda: self.set_busy(True, text))
+
+        try:
+            graph = DependencyGraph(self.mod_index.for_paths(mods))
+            result = ModBisector(mods, graph, crashes).run(on_step)
+            self.after(0, lambda: self.set_busy(False, result.message))
+            self.after(0, lambda: Dialog.show(self, "Find crashing mod", result.message, "info"))
+        except BisectCancelled:
+            print("[BISECT] Cancelled because the launcher is closing")
+        except Exception as error:
+            traceback.print_exc()
+            self.after(0, lambda: self.set_busy(False, ""))
+            self.after(0, lambda: Dialog.show(self, "Find crashing mod failed", str(error), "error"))
+        finally:
+            self.bisecting = False
+            self.supervisor.release_game_dir(game_dir)
+            if not self.closing:
+                self.after(0, self.refresh_launch_history)
+
+    def show_crash_report(self, crash: CrashReport) -> None:
+        lines = [f"Exit code: {crash.exit_code}"]
+        if crash.exception:
+            lines.append(f"Error: {crash.exception}")
+        for suspect in crash.suspects[:3]:
+            lines.append(f"{suspect.name} ({suspect.jar}): {', '.join(suspect.reasons)}")
+        if not crash.suspects:
+            lines.append("No mod could be linked to this crash.")
+        Dialog.show(self, "Minecraft crashed", "\n".join(lines), "error")
 
     def is_minecraft_running(self) -> bool:
-        return self.minecraft_proc is not None and self.minecraft_proc.poll() is None
+        return bool(self.supervisor.running())
 
     def on_close(self) -> None:
+        self.config.flush()
         if not self.is_minecraft_running():
+            self.closing = True
+            self.shutdown_tasks()
             self.destroy()
             return
 
+        running = len(self.supervisor.running())
+        games = "Minecraft" if running == 1 else f"all {running} Minecraft instances"
         should_close = Dialog.confirm(
             self,
             "Minecraft is running",
-            "Closing the launcher will also close Minecraft and restore your original mods.",
+            f"Closing the launcher will also close {games} and restore your original mods.",
         )
         if not should_close:
             return
 
+        self.closing = True
         try:
-            if self.minecraft_proc:
-                self.minecraft_proc.terminate()
-                self.minecraft_proc.wait(timeout=10)
-        except subprocess.TimeoutExpired:
-            if self.minecraft_proc:
-                self.minecraft_proc.kill()
+            self.supervisor.stop_all()
         finally:
-            self.profile_store.restore_mods(self.paths.minecraft)
+            self.profile_store.restore_mods()
+            self.shutdown_tasks()
             self.destroy()
 
+    def shutdown_tasks(self) -> None:
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+        self.supervisor.shutdown()
+        self.game_launcher.resource_monitor.stop()
+        self.tasks.shutdown()
+        self.dispatcher.stop()
+
 
 def main() -> None:
+    STARTUP.mark("imports")
     app = LauncherApp()
     app.mainloop()
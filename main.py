@@ -1,3 +1,4 @@
+import launcher.startup  # noqa: F401
 from launcher.ui import main
 
 
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from launcher.crash_analysis import EXPLICIT_WEIGHT, CrashAnalyzer
+from launcher.mod_metadata import ModMetadata
+
+
+LOG = """\
+[12:00:01] [main/INFO]: Loading Minecraft 1.20.1 with Fabric Loader 0.15.11
+[12:00:02] [main/WARN]: Reference map 'lithium-refmap.json' for lithium.mixins.json could not be read. If this is a \
+development environment you can ignore this message
+[12:00:02] [main/WARN]: Reference map 'lithium-refmap.json' for lithium.mixins.json could not be read. If this is a \
+development environment you can ignore this message
+[12:00:02] [main/WARN]: Reference map 'lithium-refmap.json' for lithium.mixins.json could not be read. If this is a \
+development environment you can ignore this message
+[12:00:05] [main/ERROR]: Minecraft has crashed!
+org.spongepowered.asm.mixin.injection.throwables.InvalidInjectionException: Critical injection failure: @Inject \
+annotation on onTick could not find any targets matching 'tick' in net.minecraft.class_310. Using refmap \
+badmod-refmap.json [PREINJECT Applicator Phase -> badmod.mixins.json:MinecraftClientMixin from mod badmod -> \
+Prepare Injections -> handler$zzb000$onTick(Lorg/spongepowered/asm/mixin/injection/callback/CallbackInfo;)V]
+\tat org.spongepowered.asm.mixin.injection.struct.InjectionInfo.validateTargets(InjectionInfo.java:656)
+\tat org.spongepowered.asm.mixin.injection.struct.InjectionInfo.findTargets(InjectionInfo.java:587)
+\tat net.minecraft.class_310.<init>(class_310.java:458)
+\tat net.minecraft.client.main.Main.main(Main.java:223)
+"""
+
+MODS = [
+    ModMetadata(
+        path="mods/lithium-fabric-0.11.2.jar",
+        mod_id="lithium",
+        name="Lithium",
+        mixins=("lithium.mixins.json",),
+        packages=("me.jellysquid.mods.lithium",),
+    ),
+    ModMetadata(
+        path="mods/badmod-1.0.jar",
+        mod_id="badmod",
+        name="Bad Mod",
+        mixins=("badmod.mixins.json",),
+        packages=("com.example.badmod.mixin",),
+    ),
+]
+
+
+def test_explicit_attribution_beats_benign_mixin_warnings() -> None:
+    analyzer = CrashAnalyzer()
+    analyzer.feed_lines(LOG.splitlines())
+
+    report = analyzer.report(1, MODS)
+
+    assert analyzer.mod_ids == {"badmod": EXPLICIT_WEIGHT}
+    assert "lithium.mixins.json" not in analyzer.configs
+    assert report.exception == "org.spongepowered.asm.mixin.injection.throwables.InvalidInjectionException"
+    assert [suspect.mod_id for suspect in report.suspects] == ["badmod"]
+    assert "invalid mixin injection" in report.suspects[0].reasons
+
+
+def test_mixin_configs_named_by_errors_still_count() -> None:
+    analyzer = CrashAnalyzer()
+    analyzer.feed("[12:00:03] [main/ERROR]: Mixin apply failed lithium.mixins.json -> net.minecraft.class_1937")
+
+    report = analyzer.report(1, MODS)
+
+    assert [(suspect.mod_id, suspect.reasons) for suspect in report.suspects] == [
+        ("lithium", ("mixin config lithium.mixins.json",))
+    ]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from launcher.log_archive import LogArchive
+
+
+def write_log(logs_dir: Path, name: str, lines: list[str]) -> Path:
+    path = logs_dir / name
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    return path
+
+
+def test_partial_tokens_find_indexed_lines(tmp_path: Path) -> None:
+    archive = LogArchive(tmp_path)
+    archive.add(write_log(tmp_path, "2024-01-01-1.log", ["[main/ERROR] java.lang.NullPointerException: boom"]))
+
+    assert [hit.line_number for hit in archive.search("NullPointer")] == [1]
+    assert [hit.line_number for hit in archive.search("ointerExcep")] == [1]
+    assert archive.search("IllegalState") == []
+
+
+def test_errors_after_a_long_trace_are_still_found(tmp_path: Path) -> None:
+    archive = LogArchive(tmp_path)
+    frames = [f"\tat com.example.pkg{index}.Class{index}.method{index}(Class{index}.java:1)" for index in range(2000)]
+    lines = ["[main/ERROR] java.lang.NullPointerException: boom", *frames, "[main/ERROR] late IllegalStateException"]
+    archive.add(write_log(tmp_path, "2024-01-01-1.log", lines))
+
+    assert [hit.line_number for hit in archive.search("IllegalStateException")] == [len(lines)]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from launcher.mod_catalog import FULL_RESYNC_INTERVAL, SYNC_INTERVAL, SYNC_PAGE_SIZE, ModCatalog
+
+
+GAME_VERSION = "1.20.1"
+START = 1_700_000_000.0
+
+
+class StandInApi:
+    def __init__(self, count: int) -> None:
+        self.projects = {
+            f"p{index:04d}": self.hit(index, f"2024-01-01T00:{index // 60:02d}:{index % 60:02d}Z")
+            for index in range(count)
+        }
+        self.offsets: list[int] = []
+
+    @staticmethod
+    def hit(index: int, modified: str, title: str = "") -> dict:
+        return {
+            "project_id": f"p{index:04d}",
+            "slug": f"mod-{index}",
+            "title": title or f"Mod {index}",
+            "description": f"Test project number {index}",
+            "icon_url": None,
+            "downloads": index,
+            "date_modified": modified,
+        }
+
+    def page(self, offset: int, limit: int) -> dict:
+        self.offsets.append(offset)
+        hits = sorted(self.projects.values(), key=lambda hit: hit["date_modified"], reverse=True)
+        return {"hits": hits[offset : offset + limit], "offset": offset, "limit": limit, "total_hits": len(hits)}
+
+
+@pytest.fixture
+def api() -> Iterator[tuple[StandInApi, str]]:
+    stand_in = StandInApi(250)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+            body = json.dumps(stand_in.page(int(query["offset"][0]), int(query["limit"][0]))).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stand_in, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def make_catalog(tmp_path: Path, api_base: str) -> ModCatalog:
+    return ModCatalog(tmp_path / "catalog.sqlite3", api_base=api_base, request_delay=0)
+
+
+def test_full_sync_indexes_every_project(tmp_path: Path, api: tuple[StandInApi, str]) -> None:
+    stand_in, api_base = api
+    catalog = make_catalog(tmp_path, api_base)
+
+    result = catalog.sync(GAME_VERSION, now=START)
+
+    assert result.full and result.complete
+    assert result.projects == 250
+    assert stand_in.offsets == [0, SYNC_PAGE_SIZE, 2 * SYNC_PAGE_SIZE]
+    assert catalog.has_version(GAME_VERSION)
+    assert not catalog.needs_sync(GAME_VERSION, now=START + 1)
+    assert catalog.search("", GAME_VERSION, page_size=5).total_hits == 250
+    assert [project.slug for project in catalog.search("mod 42", GAME_VERSION).projects][:1] == ["mod-42"]
+
+
+def test_interrupted_sync_resumes_from_saved_offset(tmp_path: Path, api: tuple[StandInApi, str]) -> None:
+    stand_in, api_base = api
+    catalog = make_catalog(tmp_path, api_base)
+
+    first = catalog.sync(GAME_VERSION, should_stop=lambda: len(stand_in.offsets) >= 1, now=START)
+    assert not first.complete
+    assert first.projects == SYNC_PAGE_SIZE
+    assert catalog.needs_sync(GAME_VERSION, now=START + 1)
+
+    stand_in.offsets.clear()
+    second = catalog.sync(GAME_VERSION, now=START + 60)
+    assert second.full and second.complete
+    assert stand_in.offsets == [SYNC_PAGE_SIZE, 2 * SYNC_PAGE_SIZE]
+    assert catalog.search("", GAME_VERSION).total_hits == 250
+
+
+def test_incremental_sync_only_fetches_changed_projects(tmp_path: Path, api: tuple[StandInApi, str]) -> None:
+    stand_in, api_base = api
+    catalog = make_catalog(tmp_path, api_base)
+    catalog.sync(GAME_VERSION, now=START)
+
+    stand_in.projects["p0007"] = StandInApi.hit(7, "2024-02-01T00:00:00Z", title="Renamed Sodium")
+    stand_in.projects["p0900"] = StandInApi.hit(900, "2024-02-02T00:00:00Z", title="Brand New Mod")
+    stand_in.offsets.clear()
+    result = catalog.sync(GAME_VERSION, now=START + SYNC_INTERVAL)
+
+    assert not result.full and result.complete
+    assert stand_in.offsets == [0]
+    assert result.projects >= 2
+    assert [project.project_id for project in catalog.search("renamed", GAME_VERSION).projects] == ["p0007"]
+    assert [project.project_id for project in catalog.search("brand new", GAME_VERSION).projects] == ["p0900"]
+    assert catalog.search("", GAME_VERSION).total_hits == 251
+
+
+def test_full_resync_drops_projects_that_disappeared(tmp_path: Path, api: tuple[StandInApi, str]) -> None:
+    stand_in, api_base = api
+    catalog = make_catalog(tmp_path, api_base)
+    catalog.sync(GAME_VERSION, now=START)
+
+    del stand_in.projects["p0042"]
+    result = catalog.sync(GAME_VERSION, now=START + FULL_RESYNC_INTERVAL)
+
+    assert result.full and result.complete
+    assert catalog.search("", GAME_VERSION).total_hits == 249
+    remaining = catalog.search("", GAME_VERSION, page_size=300).projects
+    assert "p0042" not in {project.project_id for project in remaining}